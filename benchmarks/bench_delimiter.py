@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark delimiter detection.
+
+Builds the first lines of an export whose rows carry a long free-text
+answer (with commas, quotes and line breaks, the way MS Forms writes them)
+and compares the previous ``detect_delimiter`` (``csv.Sniffer`` with a
+first-line fallback) with the byte-counting ``sniff_delimiter``.
+
+Usage:
+    python benchmarks/bench_delimiter.py [--text-length N] [--runs N] [--tsv]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import process_extensions  # noqa: E402
+
+WORDS = ["please", "extend", "the", "lab,", "I was", "sick", '"really"', "sorry.\n"]
+
+
+def make_sample(text_length: int, delimiter: str, seed: int = 0) -> List[str]:
+    """Return the first DELIMITER_SAMPLE_SIZE lines of an export.
+
+    These are the lines ``detect_delimiter`` is given while reading the
+    header; quoted answers that span lines may be cut off.
+    """
+    rng = random.Random(seed)
+    out = io.StringIO()
+    writer = csv.writer(out, delimiter=delimiter, lineterminator="\n")
+    writer.writerow([
+        "Email",
+        "Name",
+        "Which assignment due date do you want to change?",
+        "What would you like to new date to be change too?",
+        "Why do you need an extension?",
+    ])
+    for row in range(process_extensions.DELIMITER_SAMPLE_SIZE):
+        text = ""
+        while len(text) < text_length:
+            text += rng.choice(WORDS) + " "
+        writer.writerow([f"s{row}@example.com", f"Student {row}", "HW1", "01/30/2024", text])
+    return out.getvalue().split("\n")[: process_extensions.DELIMITER_SAMPLE_SIZE]
+
+
+def sniffer(lines: List[str]) -> str:
+    """The previous detect_delimiter: csv.Sniffer, then a first-line count."""
+    sample = "\n".join(lines)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",\t").delimiter
+    except csv.Error:
+        return "," if lines[0].count(",") >= lines[0].count("\t") else "\t"
+
+
+def milliseconds(detect: Callable[[Any], Any], sample: Any, runs: int) -> float:
+    """Return the mean time of ``detect(sample)`` in milliseconds."""
+    started = time.perf_counter()
+    for _ in range(runs):
+        detect(sample)
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--text-length", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--tsv", action="store_true", help="Tab-delimited instead of CSV.")
+    args = parser.parse_args(argv)
+
+    expected = "\t" if args.tsv else ","
+    lines = make_sample(args.text_length, expected)
+    prefix = "".join(line + "\n" for line in lines).encode("utf-8")
+    delimiter, confidence = process_extensions.sniff_delimiter(prefix)
+
+    baseline = milliseconds(sniffer, lines, args.runs)
+    sniffed = milliseconds(process_extensions.sniff_delimiter, prefix, args.runs)
+    detected = milliseconds(process_extensions.detect_delimiter, lines, args.runs)
+
+    print(f"sample: {len(prefix):,} bytes  free text: {args.text_length:,} chars/row")
+    print(f"csv.Sniffer (before):       {baseline:>10.3f} ms")
+    print(f"sniff_delimiter (bytes):    {sniffed:>10.3f} ms")
+    print(f"detect_delimiter (after):   {detected:>10.3f} ms")
+    print(f"speedup: {baseline / detected:.1f}x")
+    print(f"detected {delimiter!r} with confidence {confidence:.2f}")
+    return 0 if delimiter == expected else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
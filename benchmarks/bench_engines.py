@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark the pure-Python and NumPy engines.
+
+Generates a synthetic export, parses it once, then times
+``deduplicate_records`` and ``adjust_dates`` with ``engine="python"`` and
+``engine="numpy"`` on both a list of records and a RecordBatch. ``--engine
+auto`` should only pick NumPy once this shows it winning.
+
+Usage:
+    python benchmarks/bench_engines.py [--rows N] [--repeat N] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.dirname(os.path.abspath(__file__))):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import process_extensions as pe  # noqa: E402
+from export_generator import add_spec_arguments, spec_from_args, write_export  # noqa: E402
+
+
+def best_of(repeat: int, stage: Callable[[], Any]) -> float:
+    """Return the fastest of ``repeat`` wall-clock timings of ``stage()``."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        stage()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_spec_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.set_defaults(rows=300_000)
+    args = parser.parse_args(argv)
+
+    if importlib.util.find_spec("numpy") is None:
+        print("NumPy is not installed; nothing to compare.", file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "export.csv")
+        write_export(path, spec_from_args(args))
+        records = pe.process_extension_file(path)[0]
+    inputs = {"list": records, "batch": pe.RecordBatch.from_records(records)}
+
+    print(f"records: {len(records):,}  best of {args.repeat}")
+    print(f"{'stage':<16} {'python':>10} {'numpy':>10} {'numpy/python':>13}")
+    for kind, data in inputs.items():
+        deduped = pe.deduplicate_records(data, engine="python")
+        stages = {
+            f"dedupe {kind}": lambda engine: pe.deduplicate_records(data, engine=engine),
+            f"adjust {kind}": lambda engine: pe.adjust_dates(deduped, engine=engine),
+        }
+        for name, stage in stages.items():
+            python = best_of(args.repeat, lambda: stage("python"))
+            vectorized = best_of(args.repeat, lambda: stage("numpy"))
+            print(f"{name:<16} {python:>9.3f}s {vectorized:>9.3f}s {vectorized / python:>12.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
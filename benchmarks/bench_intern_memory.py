@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark the memory saved by interning email, name and assignment strings.
+
+Generates a synthetic export, then parses it with ``process_extension_file``
+twice: once as shipped, and once with a symbol table that never shares
+strings (the behaviour before interning). Reports the memory retained by the
+parsed records and table data, and the parse time without tracing.
+
+Usage:
+    python benchmarks/bench_intern_memory.py [--rows N] [--assignments N] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import process_extensions as pe  # noqa: E402
+from export_generator import add_spec_arguments, spec_from_args, write_export  # noqa: E402
+
+
+class NoInterning(dict):
+    """Symbol table that hands every value back unshared."""
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        return default
+
+
+def without_interning(parse: Callable[[], Any]) -> Callable[[], Any]:
+    """Run ``parse`` with interning disabled in the row parser."""
+    iter_rows = pe._iter_rows
+
+    def run() -> Any:
+        def unshared(*args: Any, **kwargs: Any) -> Any:
+            kwargs["symbols"] = NoInterning()
+            return iter_rows(*args, **kwargs)
+
+        with mock.patch.object(pe, "_iter_rows", unshared):
+            return parse()
+
+    return run
+
+
+def retained_bytes(parse: Callable[[], Any]) -> int:
+    """Return the traced bytes still held by the result of ``parse()``."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = parse()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def seconds(parse: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    parse()
+    return time.perf_counter() - started
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_spec_arguments(parser)
+    parser.set_defaults(rows=1_000_000)
+    args = parser.parse_args(argv)
+    spec = spec_from_args(args)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        export = os.path.join(workdir, "export.csv")
+        write_export(export, spec)
+
+        def interned() -> Tuple[Any, ...]:
+            return pe.process_extension_file(export)
+
+        unshared = without_interning(interned)
+
+        results = {}
+        for label, parse in (("before", unshared), ("after", interned)):
+            results[label] = (retained_bytes(parse), seconds(parse))
+
+    mib = 1 << 20
+    before_bytes, before_seconds = results["before"]
+    after_bytes, after_seconds = results["after"]
+    print(f"rows: {spec.rows:,}  assignments: {spec.assignments}")
+    print(
+        f"no interning (before): {before_bytes / mib:>9.1f} MiB retained"
+        f"  {before_seconds:>6.2f} s parse"
+    )
+    print(
+        f"interned (after):      {after_bytes / mib:>9.1f} MiB retained"
+        f"  {after_seconds:>6.2f} s parse"
+    )
+    print(f"saving: {100 * (1 - after_bytes / before_bytes):.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark date parsing throughput.
+
+Compares the original ``datetime.strptime`` parser with the fast-path,
+memoized ``parse_date`` on a column of dates that repeat the way they do in
+real MS Forms exports.
+
+Usage:
+    python benchmarks/bench_parse_date.py [--rows N] [--distinct N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import process_extensions  # noqa: E402
+
+
+def make_dates(rows: int, distinct: int, seed: int = 0) -> List[str]:
+    """Build ``rows`` date strings drawn from ``distinct`` calendar days."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 8)
+    pool = [
+        (start + timedelta(days=offset)).strftime("%m/%d/%Y")
+        for offset in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(rows)]
+
+
+def rows_per_second(parse: Callable[[str], Optional[datetime]], dates: List[str]) -> float:
+    """Return how many dates ``parse`` handles per second."""
+    started = time.perf_counter()
+    for value in dates:
+        parse(value)
+    elapsed = time.perf_counter() - started
+    return len(dates) / elapsed if elapsed else float("inf")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--distinct", type=int, default=60)
+    args = parser.parse_args(argv)
+
+    dates = make_dates(args.rows, args.distinct)
+
+    baseline = rows_per_second(process_extensions._parse_date_strptime, dates)
+
+    process_extensions.parse_date.cache_clear()
+    fast = rows_per_second(process_extensions.parse_date, dates)
+
+    process_extensions.parse_date.cache_clear()
+    uncached = rows_per_second(process_extensions.parse_date.__wrapped__, dates)
+
+    print(f"rows: {args.rows:,}  distinct dates: {args.distinct}")
+    print(f"strptime (before):         {baseline:>14,.0f} rows/sec")
+    print(f"fast path, no cache:       {uncached:>14,.0f} rows/sec")
+    print(f"fast path + cache (after): {fast:>14,.0f} rows/sec")
+    print(f"speedup: {fast / baseline:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
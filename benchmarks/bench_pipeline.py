@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Benchmark each pipeline stage and the end-to-end CLI.
+
+Generates a synthetic export (see export_generator.py), then times parsing,
+deduplication, date adjustment, the output writers, and a full ``main``
+run. Results are printed as JSON so runs can be saved and compared across
+commits.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--rows N] [--repeat N] [--output FILE]
+    python benchmarks/bench_pipeline.py --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.dirname(os.path.abspath(__file__))):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import process_extensions as pe  # noqa: E402
+from export_generator import ExportSpec, add_spec_arguments, spec_from_args, write_export  # noqa: E402
+
+
+def best_of(repeat: int, stage: Callable[[], Any]) -> float:
+    """Return the fastest of ``repeat`` wall-clock timings of ``stage()``."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        stage()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def git_revision() -> Optional[str]:
+    """Return the current commit hash, if the tree is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def fused_pass(path: str) -> "pe.FusedResult":
+    """Run the single-pass engine over ``path``."""
+    with pe.MappedLines(path) as source:
+        return pe.process_extensions_fused(line for line in source if line.strip())
+
+
+def run_benchmarks(spec: ExportSpec, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time every stage on an export described by ``spec``."""
+    export = os.path.join(workdir, "export.csv")
+    write_export(export, spec)
+    output_dir = os.path.join(workdir, "output")
+
+    records, errors, table = pe.process_extension_file(export)
+    deduped = pe.deduplicate_records(records)
+    adjusted = pe.adjust_dates(deduped)
+    file_info, _ = pe.create_output_files(adjusted, output_dir, table.all_assignments)
+    processed = {record.row_num for record in adjusted}
+
+    stages: Dict[str, Callable[[], Any]] = {
+        "parse": lambda: pe.process_extension_file(export),
+        "dedupe": lambda: pe.deduplicate_records(records),
+        "adjust": lambda: pe.adjust_dates(deduped),
+        "write_outputs": lambda: pe.create_output_files(
+            adjusted, output_dir, table.all_assignments, skip_unchanged=False
+        ),
+        "processed_copy": lambda: pe.write_processed_copy(export, table, processed),
+        "failures": lambda: pe.write_failure_report(errors, output_dir),
+        "summary": lambda: pe.generate_summary(adjusted, file_info, errors, output_dir),
+        "end_to_end": lambda: pe.main(
+            ["--input-file", export, "--output-dir", output_dir, "--quiet"]
+        ),
+        # parse + dedupe + adjust in one pass, comparable to their sum above
+        "fused": lambda: fused_pass(export),
+        "end_to_end_fused": lambda: pe.main(
+            ["--input-file", export, "--output-dir", output_dir, "--quiet",
+             "--engine", "fused"]
+        ),
+    }
+    results: Dict[str, Any] = {}
+    for name, stage in stages.items():
+        seconds = best_of(repeat, stage)
+        results[name] = {
+            "seconds": round(seconds, 6),
+            "rows_per_sec": round(spec.rows / seconds) if seconds else None,
+        }
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "spec": spec.__dict__,
+            "records": len(records),
+            "deduplicated": len(deduped),
+            "errors": len(errors),
+        },
+        "results": results,
+    }
+
+
+def compare(before: Dict[str, Any], after: Dict[str, Any]) -> str:
+    """Render a per-stage speedup table of ``after`` relative to ``before``."""
+    lines = [f"{'stage':<16}{'before (s)':>12}{'after (s)':>12}{'speedup':>10}"]
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if not old:
+            continue
+        speedup = old["seconds"] / result["seconds"] if result["seconds"] else float("inf")
+        lines.append(
+            f"{name:<16}{old['seconds']:>12.4f}{result['seconds']:>12.4f}{speedup:>9.2f}x"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_spec_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Also write the JSON results to this file.")
+    parser.add_argument("--compare", metavar="JSON", help="Earlier results to compare against.")
+    args = parser.parse_args(argv)
+
+    # Keep generate_summary/main from printing while being timed
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix="extensions_bench_") as workdir:
+        report = run_benchmarks(spec_from_args(args), args.repeat, workdir)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare(json.load(f), report), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark the memory cost of holding extension records.
+
+Measures bytes per record (via tracemalloc) for the original dict-backed
+dataclass, the slotted ExtensionRecord, and a columnar RecordBatch, after
+dates have been adjusted (so each record carries all three dates).
+
+Usage:
+    python benchmarks/bench_record_memory.py [--rows N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import process_extensions  # noqa: E402
+from process_extensions import ExtensionRecord, RecordBatch  # noqa: E402
+
+
+@dataclass
+class DataclassRecord:
+    """The pre-__slots__ ExtensionRecord layout, kept for comparison."""
+
+    email: str
+    name: str
+    assignment: str
+    requested_date: datetime
+    row_num: int
+    original_date: Optional[datetime] = None
+    due_date: Optional[datetime] = None
+
+
+def make_rows(rows: int, seed: int = 0) -> List[tuple]:
+    """Build raw (email, name, assignment, date) tuples like a parsed export."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 8)
+    result = []
+    for row in range(rows):
+        student = rng.randrange(rows // 4 + 1)
+        # Fresh string objects per row, as csv.reader produces them
+        result.append(
+            (
+                "".join(["s", str(student), "@example.com"]),
+                "".join(["Student ", str(student)]),
+                "".join(["Week ", str(rng.randrange(12)), " Lab Report"]),
+                start + timedelta(days=rng.randrange(90)),
+            )
+        )
+    return result
+
+
+def bytes_per_record(build: Callable[[], Any], rows: int) -> float:
+    """Return traced bytes retained by ``build()`` divided by ``rows``."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    raw = make_rows(args.rows)
+    sunday = process_extensions.get_next_sunday
+
+    def build_dataclass() -> List[DataclassRecord]:
+        return [
+            DataclassRecord(e, n, a, d, i, d, sunday(d))
+            for i, (e, n, a, d) in enumerate(raw)
+        ]
+
+    def build_slotted() -> List[ExtensionRecord]:
+        return [
+            ExtensionRecord(e, n, a, d, i, d, sunday(d))
+            for i, (e, n, a, d) in enumerate(raw)
+        ]
+
+    def build_batch() -> RecordBatch:
+        return RecordBatch.from_records(
+            ExtensionRecord(e, n, a, d, i, d, sunday(d))
+            for i, (e, n, a, d) in enumerate(raw)
+        )
+
+    # Strings and requested dates already exist in ``raw``; only the
+    # additional memory each layout needs is measured.
+    results = [
+        ("dataclass (before)", bytes_per_record(build_dataclass, args.rows)),
+        ("__slots__ record", bytes_per_record(build_slotted, args.rows)),
+        ("RecordBatch", bytes_per_record(build_batch, args.rows)),
+    ]
+
+    baseline = results[0][1]
+    print(f"rows: {args.rows:,}")
+    for label, per_record in results:
+        saving = 100 * (1 - per_record / baseline)
+        print(f"{label:<20} {per_record:>8.1f} bytes/record  ({saving:5.1f}% saved)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
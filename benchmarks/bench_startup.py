@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark CLI startup cost.
+
+Runs ``python -X importtime -c "import process_extensions"`` in fresh
+interpreters and reports the median cumulative import time of the module,
+the slowest modules it pulls in, and the wall time of a ``--help`` run.
+The script exits non-zero when the median import time exceeds ``--max-ms``
+(default: DEFAULT_MAX_MS) or a module listed in DEFERRED_MODULES is loaded,
+so it can guard startup in CI. The module is byte-compiled first, so the
+numbers do not include compiling the source (which every run pays when
+PYTHONDONTWRITEBYTECODE is set).
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--top N] [--max-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import py_compile
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "process_extensions.py")
+
+# Modules the CLI should only import when a code path needs them
+DEFERRED_MODULES = (
+    "argparse",
+    "csv",
+    "json",
+    "sqlite3",
+    "mmap",
+    "pickle",
+    "hashlib",
+    "tempfile",
+    "zlib",
+    "heapq",
+    "glob",
+    "tracemalloc",
+    "concurrent.futures",
+    "pathlib",
+    "typing",
+    "asyncio",
+    "http.server",
+    "multiprocessing",
+    "numpy",
+)
+
+# Default --max-ms: the import time of the module before lazy imports was
+# about 63 ms (warm bytecode cache) on the reference machine
+DEFAULT_MAX_MS = 75.0
+
+
+def import_times() -> Tuple[Dict[str, int], List[str]]:
+    """Import the module in a fresh interpreter.
+
+    Returns:
+        Cumulative import time in microseconds per module, and the deferred
+        modules that were loaded anyway.
+    """
+    check = (
+        "import sys, process_extensions; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return times, loaded
+
+
+def help_seconds() -> float:
+    """Return the wall time of ``process_extensions.py --help``."""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, SCRIPT, "--help"],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - started
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=DEFAULT_MAX_MS)
+    args = parser.parse_args(argv)
+    py_compile.compile(SCRIPT, doraise=True)
+
+    samples: List[int] = []
+    last: Dict[str, int] = {}
+    loaded: List[str] = []
+    for _ in range(args.runs):
+        last, loaded = import_times()
+        samples.append(last["process_extensions"])
+    median_ms = statistics.median(samples) / 1000
+    help_ms = statistics.median(help_seconds() for _ in range(args.runs)) * 1000
+
+    print(f"runs: {args.runs}")
+    print(f"import process_extensions: {median_ms:>8.1f} ms (median cumulative)")
+    print(f"process_extensions --help: {help_ms:>8.1f} ms (median wall)")
+    print("\nslowest imports (last run, cumulative):")
+    ranked = sorted(
+        ((us, name) for name, us in last.items() if name != "process_extensions"),
+        reverse=True,
+    )
+    for us, name in ranked[: args.top]:
+        print(f"  {us / 1000:>8.1f} ms  {name}")
+
+    status = 0
+    if loaded:
+        print(f"\nFAIL: deferred modules loaded at import: {', '.join(loaded)}")
+        status = 1
+    if median_ms > args.max_ms:
+        print(f"\nFAIL: import took {median_ms:.1f} ms (budget {args.max_ms:.1f} ms)")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
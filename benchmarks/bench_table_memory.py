@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark the memory retained by TableData for processed copies.
+
+Compares the original list-of-dicts layout (``{"row_num": n, "fields":
+fields[:]}``) with the column-oriented TableRows store, counting only the
+container overhead (the field strings are shared by both layouts).
+
+Usage:
+    python benchmarks/bench_table_memory.py [--rows N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from process_extensions import TableRows  # noqa: E402
+
+
+def make_rows(rows: int) -> List[List[str]]:
+    """Build parsed rows shaped like an MS Forms export with a DONE? column."""
+    return [
+        [
+            f"s{row}@example.com",
+            f"Student {row}",
+            f"Week {row % 12} Lab Report",
+            "01/30/2024",
+            "",
+        ]
+        for row in range(rows)
+    ]
+
+
+def bytes_per_row(build: Callable[[], Any], rows: int) -> float:
+    """Return traced bytes retained by ``build()`` divided by ``rows``."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    parsed = make_rows(args.rows)
+
+    def build_dicts() -> List[dict]:
+        return [
+            {"row_num": row_num, "fields": fields[:]}
+            for row_num, fields in enumerate(parsed, start=2)
+        ]
+
+    def build_columns() -> TableRows:
+        table = TableRows()
+        for row_num, fields in enumerate(parsed, start=2):
+            table.add(row_num, fields)
+        return table
+
+    before = bytes_per_row(build_dicts, args.rows)
+    after = bytes_per_row(build_columns, args.rows)
+
+    print(f"rows: {args.rows:,}")
+    print(f"list of dicts (before): {before:>8.1f} bytes/row")
+    print(f"TableRows (after):      {after:>8.1f} bytes/row")
+    print(f"saving: {100 * (1 - after / before):.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
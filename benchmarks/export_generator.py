@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Generate synthetic MS Forms extension-request exports.
+
+The generated files mimic real exports: the Forms bookkeeping columns
+(``ID``, ``Start time``, ``Completion time``), a free-text reason column
+that sometimes needs quoting, resubmissions of the same request, rows with
+unparseable dates, and rows already marked in the ``DONE?`` column.
+
+Usage:
+    python benchmarks/export_generator.py OUTPUT [--rows N] [--tsv] [--bom] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+HEADER = [
+    "ID",
+    "Start time",
+    "Completion time",
+    "Email",
+    "Name",
+    "Which assignment due date do you want to change?",
+    "What would you like to new date to be change too?",
+    "Reason",
+    "DONE?",
+]
+
+REASONS = [
+    "Illness",
+    "Family emergency",
+    "Overlapping deadlines, two midterms",
+    'Was told "it\'s fine" in class',
+    "Internet outage at home",
+    "Varsity travel (see attached letter)",
+]
+
+INVALID_DATES = ["13/45/2024", "next friday", "2024-02-30", "02/30/2024"]
+
+
+@dataclass
+class ExportSpec:
+    """Shape of a synthetic export."""
+
+    rows: int = 10_000
+    assignments: int = 12
+    students: Optional[int] = None
+    duplicate_ratio: float = 0.1
+    invalid_date_ratio: float = 0.02
+    done_ratio: float = 0.2
+    tsv: bool = False
+    bom: bool = False
+    seed: int = 0
+
+
+def generate_rows(spec: ExportSpec) -> Iterator[List[str]]:
+    """Yield the data rows of an export described by ``spec``."""
+    rng = random.Random(spec.seed)
+    students = spec.students or max(1, spec.rows // 3)
+    assignments = [
+        f"Week {week + 1} Lab Report – Section {'ABC'[week % 3]}"
+        for week in range(spec.assignments)
+    ]
+    term_start = datetime(2024, 1, 8, 9, 0)
+    submitted: List[List[str]] = []
+
+    for row_id in range(1, spec.rows + 1):
+        started = term_start + timedelta(minutes=17 * row_id)
+        if submitted and rng.random() < spec.duplicate_ratio:
+            # Resubmission of an earlier request, usually asking for more time
+            email, name, assignment = rng.choice(submitted)
+        else:
+            student = rng.randrange(students)
+            email = f"{student:06d}@example.edu"
+            name = f"Student {student}"
+            assignment = rng.choice(assignments)
+            submitted.append([email, name, assignment])
+
+        if rng.random() < spec.invalid_date_ratio:
+            requested = rng.choice(INVALID_DATES)
+        else:
+            requested = (started + timedelta(days=rng.randrange(1, 21))).strftime("%m/%d/%Y")
+
+        yield [
+            str(row_id),
+            started.strftime("%m/%d/%Y %H:%M:%S"),
+            (started + timedelta(minutes=3)).strftime("%m/%d/%Y %H:%M:%S"),
+            email,
+            name,
+            assignment,
+            requested,
+            rng.choice(REASONS),
+            "*" if rng.random() < spec.done_ratio else "",
+        ]
+
+
+def write_export(path: str, spec: ExportSpec) -> None:
+    """Write an export described by ``spec`` to ``path``."""
+    encoding = "utf-8-sig" if spec.bom else "utf-8"
+    with open(path, "w", newline="", encoding=encoding) as f:
+        writer = csv.writer(f, delimiter="\t" if spec.tsv else ",", lineterminator="\n")
+        writer.writerow(HEADER)
+        writer.writerows(generate_rows(spec))
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ExportSpec options to ``parser``."""
+    defaults = ExportSpec()
+    parser.add_argument("--rows", type=int, default=defaults.rows)
+    parser.add_argument("--assignments", type=int, default=defaults.assignments)
+    parser.add_argument("--students", type=int, default=defaults.students)
+    parser.add_argument("--duplicate-ratio", type=float, default=defaults.duplicate_ratio)
+    parser.add_argument("--invalid-date-ratio", type=float, default=defaults.invalid_date_ratio)
+    parser.add_argument("--done-ratio", type=float, default=defaults.done_ratio)
+    parser.add_argument("--tsv", action="store_true", help="Tab-delimited instead of CSV.")
+    parser.add_argument("--bom", action="store_true", help="Prefix a UTF-8 BOM.")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def spec_from_args(args: argparse.Namespace) -> ExportSpec:
+    """Build an ExportSpec from parsed add_spec_arguments options."""
+    return ExportSpec(
+        rows=args.rows,
+        assignments=args.assignments,
+        students=args.students,
+        duplicate_ratio=args.duplicate_ratio,
+        invalid_date_ratio=args.invalid_date_ratio,
+        done_ratio=args.done_ratio,
+        tsv=args.tsv,
+        bom=args.bom,
+        seed=args.seed,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", help="Path of the export to write.")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+
+    write_export(args.output, spec_from_args(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,18 +8,32 @@ CSVs plus a human-readable summary.
 
 from __future__ import annotations
 
-import argparse
-import csv
-import io
+# Only modules needed to define the classes below are imported here. The
+# rest (argparse, csv, json, sqlite3, mmap, ...) are imported by the
+# functions that use them so that small scheduled runs and ``--help`` start
+# quickly; see benchmarks/bench_startup.py.
+import contextlib
+import dataclasses
+import functools
+import itertools
 import logging
 import os
-import re
 import sys
-from dataclasses import dataclass, field
+import time
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime, timedelta
+from array import array
 from collections import defaultdict
-from pathlib import Path
-from typing import Iterable, List, Tuple, Optional, Dict, Any, Set
+from collections.abc import Sequence
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    import concurrent.futures
+    import mmap
+    import threading
+    from pathlib import Path
+    from typing import AsyncIterator, Callable, Iterable, Iterator, List, Tuple, Optional, Dict, Any, Set, Union
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -28,25 +42,42 @@ from typing import Iterable, List, Tuple, Optional, Dict, Any, Set
 __all__ = [
     # Data classes
     "ExtensionRecord",
+    "RecordBatch",
     "ParseError",
     "TableData",
+    "TableRows",
+    "IncrementalResult",
+    "FusedResult",
+    "AssignmentIndex",
+    "PipelineResult",
+    "RunTotals",
     # Core functions
     "parse_date",
     "get_next_sunday",
     "format_date",
     "get_day_name",
     "detect_delimiter",
+    "sniff_delimiter",
     "process_extension_data",
+    "iter_extension_records",
+    "process_extension_file",
+    "process_extensions_fused",
     "deduplicate_records",
+    "deduplicate_records_external",
     "adjust_dates",
     "sanitize_filename",
+    "process_incremental",
+    "process_extensions_async",
     # Output functions
     "create_output_files",
     "write_processed_copy",
     "generate_summary",
     "write_failure_report",
     # Input functions
+    "MappedLines",
     "read_from_file",
+    "open_mapped_file",
+    "expand_input_paths",
     "read_from_clipboard",
     "read_from_stdin",
     # CLI
@@ -55,6 +86,18 @@ __all__ = [
     # Configuration
     "ColumnConfig",
     "DEFAULT_COLUMNS",
+    # Instrumentation
+    "PipelineStats",
+    "StageStats",
+    "write_profile_report",
+    # Batch processing
+    "write_batch_summary",
+    # Watch mode
+    "watch_input",
+    # HTTP service
+    "process_export",
+    "make_server",
+    "serve_main",
 ]
 
 # ---------------------------------------------------------------------------
@@ -70,6 +113,71 @@ logger = logging.getLogger(__name__)
 # Number of lines to sample for delimiter detection
 DELIMITER_SAMPLE_SIZE = 10
 
+# sniff_delimiter confidence below which detect_delimiter falls back to
+# csv.Sniffer
+DELIMITER_MIN_CONFIDENCE = 0.5
+
+# Number of distinct raw date strings memoized by parse_date
+DATE_CACHE_SIZE = 4096
+
+# Number of distinct assignment names memoized by sanitize_filename
+FILENAME_CACHE_SIZE = 1024
+
+# Smallest chunk (in bytes) handed to a worker process by --jobs
+PARALLEL_MIN_CHUNK_BYTES = 1 << 20
+
+# Chunks created per worker process, to even out uneven rows
+PARALLEL_CHUNKS_PER_JOB = 4
+
+# Engines for deduplicate_records/adjust_dates; "auto" currently resolves to
+# the pure-Python engine, which benchmarks/bench_engines.py shows is at least
+# as fast as NumPy at every input size
+ENGINES = ("auto", "python", "numpy")
+
+# The CLI additionally offers the single-pass pipeline, see
+# process_extensions_fused
+PIPELINE_ENGINES = ENGINES + ("fused",)
+
+# Records deduplicate_records_external holds in memory at once, and the
+# number of hash partitions it spills to once that budget is exceeded
+EXTERNAL_DEDUP_BUDGET = 500_000
+EXTERNAL_DEDUP_PARTITIONS = 64
+
+# Default name of the --incremental state store, inside the output directory
+STATE_FILENAME = ".extensions_state.sqlite"
+
+# Bumped whenever the state store layout changes; older stores are rebuilt
+STATE_VERSION = "1"
+
+# Hashes of the assignment CSVs last written, kept inside the output directory
+MANIFEST_FILENAME = ".extensions_manifest.json"
+
+# Buffer size for output files; rows are streamed through it to disk
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Header row of every per-assignment CSV
+ASSIGNMENT_HEADER = ["Email", "Name", "Assignment", "DueDate", "RECORD"]
+
+# Number of functions listed in the --profile text report
+PROFILE_TOP_N = 30
+
+# Seconds between checks of the input file in --watch mode
+WATCH_INTERVAL = 2.0
+
+# Default address and request size limit of the ``serve`` subcommand
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8765
+SERVE_MAX_BYTES = 64 << 20
+
+# Rejected rows whose full input line is kept for the failure report; later
+# errors keep only their message and row number. None keeps every line.
+MAX_ERROR_LINES = None
+
+# Bytes read per await by process_extensions_async, and how many decoded
+# chunks may wait for the parser before reading pauses
+ASYNC_CHUNK_SIZE = 1 << 16
+ASYNC_QUEUE_CHUNKS = 8
+
 
 @dataclass
 class ColumnConfig:
@@ -94,9 +202,42 @@ DEFAULT_COLUMNS = ColumnConfig()
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+def _slotted_dataclass(
+    cls: Optional[type] = None,
+    *,
+    storage: Tuple[str, ...] = (),
+) -> Any:
+    """Like ``@dataclass(slots=True)``, which needs Python 3.10.
+
+    Applies ``@dataclass`` and recreates the class with ``__slots__`` for its
+    fields, so instances carry no per-instance ``__dict__`` while
+    ``dataclasses.fields``, ``asdict`` and ``replace`` keep working. A field
+    whose class attribute is a data descriptor keeps the descriptor, which
+    stores its value in the extra ``storage`` slots.
+    """
+    def wrap(cls: type) -> type:
+        cls = dataclass(cls)
+        namespace = dict(cls.__dict__)
+        slots = list(storage)
+        for field_info in dataclasses.fields(cls):
+            if not hasattr(namespace.get(field_info.name), "__set__"):
+                namespace.pop(field_info.name, None)
+                slots.append(field_info.name)
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        namespace["__slots__"] = tuple(slots)
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    return wrap if cls is None else wrap(cls)
+
+
+@_slotted_dataclass
 class ExtensionRecord:
-    """Represents a single extension request record."""
+    """Represents a single extension request record.
+
+    Slotted, so each record carries no per-instance ``__dict__``; large
+    exports create one of these per row.
+    """
 
     email: str
     name: str
@@ -109,23 +250,187 @@ class ExtensionRecord:
     def with_adjusted_date(self, adjusted: datetime) -> ExtensionRecord:
         """Return a new record with the adjusted due date set."""
         return ExtensionRecord(
-            email=self.email,
-            name=self.name,
-            assignment=self.assignment,
-            requested_date=self.requested_date,
-            row_num=self.row_num,
-            original_date=self.requested_date,
-            due_date=adjusted,
+            self.email,
+            self.name,
+            self.assignment,
+            self.requested_date,
+            self.row_num,
+            self.requested_date,
+            adjusted,
         )
 
 
-@dataclass
+class RecordBatch:
+    """Column-oriented storage for many extension records.
+
+    Strings are interned per batch and dates are held as integer day
+    ordinals in ``array`` columns (0 meaning "not set"), which makes a batch
+    far smaller than a list of ExtensionRecord objects. Iterating or indexing
+    a batch materializes ExtensionRecord objects on demand, so batches can be
+    passed anywhere a list of records is accepted. Times of day are dropped.
+    """
+
+    __slots__ = (
+        "emails",
+        "names",
+        "assignments",
+        "requested",
+        "original",
+        "due",
+        "row_nums",
+        "_strings",
+        "_dates",
+    )
+
+    def __init__(self) -> None:
+        self.emails: List[str] = []
+        self.names: List[str] = []
+        self.assignments: List[str] = []
+        self.requested = array("l")
+        self.original = array("l")
+        self.due = array("l")
+        self.row_nums = array("l")
+        self._strings: Dict[str, str] = {}
+        self._dates: Dict[int, datetime] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[ExtensionRecord]) -> RecordBatch:
+        """Build a batch from an iterable of records."""
+        batch = cls()
+        for record in records:
+            batch.append(record)
+        return batch
+
+    def append(self, record: ExtensionRecord) -> None:
+        """Add a record to the end of the batch."""
+        intern = self._strings.setdefault
+        self.emails.append(intern(record.email, record.email))
+        self.names.append(intern(record.name, record.name))
+        self.assignments.append(intern(record.assignment, record.assignment))
+        self.requested.append(record.requested_date.toordinal())
+        self.original.append(record.original_date.toordinal() if record.original_date else 0)
+        self.due.append(record.due_date.toordinal() if record.due_date else 0)
+        self.row_nums.append(record.row_num)
+
+    def _date(self, ordinal: int) -> Optional[datetime]:
+        if not ordinal:
+            return None
+        date = self._dates.get(ordinal)
+        if date is None:
+            date = self._dates[ordinal] = datetime.fromordinal(ordinal)
+        return date
+
+    def __len__(self) -> int:
+        return len(self.row_nums)
+
+    def __getitem__(self, index: int) -> ExtensionRecord:
+        return ExtensionRecord(
+            self.emails[index],
+            self.names[index],
+            self.assignments[index],
+            self._date(self.requested[index]),
+            self.row_nums[index],
+            self._date(self.original[index]),
+            self._date(self.due[index]),
+        )
+
+    def __iter__(self) -> Iterator[ExtensionRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def _copy_with(self, indices: Iterable[int], due: Optional[array] = None) -> RecordBatch:
+        batch = RecordBatch()
+        batch._strings = self._strings
+        batch._dates = self._dates
+        for index in indices:
+            batch.emails.append(self.emails[index])
+            batch.names.append(self.names[index])
+            batch.assignments.append(self.assignments[index])
+            batch.requested.append(self.requested[index])
+            batch.row_nums.append(self.row_nums[index])
+            if due is None:
+                batch.original.append(self.original[index])
+                batch.due.append(self.due[index])
+        if due is not None:
+            batch.original = array("l", batch.requested)
+            batch.due = due
+        return batch
+
+    def take(self, indices: Iterable[int]) -> RecordBatch:
+        """Return a new batch holding the rows at ``indices``, in that order."""
+        return self._copy_with(indices)
+
+    def with_adjusted_dates(self, adjust: Callable[[int], int]) -> RecordBatch:
+        """Return a new batch whose due dates are ``adjust(requested_ordinal)``.
+
+        Like :meth:`ExtensionRecord.with_adjusted_date`, the original date of
+        each row is set to its requested date.
+        """
+        due = array("l", (adjust(ordinal) for ordinal in self.requested))
+        return self._copy_with(range(len(self)), due=due)
+
+
+if TYPE_CHECKING:
+    # Anything the pipeline functions accept as a collection of records
+    Records = Union[List[ExtensionRecord], RecordBatch]
+
+
+class _RenderedLine:
+    """Data descriptor behind ``ParseError.line``.
+
+    Returns the tab-joined fields of the rejected row while the error still
+    holds them, otherwise the stored line. Assigning a line (or None)
+    replaces the fields.
+    """
+
+    def __get__(self, error: Optional[ParseError], owner: Optional[type] = None) -> Optional[str]:
+        if error is None:
+            # The dataclass default
+            return None
+        if error._fields is not None:
+            return "\t".join(error._fields)
+        return error._line
+
+    def __set__(self, error: ParseError, value: Optional[str]) -> None:
+        error._line = value
+        error._fields = None
+
+
+@_slotted_dataclass(storage=("_line", "_fields"))
 class ParseError:
-    """Represents an error encountered during parsing."""
+    """Represents an error encountered during parsing.
+
+    A rejected row can be given as its split ``fields`` instead of a
+    ``line``; the tab-joined line is then only built when it is read, e.g.
+    by write_failure_report or to_dict. Assigning ``line = None`` drops the
+    row's fields.
+    """
 
     message: str
     row: Optional[int] = None
-    line: Optional[str] = None
+    line: Optional[str] = _RenderedLine()  # type: ignore[assignment]
+    fields: InitVar[Optional[Sequence[str]]] = None
+
+    def __post_init__(self, fields: Optional[Sequence[str]]) -> None:
+        if self._line is None:
+            self._fields = fields
+
+    @property
+    def has_line(self) -> bool:
+        """Whether the rejected row's line (or its fields) is kept."""
+        return self._line is not None or self._fields is not None
+
+    def rebase(self, row_offset: int, keep_line: bool = True) -> None:
+        """Shift ``row`` by ``row_offset``, e.g. from chunk- to file-relative.
+
+        Args:
+            row_offset: Added to ``row`` when it is set.
+            keep_line: If False, the row's line (or fields) is dropped.
+        """
+        if self.row is not None:
+            self.row += row_offset
+        if not keep_line:
+            self.line = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for backward compatibility."""
@@ -136,15 +441,115 @@ class ParseError:
         }
 
 
+class TableRows(Sequence):
+    """Column-oriented store of the input rows retained for processed copies.
+
+    Each column is a plain list of field strings and row numbers live in an
+    ``array``, so a retained row costs one pointer per field instead of a
+    dict plus a copied list. Fields beyond the width of the first row are
+    kept in a small overflow mapping.
+
+    For compatibility with the list of ``{"row_num": ..., "fields": [...]}``
+    dicts that ``TableData.rows`` used to be, this is a read-only sequence
+    of such dicts (built on access) and ``append`` takes one. The pipeline
+    itself uses :meth:`add` and :meth:`items`.
+    """
+
+    __slots__ = ("row_nums", "columns", "_overflow")
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()) -> None:
+        self.row_nums = array("l")
+        self.columns: List[List[Optional[str]]] = []
+        self._overflow: Dict[int, List[str]] = {}
+        for row in rows:
+            self.append(row)
+
+    def add(self, row_num: int, fields: List[str]) -> None:
+        """Retain one row."""
+        columns = self.columns
+        if not columns and not self.row_nums:
+            columns.extend([] for _ in fields)
+        width = len(columns)
+        for index, column in enumerate(columns):
+            # None marks a row that is shorter than the table
+            column.append(fields[index] if index < len(fields) else None)
+        if len(fields) > width:
+            self._overflow[len(self.row_nums)] = fields[width:]
+        self.row_nums.append(row_num)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Retain a ``{"row_num": ..., "fields": [...]}`` row."""
+        self.add(row["row_num"], row["fields"])
+
+    def extend(self, other: Iterable[Any], row_offset: int = 0) -> None:
+        """Append every row of ``other``, shifting its row numbers."""
+        if isinstance(other, TableRows):
+            for row_num, fields in other.items():
+                self.add(row_num + row_offset, fields)
+        else:
+            for row in other:
+                self.add(row["row_num"] + row_offset, row["fields"])
+
+    def _fields(self, index: int) -> List[str]:
+        fields: List[str] = []
+        for column in self.columns:
+            value = column[index]
+            if value is None:
+                break
+            fields.append(value)
+        if index in self._overflow:
+            fields.extend(self._overflow[index])
+        return fields
+
+    def items(self) -> Iterator[Tuple[int, List[str]]]:
+        """Yield ``(row_num, fields)`` pairs with a fresh ``fields`` list per row."""
+        for index, row_num in enumerate(self.row_nums):
+            yield row_num, self._fields(index)
+
+    def __len__(self) -> int:
+        return len(self.row_nums)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TableRows index out of range")
+        return {"row_num": self.row_nums[index], "fields": self._fields(index)}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row_num, fields in self.items():
+            yield {"row_num": row_num, "fields": fields}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TableRows):
+            return list(self.items()) == list(other.items())
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} rows>)"
+
+
 @dataclass
 class TableData:
     """Metadata about the parsed table for producing processed copies."""
 
     header: List[str]
-    rows: List[Dict[str, Any]] = field(default_factory=list)
+    rows: TableRows = field(default_factory=TableRows)
     col_map: Dict[str, int] = field(default_factory=dict)
     delimiter: str = ","
     all_assignments: List[str] = field(default_factory=list)
+    # Data records read, including blank ones (next row number - 2)
+    row_count: int = 0
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.rows, TableRows):
+            self.rows = TableRows(self.rows)
 
 
 # ---------------------------------------------------------------------------
@@ -152,9 +557,39 @@ class TableData:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_date(date_str: str) -> Optional[datetime]:
     """Parse date in MM/DD/YYYY format.
 
+    The fixed ``MM/DD/YYYY`` shape is sliced straight into integers; anything
+    else (e.g. ``1/5/2024``) falls back to ``datetime.strptime``. Results are
+    memoized on the raw string since exports repeat the same few dates.
+
+    Args:
+        date_str: Date string to parse.
+
+    Returns:
+        Parsed datetime object, or None if parsing fails.
+    """
+    text = date_str.strip()
+    if (
+        len(text) == 10
+        and text[2] == "/"
+        and text[5] == "/"
+        and text.isascii()
+    ):
+        month, day, year = text[:2], text[3:5], text[6:]
+        if month.isdigit() and day.isdigit() and year.isdigit():
+            try:
+                return datetime(int(year), int(month), int(day))
+            except ValueError:
+                return None
+    return _parse_date_strptime(text)
+
+
+def _parse_date_strptime(date_str: str) -> Optional[datetime]:
+    """Parse date in MM/DD/YYYY format using ``datetime.strptime``.
+
     Args:
         date_str: Date string to parse.
 
@@ -212,47 +647,178 @@ def get_day_name(date: datetime) -> str:
 # ---------------------------------------------------------------------------
 
 
-def detect_delimiter(lines: List[str]) -> str:
+def sniff_delimiter(prefix: bytes) -> Tuple[str, float]:
+    """Guess the delimiter of a raw export prefix by counting bytes.
+
+    Commas and tabs outside quoted fields are counted per record for the
+    first ``DELIMITER_SAMPLE_SIZE`` non-blank records. A quote toggles the
+    quoted state (an escaped ``""`` toggles it twice), so newlines and
+    delimiters inside quoted free-text answers are ignored. A record cut
+    off by the end of ``prefix`` is dropped unless it is the only one.
+
+    A delimiter scores the share of records with the same count as the
+    header row, or 0 when the header does not contain it.
+
+    Args:
+        prefix: The first bytes of the export, before decoding. A UTF-8 BOM
+            is harmless.
+
+    Returns:
+        A tuple of (delimiter, confidence). ``confidence`` is the difference
+        between the two scores, from 0 (no evidence either way) to 1.
+    """
+    records: List[Tuple[int, int]] = []
+    commas = tabs = 0
+    blank = True
+    # Splitting on quotes alternates unquoted and quoted segments
+    for index, segment in enumerate(prefix.split(b'"')):
+        if index % 2:
+            blank = False
+            continue
+        *complete, rest = segment.split(b"\n")
+        for line in complete:
+            commas += line.count(b",")
+            tabs += line.count(b"\t")
+            if not blank or line.strip():
+                records.append((commas, tabs))
+            commas = tabs = 0
+            blank = True
+        commas += rest.count(b",")
+        tabs += rest.count(b"\t")
+        blank = blank and not rest.strip()
+        if len(records) >= DELIMITER_SAMPLE_SIZE:
+            break
+    if not blank and not records:
+        # The prefix ends inside the header record
+        records.append((commas, tabs))
+
+    records = records[:DELIMITER_SAMPLE_SIZE]
+    if not records:
+        return ",", 0.0
+
+    scores = []
+    for column in (0, 1):
+        expected = records[0][column]
+        matching = sum(1 for counts in records if counts[column] == expected)
+        scores.append(matching / len(records) if expected else 0.0)
+    comma_score, tab_score = scores
+    if tab_score > comma_score:
+        return "\t", tab_score - comma_score
+    return ",", comma_score - tab_score
+
+
+def detect_delimiter(lines: Union[Sequence[str], bytes]) -> str:
     """Attempt to detect whether the payload is comma- or tab-delimited.
 
+    Uses :func:`sniff_delimiter`, falling back to ``csv.Sniffer`` when its
+    confidence is below ``DELIMITER_MIN_CONFIDENCE``. Either way the sample
+    is the first ``DELIMITER_SAMPLE_SIZE`` non-blank lines, so lines and the
+    raw bytes they were read from give the same result.
+
     Args:
-        lines: List of lines to analyze.
+        lines: List of lines to analyze, or the raw bytes at the start of
+            the export.
 
     Returns:
         Detected delimiter character (',' or '\\t').
     """
-    if not lines:
+    import csv
+
+    if isinstance(lines, bytes):
+        prefix: Optional[bytes] = lines
+        text_lines: Iterable[str] = lines.decode("utf-8", errors="replace").splitlines()
+    else:
+        prefix = None
+        text_lines = lines
+    sample = list(
+        itertools.islice((line for line in text_lines if line.strip()), DELIMITER_SAMPLE_SIZE)
+    )
+    if not sample:
         return ","
 
-    sample = "\n".join(lines[:DELIMITER_SAMPLE_SIZE])
+    if prefix is None:
+        prefix = "".join(line + "\n" for line in sample).encode("utf-8")
+    delimiter, confidence = sniff_delimiter(prefix)
+    if confidence >= DELIMITER_MIN_CONFIDENCE:
+        return delimiter
+
     try:
-        dialect = csv.Sniffer().sniff(sample, delimiters=",\t")
+        dialect = csv.Sniffer().sniff("\n".join(sample), delimiters=",\t")
         return dialect.delimiter
     except csv.Error:
-        first_line = lines[0]
+        first_line = sample[0]
         if first_line.count(",") >= first_line.count("\t"):
             return ","
         return "\t"
 
 
+class _TrimTrailingNewline:
+    """Writable wrapper that withholds the final ``\\n`` written to it.
+
+    ``csv.writer`` writes one terminated row per ``write`` call, so holding
+    back each terminator until the next row arrives leaves the output
+    without a trailing newline, without buffering the whole file.
+    """
+
+    def __init__(self, target: Any) -> None:
+        self._target = target
+        self._pending = False
+
+    def write(self, text: str) -> None:
+        if self._pending:
+            self._target.write("\n")
+        self._pending = text.endswith("\n")
+        self._target.write(text[:-1] if self._pending else text)
+
+
+class _HashingSink:
+    """Writable sink that records the SHA-256 and size of its input.
+
+    With a binary ``target`` the encoded bytes (``prefix`` included) are also
+    written there, so a file can be hashed while it is written.
+    """
+
+    def __init__(
+        self, encoding: str = "utf-8", prefix: bytes = b"", target: Any = None
+    ) -> None:
+        import hashlib
+
+        self.encoding = encoding
+        self.digest = hashlib.sha256(prefix)
+        self.size = len(prefix)
+        self._target = target
+        if target is not None:
+            target.write(prefix)
+
+    def write(self, text: str) -> None:
+        data = text.encode(self.encoding)
+        self.digest.update(data)
+        self.size += len(data)
+        if self._target is not None:
+            self._target.write(data)
+
+
 def _write_csv_content(
-    writer: csv.writer,
+    target: Any,
     header: List[str],
-    rows: Iterable[List[str]],
-) -> str:
-    """Write CSV content to a StringIO buffer and return trimmed content.
+    rows: Iterable[List[Any]],
+    delimiter: str = ",",
+) -> None:
+    """Stream CSV rows to ``target`` with no trailing newline.
 
     Args:
-        writer: CSV writer instance.
+        target: Object with a ``write(str)`` method (e.g. an open file).
         header: Header row.
-        rows: Data rows.
-
-    Returns:
-        CSV content as string with trailing newline removed.
+        rows: Data rows, consumed lazily.
+        delimiter: Field delimiter.
     """
+    import csv
+
+    writer = csv.writer(
+        _TrimTrailingNewline(target), delimiter=delimiter, lineterminator="\n"
+    )
     writer.writerow(header)
-    for row in rows:
-        writer.writerow(row)
+    writer.writerows(rows)
 
 
 # ---------------------------------------------------------------------------
@@ -260,41 +826,42 @@ def _write_csv_content(
 # ---------------------------------------------------------------------------
 
 
-def process_extension_data(
+def _open_reader(
     data_lines: Iterable[str],
-    columns: Optional[ColumnConfig] = None,
-) -> Tuple[List[ExtensionRecord], List[ParseError], Optional[TableData]]:
-    """Process MS Forms extension request data.
+    columns: ColumnConfig,
+    delimiter: Optional[str] = None,
+) -> Tuple[Optional[Iterator[List[str]]], Optional[List[str]], Dict[str, int], str, Optional[ParseError]]:
+    """Read the header row and prepare a reader for the remaining rows.
+
+    Only the first ``DELIMITER_SAMPLE_SIZE`` lines are buffered for delimiter
+    detection; the rest of ``data_lines`` is consumed lazily by the reader.
 
     Args:
         data_lines: Iterable of input lines to process.
-        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
+        columns: Column configuration.
+        delimiter: Delimiter already detected by the caller, if any.
 
     Returns:
-        A tuple of (records, errors, table_data) where:
-        - records: Successfully parsed ExtensionRecord objects
-        - errors: List of ParseError objects for failed rows
-        - table_data: TableData for producing processed copies, or None on failure
+        A tuple of (reader, raw_header, col_map, delimiter, error). ``reader``
+        is None when the input is empty or the header is invalid, in which case
+        ``error`` describes the problem (or is None for empty input).
     """
-    if columns is None:
-        columns = DEFAULT_COLUMNS
-
-    records: List[ExtensionRecord] = []
-    errors: List[ParseError] = []
-    all_assignments: Set[str] = set()
+    import csv
 
-    lines = list(data_lines)
+    line_iter = iter(data_lines)
+    peek = list(itertools.islice(line_iter, DELIMITER_SAMPLE_SIZE))
 
-    if not lines:
-        return [], errors, None
+    if not peek:
+        return None, None, {}, ",", None
 
-    delimiter = detect_delimiter(lines)
-    reader = csv.reader(lines, delimiter=delimiter)
+    if delimiter is None:
+        delimiter = detect_delimiter(peek)
+    reader = csv.reader(itertools.chain(peek, line_iter), delimiter=delimiter)
 
     try:
         raw_header = next(reader)
     except StopIteration:
-        return [], [ParseError(message="No header row found")], None
+        return None, None, {}, delimiter, ParseError(message="No header row found")
 
     header = [col.strip().lstrip("\ufeff") for col in raw_header]
 
@@ -306,35 +873,93 @@ def process_extension_data(
     # Validate we have required columns
     missing_cols = [col for col in columns.required if col not in col_map]
     if missing_cols:
-        errors.append(
-            ParseError(message=f"Missing required columns: {', '.join(missing_cols)}")
+        error = ParseError(
+            message=f"Missing required columns: {', '.join(missing_cols)}"
         )
-        return [], errors, None
+        return None, raw_header, col_map, delimiter, error
+
+    return reader, raw_header, col_map, delimiter, None
+
+
+def _no_intern(value: str, default: str) -> str:
+    """Stand-in for ``symbols.setdefault`` when interning is off."""
+    return default
 
-    table_data = TableData(
-        header=raw_header,
-        col_map=col_map,
-        delimiter=delimiter,
-    )
 
+def _iter_rows(
+    reader: Iterable[List[str]],
+    header_len: int,
+    col_map: Dict[str, int],
+    columns: ColumnConfig,
+    table_data: Optional[TableData] = None,
+    all_assignments: Optional[Set[str]] = None,
+    start: int = 2,
+    record_factory: Callable[..., Any] = ExtensionRecord,
+    symbols: Optional[Dict[str, str]] = None,
+    max_error_lines: Optional[int] = None,
+) -> Iterator[Union[ExtensionRecord, ParseError]]:
+    """Turn data rows into records and row-level errors.
+
+    Args:
+        reader: Iterable of already-split data rows.
+        header_len: Number of columns in the header row.
+        col_map: Mapping of column names to indices.
+        columns: Column configuration.
+        table_data: If given, every non-blank row is retained on it and its
+            row_count is advanced for every row read.
+        all_assignments: If given, collects every assignment name seen.
+        start: Row number of the first data row.
+        record_factory: Called as ``record_factory(email, name, assignment,
+            requested_date, row_num)`` to build each valid row.
+        symbols: Symbol table used to intern the email, name and assignment
+            fields, so values repeated across rows (assignment titles,
+            students with several requests) share one string object in the
+            records and the retained rows. Without one nothing is interned,
+            so streaming callers keep constant memory.
+        max_error_lines: Keep the input line of at most this many rejected
+            rows; later errors only carry their message and row number.
+            None keeps every line.
+
+    Yields:
+        ExtensionRecord (or ``record_factory`` result) for valid rows and
+        ParseError for rejected rows.
+    """
     done_col = col_map.get(columns.done)
+    # Rows are padded to the header width, so these are always in range
+    email_col = col_map[columns.email]
+    name_col = col_map[columns.name]
+    assignment_col = col_map[columns.assignment]
+    date_col = col_map[columns.date]
+    intern = symbols.setdefault if symbols is not None else _no_intern
+    # Rejected rows that may still keep their fields
+    line_budget = -1 if max_error_lines is None else max_error_lines
+
+    for row_num, fields in enumerate(reader, start=start):
+        if table_data is not None:
+            table_data.row_count += 1
 
-    # Process data rows
-    for row_num, fields in enumerate(reader, start=2):
         if not any(field.strip() for field in fields):
             continue
 
-        if len(fields) < len(raw_header):
-            fields.extend([""] * (len(raw_header) - len(fields)))
-
-        table_data.rows.append({"row_num": row_num, "fields": fields[:]})
-
-        assignment = (
-            fields[col_map[columns.assignment]].strip()
-            if col_map[columns.assignment] < len(fields)
-            else ""
-        )
-        if assignment:
+        if len(fields) < header_len:
+            fields.extend([""] * (header_len - len(fields)))
+
+        email = fields[email_col]
+        email = fields[email_col] = intern(email, email)
+        name = fields[name_col]
+        name = fields[name_col] = intern(name, name)
+        assignment = fields[assignment_col]
+        assignment = fields[assignment_col] = intern(assignment, assignment)
+
+        if table_data is not None:
+            table_data.rows.add(row_num, fields)
+
+        # strip() returns the same (interned) object when there is nothing
+        # to strip; otherwise intern the stripped copy as well
+        stripped = assignment.strip()
+        if stripped is not assignment:
+            assignment = intern(stripped, stripped)
+        if assignment and all_assignments is not None:
             all_assignments.add(assignment)
 
         already_done = False
@@ -343,26 +968,13 @@ def process_extension_data(
         if already_done:
             continue
 
-        email = (
-            fields[col_map[columns.email]].strip()
-            if col_map[columns.email] < len(fields)
-            else ""
-        )
-        name = (
-            fields[col_map[columns.name]].strip()
-            if col_map[columns.name] < len(fields)
-            else ""
-        )
-        assignment = (
-            fields[col_map[columns.assignment]].strip()
-            if col_map[columns.assignment] < len(fields)
-            else ""
-        )
-        requested_date_str = (
-            fields[col_map[columns.date]].strip()
-            if col_map[columns.date] < len(fields)
-            else ""
-        )
+        stripped = email.strip()
+        if stripped is not email:
+            email = intern(stripped, stripped)
+        stripped = name.strip()
+        if stripped is not name:
+            name = intern(stripped, stripped)
+        requested_date_str = fields[date_col].strip()
 
         # Validate required fields
         missing: List[str] = []
@@ -376,203 +988,1522 @@ def process_extension_data(
             missing.append("RequestedDate")
 
         if missing:
-            errors.append(
-                ParseError(
-                    message=f"Missing fields ({', '.join(missing)})",
-                    row=row_num,
-                    line="\t".join(fields),
-                )
+            yield ParseError(
+                message=f"Missing fields ({', '.join(missing)})",
+                row=row_num,
+                fields=fields if line_budget else None,
             )
+            if line_budget > 0:
+                line_budget -= 1
             continue
 
         # Parse date
         requested_date = parse_date(requested_date_str)
         if not requested_date:
-            errors.append(
-                ParseError(
-                    message=f"Invalid date format '{requested_date_str}' (expected MM/DD/YYYY)",
-                    row=row_num,
-                    line="\t".join(fields),
-                )
+            yield ParseError(
+                message=f"Invalid date format '{requested_date_str}' (expected MM/DD/YYYY)",
+                row=row_num,
+                fields=fields if line_budget else None,
             )
+            if line_budget > 0:
+                line_budget -= 1
             continue
 
-        records.append(
-            ExtensionRecord(
-                email=email,
-                name=name,
-                assignment=assignment,
-                requested_date=requested_date,
-                row_num=row_num,
-            )
-        )
+        yield record_factory(email, name, assignment, requested_date, row_num)
 
-    table_data.all_assignments = sorted(all_assignments)
-    return records, errors, table_data
 
+def iter_extension_records(
+    data_lines: Iterable[str],
+    columns: Optional[ColumnConfig] = None,
+) -> Iterator[Union[ExtensionRecord, ParseError]]:
+    """Stream MS Forms extension request data one row at a time.
 
-def deduplicate_records(records: List[ExtensionRecord]) -> List[ExtensionRecord]:
-    """Keep only the latest date for each (Assignment, Email) combination.
+    Unlike :func:`process_extension_data`, nothing beyond a small peek buffer
+    for delimiter detection is held in memory, so arbitrarily large exports
+    can be parsed in constant memory.
 
     Args:
-        records: List of extension records.
+        data_lines: Iterable of input lines to process.
+        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
 
-    Returns:
-        Deduplicated list of records (new list, does not mutate input).
+    Yields:
+        ExtensionRecord for valid rows and ParseError for rejected rows. A
+        header problem is reported as a single ParseError without a row.
     """
-    dedup: Dict[Tuple[str, str], ExtensionRecord] = {}
-
-    for record in records:
-        key = (record.assignment, record.email)
+    if columns is None:
+        columns = DEFAULT_COLUMNS
 
-        if key not in dedup:
-            dedup[key] = record
-        else:
-            # Keep the one with latest date
-            if record.requested_date > dedup[key].requested_date:
-                dedup[key] = record
+    reader, raw_header, col_map, _, error = _open_reader(data_lines, columns)
+    if error is not None:
+        yield error
+        return
+    if reader is None:
+        return
 
-    return list(dedup.values())
+    yield from _iter_rows(reader, len(raw_header), col_map, columns)
 
 
-def adjust_dates(records: List[ExtensionRecord]) -> List[ExtensionRecord]:
-    """Adjust dates to Sunday, returning new records.
+def process_extension_data(
+    data_lines: Iterable[str],
+    columns: Optional[ColumnConfig] = None,
+    max_error_lines: Optional[int] = MAX_ERROR_LINES,
+    delimiter: Optional[str] = None,
+) -> Tuple[List[ExtensionRecord], List[ParseError], Optional[TableData]]:
+    """Process MS Forms extension request data.
 
     Args:
-        records: List of extension records.
+        data_lines: Iterable of input lines to process.
+        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
+        max_error_lines: Keep the input line of at most this many rejected
+            rows. None keeps every line.
+        delimiter: Field delimiter. Detected from the first lines when None.
 
     Returns:
-        New list of records with adjusted dates (does not mutate input).
+        A tuple of (records, errors, table_data) where:
+        - records: Successfully parsed ExtensionRecord objects
+        - errors: List of ParseError objects for failed rows
+        - table_data: TableData for producing processed copies, or None on failure
     """
-    result: List[ExtensionRecord] = []
-    for record in records:
-        adjusted = get_next_sunday(record.requested_date)
-        result.append(record.with_adjusted_date(adjusted))
-    return result
+    if columns is None:
+        columns = DEFAULT_COLUMNS
 
+    records: List[ExtensionRecord] = []
+    errors: List[ParseError] = []
+    all_assignments: Set[str] = set()
 
-def sanitize_filename(text: str) -> str:
-    """Convert text to valid filename.
+    reader, raw_header, col_map, delimiter, error = _open_reader(
+        data_lines, columns, delimiter=delimiter
+    )
+    if error is not None:
+        return [], [error], None
+    if reader is None:
+        return [], errors, None
 
-    Args:
-        text: Text to sanitize.
+    table_data = TableData(
+        header=raw_header,
+        col_map=col_map,
+        delimiter=delimiter,
+    )
 
-    Returns:
-        Sanitized filename string.
-    """
-    filename = text.lower()
-    filename = re.sub(r"[^a-z0-9]+", "_", filename)
-    filename = filename.strip("_")
-    return filename
+    for item in _iter_rows(
+        reader,
+        len(raw_header),
+        col_map,
+        columns,
+        table_data=table_data,
+        all_assignments=all_assignments,
+        symbols={},
+        max_error_lines=max_error_lines,
+    ):
+        if isinstance(item, ParseError):
+            errors.append(item)
+        else:
+            records.append(item)
 
+    table_data.all_assignments = sorted(all_assignments)
+    return records, errors, table_data
 
-# ---------------------------------------------------------------------------
-# Output Functions
-# ---------------------------------------------------------------------------
 
+@dataclass
+class FusedResult:
+    """Outcome of :func:`process_extensions_fused`."""
+
+    records: List[ExtensionRecord]
+    errors: List[ParseError]
+    table_data: Optional[TableData]
+    # Surviving records per assignment, sorted by email, in assignment order
+    groups: Dict[str, List[ExtensionRecord]] = field(default_factory=dict)
+
+
+def _fused_row(*fields: Any) -> Tuple[Any, ...]:
+    """Row factory for the fused pass: (email, name, assignment, date, row)."""
+    return fields
 
-def create_output_files(
-    records: List[ExtensionRecord],
-    output_dir: str = "./extensions_output",
-    all_assignments: Optional[List[str]] = None,
-    dry_run: bool = False,
-) -> Tuple[List[Dict[str, Any]], List[str]]:
-    """Create CSV files per assignment.
+
+def process_extensions_fused(
+    data_lines: Iterable[str],
+    columns: Optional[ColumnConfig] = None,
+    adjust: bool = True,
+    max_error_lines: Optional[int] = MAX_ERROR_LINES,
+) -> FusedResult:
+    """Parse, deduplicate and adjust dates in a single pass.
+
+    Rows are deduplicated straight into per-assignment buckets as they are
+    parsed, keeping only a lightweight tuple per (assignment, email). An
+    ExtensionRecord, with its due date already snapped, is created once per
+    surviving row at the end. The result matches :func:`process_extension_data`
+    followed by :func:`deduplicate_records` and :func:`adjust_dates` (same
+    files, summary and failures), except that ``records`` are ordered by
+    assignment and email.
 
     Args:
-        records: List of extension records to write.
-        output_dir: Directory to write output files.
-        all_assignments: Optional list of all assignment names to include.
-        dry_run: If True, do not write files, just return what would be written.
+        data_lines: Iterable of input lines to process.
+        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
+        adjust: Snap requested dates to the following Sunday; otherwise the
+            due date is the requested date.
+        max_error_lines: Keep the input line of at most this many rejected
+            rows. None keeps every line.
 
     Returns:
-        A tuple of (file_info, io_errors) where:
-        - file_info: List of dicts with assignment, filename, num_students, dates
-        - io_errors: List of error messages for I/O failures
+        A FusedResult whose ``groups`` can be passed to create_output_files.
     """
-    io_errors: List[str] = []
+    if columns is None:
+        columns = DEFAULT_COLUMNS
 
-    if not dry_run:
-        try:
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-        except OSError as exc:
-            io_errors.append(f"Unable to create output directory '{output_dir}': {exc}")
-            return [], io_errors
+    reader, raw_header, col_map, delimiter, error = _open_reader(data_lines, columns)
+    if error is not None:
+        return FusedResult([], [error], None)
+    if reader is None:
+        return FusedResult([], [], None)
 
-    # Group by assignment
-    by_assignment: Dict[str, List[ExtensionRecord]] = defaultdict(list)
-    for record in records:
-        by_assignment[record.assignment].append(record)
+    table_data = TableData(header=raw_header, col_map=col_map, delimiter=delimiter)
+    all_assignments: Set[str] = set()
+    errors: List[ParseError] = []
+    buckets: Dict[str, Dict[str, Tuple[Any, ...]]] = {}
+
+    for item in _iter_rows(
+        reader,
+        len(raw_header),
+        col_map,
+        columns,
+        table_data=table_data,
+        all_assignments=all_assignments,
+        record_factory=_fused_row,
+        symbols={},
+        max_error_lines=max_error_lines,
+    ):
+        if isinstance(item, ParseError):
+            errors.append(item)
+            continue
+        bucket = buckets.get(item[2])
+        if bucket is None:
+            bucket = buckets[item[2]] = {}
+        # Keep the latest date; the earliest row wins ties
+        current = bucket.get(item[0])
+        if current is None or item[3] > current[3]:
+            bucket[item[0]] = item
 
-    if all_assignments:
-        for assignment in all_assignments:
-            if assignment not in by_assignment:
-                by_assignment[assignment] = []
+    table_data.all_assignments = sorted(all_assignments)
 
-    file_info: List[Dict[str, Any]] = []
+    sundays: Dict[datetime, datetime] = {}
+    records: List[ExtensionRecord] = []
+    groups: Dict[str, List[ExtensionRecord]] = {}
+    for assignment in sorted(buckets):
+        bucket = buckets[assignment]
+        group: List[ExtensionRecord] = []
+        for email in sorted(bucket):
+            _, name, _, requested, row_num = bucket[email]
+            due = requested
+            if adjust:
+                due = sundays.get(requested)
+                if due is None:
+                    due = sundays[requested] = get_next_sunday(requested)
+            group.append(
+                ExtensionRecord(email, name, assignment, requested, row_num, requested, due)
+            )
+        groups[assignment] = group
+        records.extend(group)
 
-    for assignment, assignment_records in sorted(by_assignment.items()):
-        # Create filename
-        filename = sanitize_filename(assignment)
-        filename = f"{filename}_extensions.csv"
-        filepath = os.path.join(output_dir, filename)
+    return FusedResult(records, errors, table_data, groups)
 
-        # Sort by email
-        assignment_records.sort(key=lambda x: x.email)
 
-        if not dry_run:
-            # Write CSV with BOM (UTF-8-sig)
-            try:
-                buffer = io.StringIO()
-                writer = csv.writer(buffer, lineterminator="\n")
-                writer.writerow(["Email", "Name", "Assignment", "DueDate", "RECORD"])
-
-                for record in assignment_records:
-                    due_date_str = format_date(record.due_date) if record.due_date else ""
-                    record_str = f"{record.email} - {record.name} - {record.assignment} - {due_date_str}"
-                    writer.writerow(
-                        [
-                            record.email,
-                            record.name,
-                            record.assignment,
-                            due_date_str,
-                            record_str,
-                        ]
-                    )
+def _split_records(
+    data: mmap.mmap,
+    start: int,
+    end: int,
+    chunk_size: int,
+    delimiter: str = ",",
+) -> List[Tuple[int, int]]:
+    """Split ``data[start:end]`` into byte ranges that end on record boundaries.
 
-                contents = buffer.getvalue().rstrip("\n")
-                with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-                    f.write(contents)
-            except OSError as exc:
-                io_errors.append(f"Failed to write '{filepath}': {exc}")
-                continue
+    Quotes are tracked the way ``csv.reader`` reads them: a quote only opens
+    a quoted field at the start of a field, ``""`` inside one is an escaped
+    quote, and any other quote is literal. Quoted fields containing newlines
+    are therefore never split, and a stray quote in an unquoted field (such
+    as ``O"Brien``) does not shift the boundaries.
 
-        # Collect info for summary
-        if assignment_records:
-            dates = [r.due_date for r in assignment_records if r.due_date]
-            file_info.append(
-                {
-                    "assignment": assignment,
-                    "filename": filename,
-                    "num_students": len(assignment_records),
-                    "earliest_date": format_date(min(dates)) if dates else "N/A",
-                    "latest_date": format_date(max(dates)) if dates else "N/A",
-                }
-            )
-        else:
-            file_info.append(
-                {
-                    "assignment": assignment,
-                    "filename": filename,
-                    "num_students": 0,
-                    "earliest_date": "N/A",
-                    "latest_date": "N/A",
-                }
+    Args:
+        data: Memory-mapped input file.
+        start: Offset of the first data byte.
+        end: Offset one past the last data byte.
+        chunk_size: Target size of each range in bytes.
+        delimiter: Field delimiter of the file.
+
+    Returns:
+        List of (start, end) byte ranges covering the region in order.
+    """
+    skip_records, next_record = _record_scanner(delimiter)
+
+    ranges: List[Tuple[int, int]] = []
+    chunk_start = start
+    while chunk_start < end:
+        target = chunk_start + chunk_size
+        if target >= end:
+            ranges.append((chunk_start, end))
+            break
+
+        position = skip_records.match(data, chunk_start, target).end()
+        boundary = next_record(data, position, end) or end
+        ranges.append((chunk_start, boundary))
+        chunk_start = boundary
+    return ranges
+
+
+def _record_scanner(
+    delimiter: str,
+) -> Tuple[Any, Callable[[mmap.mmap, int, int], Optional[int]]]:
+    """Build the record-boundary scanner shared by the raw-byte readers.
+
+    The patterns recognise a field start by the delimiter or newline before
+    it, so they cannot see one at the very beginning of a file.
+
+    Returns:
+        A tuple of (skip_records, next_record). ``skip_records`` is a pattern
+        that skips whole records from a record start. ``next_record(data,
+        position, end, field_start=False)`` returns the offset just past the
+        newline that ends the record containing ``position``, or None if
+        that record is not terminated before ``end``. Pass ``field_start``
+        when ``position`` is known to start a field, e.g. the first record
+        of a file.
+    """
+    import re
+
+    # A complete quoted field, only where a field starts. It must be
+    # followed by another byte so that a field cut off at the end of the
+    # scan (possibly between the two quotes of an escaped "") is not
+    # mistaken for a closed one.
+    field_start = rb"(?<=[" + re.escape(delimiter.encode()) + rb"\n])"
+    quoted = field_start + rb'"(?:[^"]++|"")*+"(?=[^"])'
+    literal_quote = rb"(?<![" + re.escape(delimiter.encode()) + rb'\n])"'
+    # Skip whole records, or stop at the first newline outside quotes; both
+    # stop early at a quoted field they cannot see the end of
+    skip_records = re.compile(rb'(?:[^"]++|' + quoted + rb"|" + literal_quote + rb")*+")
+    skip_record = re.compile(rb'(?:[^"\n]++|' + quoted + rb"|" + literal_quote + rb")*+")
+    close_quote = re.compile(rb'(?:[^"]++|"")*+"')
+
+    def next_record(
+        data: mmap.mmap, position: int, end: int, field_start: bool = False
+    ) -> Optional[int]:
+        if field_start and data[position:position + 1] == b'"':
+            closed = close_quote.match(data, position + 1, end)
+            if closed is None:
+                return None
+            position = closed.end()
+        while True:
+            position = skip_record.match(data, position, end).end()
+            if position >= end:
+                return None
+            if data[position:position + 1] == b"\n":
+                return position + 1
+            # An opening quote: skip to the end of its field
+            closed = close_quote.match(data, position + 1, end)
+            if closed is None:
+                return None
+            position = closed.end()
+
+    return skip_records, next_record
+
+
+def _complete_records_end(
+    data: Optional[mmap.mmap],
+    start: int,
+    end: int,
+    delimiter: str = ",",
+) -> int:
+    """Return the offset just past the last complete record of ``data[start:end]``.
+
+    A file read while it is still being written can end partway through a
+    row; the bytes after the last record terminator outside quotes are that
+    unfinished row. ``start`` must be a record start (a UTF-8 BOM there is
+    skipped); it is returned when no record in the region is complete.
+    """
+    import codecs
+
+    if data is None or start >= end:
+        return start
+    if data.find(b'"', start, end) < 0:
+        # Without quotes every newline ends a record
+        return data.rfind(b"\n", start, end) + 1 or start
+
+    _, next_record = _record_scanner(delimiter)
+    first = start
+    if data[start:start + 3] == codecs.BOM_UTF8:
+        first += len(codecs.BOM_UTF8)
+    first = next_record(data, first, end, field_start=True)
+    if first is None:
+        return start
+    # Find a record boundary near the end, then walk the last records
+    ranges = _split_records(data, first, end, PARALLEL_MIN_CHUNK_BYTES, delimiter)
+    position = complete = ranges[-1][0] if ranges else first
+    while position < end:
+        boundary = next_record(data, position, end)
+        if boundary is None:
+            break
+        position = complete = boundary
+    return complete
+
+
+def _parse_file_chunk(
+    path: str,
+    byte_range: Tuple[int, int],
+    delimiter: str,
+    header_len: int,
+    col_map: Dict[str, int],
+    columns: ColumnConfig,
+    max_error_lines: Optional[int] = None,
+) -> Tuple[List[ExtensionRecord], List[ParseError], TableData, Set[str], int]:
+    """Parse one byte range of an input file in a worker process.
+
+    Row numbers in the result are relative to the start of the chunk
+    (starting at 0) and are rebased by :func:`process_extension_file`.
+    ``max_error_lines`` applies to this chunk alone.
+
+    Returns:
+        A tuple of (records, errors, table_data, assignments, row_count).
+    """
+    import csv
+
+    start, end = byte_range
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+
+    lines = [line[:-1] if line.endswith("\r") else line for line in text.split("\n")]
+    rows = list(csv.reader((line for line in lines if line.strip()), delimiter=delimiter))
+
+    records: List[ExtensionRecord] = []
+    errors: List[ParseError] = []
+    table_data = TableData(header=[], col_map=col_map, delimiter=delimiter)
+    assignments: Set[str] = set()
+    for item in _iter_rows(
+        rows,
+        header_len,
+        col_map,
+        columns,
+        table_data=table_data,
+        all_assignments=assignments,
+        start=0,
+        symbols={},
+        max_error_lines=max_error_lines,
+    ):
+        if isinstance(item, ParseError):
+            errors.append(item)
+        else:
+            records.append(item)
+
+    return records, errors, table_data, assignments, len(rows)
+
+
+def process_extension_file(
+    path: Union[str, Path],
+    columns: Optional[ColumnConfig] = None,
+    jobs: int = 1,
+    chunk_size: Optional[int] = None,
+    max_error_lines: Optional[int] = MAX_ERROR_LINES,
+    end: Optional[int] = None,
+) -> Tuple[List[ExtensionRecord], List[ParseError], Optional[TableData]]:
+    """Process an MS Forms export file, optionally across several processes.
+
+    Blank lines are skipped, exactly as ``main`` does for other inputs. With
+    ``jobs > 1`` the data rows are split at record boundaries, parsed in a
+    process pool, and merged back in order, so the result is identical to
+    the serial path.
+
+    Args:
+        path: Path to the export file.
+        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
+        jobs: Number of worker processes to use.
+        chunk_size: Target chunk size in bytes. Defaults to an even split
+            across ``jobs`` (at least PARALLEL_MIN_CHUNK_BYTES).
+        max_error_lines: Keep the input line of at most this many rejected
+            rows. None keeps every line.
+        end: Only parse the bytes before this offset (a record boundary,
+            e.g. from _complete_records_end). Defaults to the whole file.
+
+    Returns:
+        The same (records, errors, table_data) tuple as process_extension_data.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    import codecs
+    import concurrent.futures
+
+    if columns is None:
+        columns = DEFAULT_COLUMNS
+
+    with MappedLines(path, end=end) as source:
+        data = source._map
+        if data is None:
+            return process_extension_data(
+                (line for line in source if line.strip()),
+                columns=columns,
+                max_error_lines=max_error_lines,
+            )
+
+        # Read the header plus a delimiter sample and note where the header
+        # record ends. Leading blank lines are skipped like everywhere else.
+        sample_start = len(codecs.BOM_UTF8) if data[:3] == codecs.BOM_UTF8 else 0
+        data.seek(sample_start)
+        sample: List[str] = []
+        header_end: Optional[int] = None
+        quotes = 0
+        size = len(data) if end is None else min(end, len(data))
+        while len(sample) < DELIMITER_SAMPLE_SIZE and data.tell() < size:
+            raw = data.readline()
+            if not raw:
+                break
+            line = raw.decode(source.encoding)
+            if line.endswith("\n"):
+                line = line[:-2] if line.endswith("\r\n") else line[:-1]
+            if line.strip():
+                sample.append(line)
+            quotes += raw.count(b'"')
+            if header_end is None and sample and quotes % 2 == 0:
+                header_end = data.tell()
+
+        # Detect the delimiter once on the raw bytes of the sample, so the
+        # serial and parallel paths always agree
+        delimiter = detect_delimiter(data[sample_start:data.tell()])
+
+        if chunk_size is None:
+            chunk_size = max(
+                PARALLEL_MIN_CHUNK_BYTES,
+                size // (max(jobs, 1) * PARALLEL_CHUNKS_PER_JOB) + 1,
+            )
+        if jobs <= 1 or header_end is None or size - header_end <= chunk_size:
+            return process_extension_data(
+                (line for line in source if line.strip()),
+                columns=columns,
+                max_error_lines=max_error_lines,
+                delimiter=delimiter,
+            )
+
+        reader, raw_header, col_map, delimiter, error = _open_reader(
+            sample, columns, delimiter=delimiter
+        )
+        if error is not None:
+            return [], [error], None
+        if reader is None:
+            return [], [], None
+
+        ranges = _split_records(data, header_end, size, chunk_size, delimiter)
+
+    parse_chunk = functools.partial(
+        _parse_file_chunk,
+        str(path),
+        delimiter=delimiter,
+        header_len=len(raw_header),
+        col_map=col_map,
+        columns=columns,
+        max_error_lines=max_error_lines,
+    )
+
+    records: List[ExtensionRecord] = []
+    errors: List[ParseError] = []
+    all_assignments: Set[str] = set()
+    table_data = TableData(header=raw_header, col_map=col_map, delimiter=delimiter)
+
+    # Each worker interns its own chunk; re-intern so that equal values share
+    # one object across chunks too
+    intern = {}.setdefault
+    interned_cols = [col_map[columns.email], col_map[columns.name], col_map[columns.assignment]]
+    # Each chunk applies the cap on its own; enforce it across chunks here
+    line_budget = -1 if max_error_lines is None else max_error_lines
+
+    row_base = 2
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        for chunk_records, chunk_errors, chunk_table, assignments, row_count in pool.map(
+            parse_chunk, ranges
+        ):
+            for record in chunk_records:
+                record.row_num += row_base
+                record.email = intern(record.email, record.email)
+                record.name = intern(record.name, record.name)
+                record.assignment = intern(record.assignment, record.assignment)
+            for chunk_error in chunk_errors:
+                chunk_error.rebase(row_base, keep_line=line_budget != 0)
+                if chunk_error.has_line and line_budget > 0:
+                    line_budget -= 1
+            records.extend(chunk_records)
+            errors.extend(chunk_errors)
+            for row_num, fields in chunk_table.rows.items():
+                for col in interned_cols:
+                    fields[col] = intern(fields[col], fields[col])
+                table_data.rows.add(row_num + row_base, fields)
+            all_assignments.update(assignments)
+            row_base += row_count
+
+    table_data.row_count = row_base - 2
+    table_data.all_assignments = sorted(all_assignments)
+    return records, errors, table_data
+
+
+def _numpy_for(engine: str) -> Any:
+    """Return the numpy module if ``engine`` selects it.
+
+    Only an explicit "numpy" does: building the NumPy arrays costs more than
+    the vectorized work saves, so "auto" stays on the pure-Python path. Falls
+    back to the pure-Python path (returns None) when NumPy is not installed.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}' (expected one of {', '.join(ENGINES)})")
+    if engine != "numpy":
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if engine == "numpy":
+            logger.debug("NumPy is not installed; using the pure-Python engine.")
+        return None
+    return numpy
+
+
+def _numpy_dedupe_indices(
+    np: Any,
+    assignments: List[str],
+    emails: List[str],
+    dates: Any,
+) -> List[int]:
+    """Vectorized index selection for deduplicate_records.
+
+    Args:
+        np: The numpy module.
+        assignments: Assignment name per record.
+        emails: Email per record.
+        dates: int64 array of sortable requested dates per record.
+
+    Returns:
+        Indices of the surviving records, ordered by first appearance of their
+        key, with the earliest row winning ties on date.
+    """
+    # Key codes are handed out in order of first appearance, so sorting the
+    # winners by code reproduces dict insertion order.
+    codes: Dict[Tuple[str, str], int] = {}
+    keys = np.fromiter(
+        (codes.setdefault(key, len(codes)) for key in zip(assignments, emails)),
+        dtype=np.int64,
+        count=len(emails),
+    )
+    positions = np.arange(len(keys))
+    order = np.lexsort((positions, -dates, keys))
+    sorted_keys = keys[order]
+    first = np.empty(len(order), dtype=bool)
+    first[:1] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=first[1:])
+    return order[first].tolist()
+
+
+def deduplicate_records(
+    records: Records,
+    engine: str = "auto",
+    index: Optional[AssignmentIndex] = None,
+) -> Records:
+    """Keep only the latest date for each (Assignment, Email) combination.
+
+    Args:
+        records: List of extension records, or a RecordBatch.
+        engine: "python", "numpy", or "auto" (currently the same as
+            "python").
+        index: Optional AssignmentIndex that receives the surviving records.
+            It is the deduplication structure itself, so ``engine`` is not
+            used.
+
+    Returns:
+        Deduplicated records (new list or batch, does not mutate input). With
+        ``index``, a list in index order (assignment, then email) rather than
+        first-appearance order.
+    """
+    if index is not None:
+        index.update(records)
+        return index.records()
+
+    np = _numpy_for(engine)
+
+    if isinstance(records, RecordBatch):
+        if np is not None:
+            dates = np.asarray(records.requested, dtype=np.int64)
+            return records.take(
+                _numpy_dedupe_indices(np, records.assignments, records.emails, dates)
+            )
+        winners: Dict[Tuple[str, str], int] = {}
+        requested = records.requested
+        for index, key in enumerate(zip(records.assignments, records.emails)):
+            current = winners.get(key)
+            if current is None or requested[index] > requested[current]:
+                winners[key] = index
+        return records.take(winners.values())
+
+    if np is not None:
+        dates = np.array(
+            [record.requested_date for record in records], dtype="datetime64[us]"
+        ).view(np.int64)
+        indices = _numpy_dedupe_indices(
+            np,
+            [record.assignment for record in records],
+            [record.email for record in records],
+            dates,
+        )
+        return [records[index] for index in indices]
+
+    dedup: Dict[Tuple[str, str], ExtensionRecord] = {}
+
+    for record in records:
+        key = (record.assignment, record.email)
+
+        if key not in dedup:
+            dedup[key] = record
+        else:
+            # Keep the one with latest date
+            if record.requested_date > dedup[key].requested_date:
+                dedup[key] = record
+
+    return list(dedup.values())
+
+
+def _read_pickled(path: str) -> Iterator[Any]:
+    """Yield every object pickled back-to-back into ``path``."""
+    import pickle
+
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def deduplicate_records_external(
+    records: Iterable[ExtensionRecord],
+    memory_budget: int = EXTERNAL_DEDUP_BUDGET,
+    partitions: int = EXTERNAL_DEDUP_PARTITIONS,
+    temp_dir: Optional[str] = None,
+) -> Iterator[ExtensionRecord]:
+    """Deduplicate records that may not fit in memory.
+
+    Inputs of up to ``memory_budget`` records are deduplicated in memory.
+    Larger inputs are hash-partitioned by (Assignment, Email) into temporary
+    run files, each partition is deduplicated on its own with the same
+    "latest requested_date wins" rule, and the survivors are streamed back
+    in the order :func:`deduplicate_records` would return them.
+
+    Args:
+        records: Iterable of extension records (consumed once).
+        memory_budget: Maximum number of records held in memory at once.
+            Each partition must fit, so choose ``partitions`` accordingly.
+        partitions: Number of hash partitions to spill to.
+        temp_dir: Directory for the temporary run files.
+
+    Yields:
+        Deduplicated records.
+    """
+    import heapq
+    import pickle
+    import tempfile
+    import zlib
+
+    stream = iter(records)
+    head = list(itertools.islice(stream, memory_budget + 1))
+    if len(head) <= memory_budget:
+        yield from deduplicate_records(head, engine="python")
+        return
+
+    stream = itertools.chain(head, stream)
+    del head
+
+    with tempfile.TemporaryDirectory(prefix="extensions_dedupe_", dir=temp_dir) as workdir:
+        # Spill every record, tagged with its input position, to a partition
+        paths = [os.path.join(workdir, f"partition_{i}.pickle") for i in range(partitions)]
+        handles = [open(path, "wb") for path in paths]
+        try:
+            for position, record in enumerate(stream):
+                key = f"{record.assignment}\0{record.email}".encode("utf-8")
+                pickle.dump(
+                    (position, record),
+                    handles[zlib.crc32(key) % partitions],
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        finally:
+            for handle in handles:
+                handle.close()
+
+        # Deduplicate each partition, keeping the position where its key was
+        # first seen, and write the survivors out sorted by that position
+        runs: List[str] = []
+        for path in paths:
+            winners: Dict[Tuple[str, str], Tuple[int, ExtensionRecord]] = {}
+            for position, record in _read_pickled(path):
+                key = (record.assignment, record.email)
+                current = winners.get(key)
+                if current is None:
+                    winners[key] = (position, record)
+                elif record.requested_date > current[1].requested_date:
+                    winners[key] = (current[0], record)
+            os.remove(path)
+
+            if len(winners) > memory_budget:
+                logger.debug(
+                    f"Dedupe partition held {len(winners)} keys, over the "
+                    f"budget of {memory_budget}; consider more partitions."
+                )
+
+            run_path = f"{path}.run"
+            with open(run_path, "wb") as f:
+                for item in sorted(winners.values(), key=lambda item: item[0]):
+                    pickle.dump(item, f, protocol=pickle.HIGHEST_PROTOCOL)
+            runs.append(run_path)
+            del winners
+
+        for _, record in heapq.merge(*(_read_pickled(path) for path in runs)):
+            yield record
+
+
+class AssignmentIndex:
+    """Deduplicated records grouped by assignment and kept in email order.
+
+    :meth:`add` applies the same rule as :func:`deduplicate_records` (latest
+    date wins, the earliest row wins ties). Emails new to an assignment are
+    collected as a run and merged into its sorted email list the next time
+    the assignment is read; ``list.sort`` merges two presorted runs in linear
+    time, so adding a few records to a large bucket (an incremental run, a
+    ``--watch`` update) or loading records that are already in order never
+    costs a full sort. Reading the index gives create_output_files groups it
+    does not need to re-sort.
+    """
+
+    __slots__ = ("_records", "_emails", "_pending")
+
+    def __init__(self, records: Iterable[ExtensionRecord] = ()) -> None:
+        self._records: Dict[str, Dict[str, ExtensionRecord]] = {}
+        self._emails: Dict[str, List[str]] = {}
+        self._pending: Dict[str, List[str]] = {}
+        self.update(records)
+
+    def add(self, record: ExtensionRecord) -> bool:
+        """Add ``record`` unless a later request for its key is present.
+
+        Returns:
+            True if the record was added or replaced an earlier request.
+        """
+        by_email = self._records.get(record.assignment)
+        if by_email is None:
+            by_email = self._records[record.assignment] = {}
+            self._emails[record.assignment] = []
+        current = by_email.get(record.email)
+        if current is None:
+            self._pending.setdefault(record.assignment, []).append(record.email)
+        elif not record.requested_date > current.requested_date:
+            return False
+        by_email[record.email] = record
+        return True
+
+    def update(self, records: Iterable[ExtensionRecord]) -> None:
+        """Add every record in ``records``."""
+        for record in records:
+            self.add(record)
+
+    def _sorted_emails(self, assignment: str) -> List[str]:
+        emails = self._emails[assignment]
+        pending = self._pending.pop(assignment, None)
+        if pending:
+            pending.sort()
+            appended = not emails or emails[-1] < pending[0]
+            emails.extend(pending)
+            if not appended:
+                emails.sort()
+        return emails
+
+    def __len__(self) -> int:
+        return sum(len(by_email) for by_email in self._records.values())
+
+    def group(self, assignment: str) -> List[ExtensionRecord]:
+        """Return the records of ``assignment`` ordered by email."""
+        if assignment not in self._records:
+            return []
+        by_email = self._records[assignment]
+        return [by_email[email] for email in self._sorted_emails(assignment)]
+
+    def groups(self) -> Dict[str, List[ExtensionRecord]]:
+        """Return every assignment's records, in assignment then email order."""
+        return {assignment: self.group(assignment) for assignment in sorted(self._records)}
+
+    def records(self) -> List[ExtensionRecord]:
+        """Return all records in assignment then email order."""
+        return [record for group in self.groups().values() for record in group]
+
+    def with_records(self, records: Iterable[ExtensionRecord]) -> AssignmentIndex:
+        """Return an index of ``records`` laid out like this one.
+
+        ``records`` must correspond one-to-one, in order, to :meth:`records`
+        (e.g. the output of adjust_dates on it), so nothing is re-sorted.
+        """
+        replacement = AssignmentIndex()
+        remaining = iter(records)
+        for assignment in sorted(self._records):
+            emails = self._sorted_emails(assignment)
+            replacement._records[assignment] = {email: next(remaining) for email in emails}
+            replacement._emails[assignment] = list(emails)
+        return replacement
+
+
+def _next_sunday_ordinal(ordinal: int) -> int:
+    """Ordinal-day counterpart of get_next_sunday."""
+    # date.fromordinal(1) is a Monday, so (ordinal + 6) % 7 == weekday()
+    return ordinal + (6 - (ordinal + 6) % 7) % 7
+
+
+def _numpy_days_to_sunday(np: Any, days: Any) -> Any:
+    """Return how many days each ``datetime64[D]`` value is before Sunday."""
+    # 1970-01-01 was a Thursday, so (days since epoch + 3) % 7 == weekday()
+    weekday = (days.view(np.int64) + 3) % 7
+    return (6 - weekday) % 7
+
+
+def adjust_dates(records: Records, engine: str = "auto") -> Records:
+    """Adjust dates to Sunday, returning new records.
+
+    Args:
+        records: List of extension records, or a RecordBatch.
+        engine: "python", "numpy", or "auto" (currently the same as
+            "python").
+
+    Returns:
+        New records with adjusted dates (does not mutate input).
+    """
+    np = _numpy_for(engine)
+
+    if isinstance(records, RecordBatch):
+        if np is None:
+            return records.with_adjusted_dates(_next_sunday_ordinal)
+        ordinals = np.asarray(records.requested, dtype=np.int64)
+        # Ordinal 719163 is 1970-01-01, the datetime64 epoch
+        days = (ordinals - 719163).astype("datetime64[D]")
+        due = ordinals + _numpy_days_to_sunday(np, days)
+        adjusted = records.take(range(len(records)))
+        adjusted.original = array("l", adjusted.requested)
+        adjusted.due = array("l", due.tolist())
+        return adjusted
+
+    if np is not None:
+        days = np.array(
+            [record.requested_date for record in records], dtype="datetime64[D]"
+        )
+        deltas = _numpy_days_to_sunday(np, days).tolist()
+        steps = [timedelta(days=delta) for delta in range(7)]
+        return [
+            record.with_adjusted_date(
+                record.requested_date + steps[delta] if delta else record.requested_date
+            )
+            for record, delta in zip(records, deltas)
+        ]
+
+    result: List[ExtensionRecord] = []
+    for record in records:
+        adjusted = get_next_sunday(record.requested_date)
+        result.append(record.with_adjusted_date(adjusted))
+    return result
+
+
+def _without_adjustment(records: Records) -> List[ExtensionRecord]:
+    """Set due_date equal to requested_date for records without adjustment."""
+    return [
+        ExtensionRecord(
+            email=r.email,
+            name=r.name,
+            assignment=r.assignment,
+            requested_date=r.requested_date,
+            row_num=r.row_num,
+            original_date=r.requested_date,
+            due_date=r.requested_date,
+        )
+        for r in records
+    ]
+
+
+@functools.lru_cache(maxsize=FILENAME_CACHE_SIZE)
+def sanitize_filename(text: str) -> str:
+    """Convert text to valid filename.
+
+    Results are cached since the same assignment names recur across runs in
+    long-lived processes (``--watch``, ``serve``).
+
+    Args:
+        text: Text to sanitize.
+
+    Returns:
+        Sanitized filename string.
+    """
+    import re
+
+    filename = text.lower()
+    filename = re.sub(r"[^a-z0-9]+", "_", filename)
+    filename = filename.strip("_")
+    return filename
+
+
+# ---------------------------------------------------------------------------
+# Incremental Processing
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class IncrementalResult:
+    """Outcome of merging an input file into the incremental state store."""
+
+    records: List[ExtensionRecord]
+    errors: List[ParseError]
+    all_assignments: List[str]
+    # Assignments whose records changed this run; None means all of them
+    changed_assignments: Optional[Set[str]]
+    new_rows: int = 0
+    full_rebuild: bool = False
+    # False when the input was empty or its header was invalid
+    has_header: bool = True
+
+
+class _StateStore:
+    """SQLite-backed store of deduplicated records for --incremental runs."""
+
+    def __init__(self, path: str) -> None:
+        import sqlite3
+
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS records (
+                seq INTEGER PRIMARY KEY,
+                assignment TEXT NOT NULL,
+                email TEXT NOT NULL,
+                name TEXT NOT NULL,
+                requested INTEGER NOT NULL,
+                row_num INTEGER NOT NULL,
+                UNIQUE (assignment, email)
+            );
+            CREATE TABLE IF NOT EXISTS errors (
+                row INTEGER, message TEXT NOT NULL, line TEXT
+            );
+            CREATE TABLE IF NOT EXISTS assignments (name TEXT PRIMARY KEY);
+            """
+        )
+
+    def meta(self) -> Dict[str, str]:
+        return dict(self.connection.execute("SELECT key, value FROM meta"))
+
+    def set_meta(self, **values: Any) -> None:
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, str(value)) for key, value in values.items()],
+        )
+
+    def clear(self) -> None:
+        for table in ("meta", "records", "errors", "assignments"):
+            self.connection.execute(f"DELETE FROM {table}")
+
+    def merge(
+        self,
+        records: Iterable[ExtensionRecord],
+        errors: Iterable[ParseError],
+        assignments: Iterable[str],
+    ) -> None:
+        """Fold new rows in with the "latest requested_date wins" rule."""
+        self.connection.executemany(
+            """
+            INSERT INTO records (assignment, email, name, requested, row_num)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (assignment, email) DO UPDATE SET
+                name = excluded.name,
+                requested = excluded.requested,
+                row_num = excluded.row_num
+            WHERE excluded.requested > records.requested
+            """,
+            (
+                (r.assignment, r.email, r.name, r.requested_date.toordinal(), r.row_num)
+                for r in records
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO errors (row, message, line) VALUES (?, ?, ?)",
+            ((e.row, e.message, e.line) for e in errors),
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO assignments (name) VALUES (?)",
+            ((name,) for name in assignments),
+        )
+
+    def records(self) -> List[ExtensionRecord]:
+        dates: Dict[int, datetime] = {}
+        intern = {}.setdefault
+        records: List[ExtensionRecord] = []
+        for assignment, email, name, requested, row_num in self.connection.execute(
+            # Served in index order so AssignmentIndex loads them without sorting
+            "SELECT assignment, email, name, requested, row_num FROM records "
+            "ORDER BY assignment, email"
+        ):
+            date = dates.get(requested)
+            if date is None:
+                date = dates[requested] = datetime.fromordinal(requested)
+            records.append(
+                ExtensionRecord(
+                    intern(email, email), intern(name, name), intern(assignment, assignment),
+                    date, row_num,
+                )
+            )
+        return records
+
+    def errors(self) -> List[ParseError]:
+        return [
+            ParseError(message=message, row=row, line=line)
+            for row, message, line in self.connection.execute(
+                "SELECT row, message, line FROM errors ORDER BY rowid"
+            )
+        ]
+
+    def error_lines(self) -> int:
+        """Return how many stored errors kept their input line."""
+        (count,) = self.connection.execute(
+            "SELECT COUNT(*) FROM errors WHERE line IS NOT NULL"
+        ).fetchone()
+        return count
+
+    def assignments(self) -> List[str]:
+        return [
+            name
+            for (name,) in self.connection.execute(
+                "SELECT name FROM assignments ORDER BY name"
+            )
+        ]
+
+
+def _hash_prefix(data: Optional[mmap.mmap], length: int) -> str:
+    """Return the SHA-256 of the first ``length`` bytes of a mapped file."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    if data is not None:
+        block = 1 << 20
+        for start in range(0, length, block):
+            digest.update(data[start:min(start + block, length)])
+    return digest.hexdigest()
+
+
+def process_incremental(
+    path: Union[str, Path],
+    state_path: str,
+    columns: Optional[ColumnConfig] = None,
+    jobs: int = 1,
+    dry_run: bool = False,
+    fingerprint: str = "",
+    max_error_lines: Optional[int] = MAX_ERROR_LINES,
+) -> IncrementalResult:
+    """Parse only the rows appended to ``path`` since the previous run.
+
+    The state store remembers how many bytes of the input were processed,
+    a hash of those bytes, the header, and the deduplicated records. When
+    the processed prefix is unchanged, only the new bytes are parsed and
+    merged in; otherwise (first run, edited or replaced export, different
+    columns) the whole file is reparsed and the state rebuilt. Either way a
+    row that is still being written (after the last complete record) is
+    left for the next run.
+
+    Args:
+        path: Path to the export file.
+        state_path: Path to the SQLite state file.
+        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
+        jobs: Number of worker processes for a full reparse.
+        dry_run: If True, compute the result without saving the state.
+        fingerprint: Any other settings that affect the outputs; a change
+            forces a full rebuild.
+        max_error_lines: Keep the input line of at most this many rejected
+            rows across all runs. None keeps every line. A change forces a
+            full rebuild.
+
+    Returns:
+        An IncrementalResult with every deduplicated record and error so far.
+
+    Raises:
+        OSError, sqlite3.Error: If the input or state cannot be read.
+    """
+    import json
+    from pathlib import Path
+
+    if columns is None:
+        columns = DEFAULT_COLUMNS
+
+    if dry_run and not os.path.exists(state_path):
+        state_path = ":memory:"
+    store = _StateStore(state_path)
+    try:
+        with MappedLines(path) as source:
+            data = source._map
+            size = len(data) if data is not None else 0
+            meta = store.meta()
+            settings = json.dumps(
+                [columns.__dict__, fingerprint, max_error_lines], sort_keys=True
+            )
+
+            offset = int(meta.get("offset", -1))
+            resume = (
+                meta.get("version") == STATE_VERSION
+                and meta.get("input") == str(Path(path).resolve())
+                and meta.get("settings") == settings
+                and 0 < offset <= size
+                and meta.get("prefix_sha256") == _hash_prefix(data, offset)
+            )
+            if resume:
+                end = _complete_records_end(data, offset, size, meta["delimiter"])
+            if resume and offset < end:
+                col_map = json.loads(meta["col_map"])
+                # The cap covers every run; earlier runs used part of it
+                line_budget = (
+                    None
+                    if max_error_lines is None
+                    else max(0, max_error_lines - store.error_lines())
+                )
+                records, errors, table, assignments, row_count = _parse_file_chunk(
+                    str(path),
+                    (offset, end),
+                    meta["delimiter"],
+                    int(meta["header_len"]),
+                    col_map,
+                    columns,
+                    max_error_lines=line_budget,
+                )
+                row_base = int(meta["next_row"])
+                for record in records:
+                    record.row_num += row_base
+                for error in errors:
+                    error.rebase(row_base)
+                known = set(store.assignments())
+                store.merge(records, errors, assignments)
+                store.set_meta(
+                    offset=end,
+                    prefix_sha256=_hash_prefix(data, end),
+                    next_row=row_base + row_count,
+                )
+                changed = {record.assignment for record in records}
+                changed.update(assignments - known)
+                new_rows = len(table.rows)
+                full_rebuild = False
+            elif resume:
+                changed, new_rows, full_rebuild = set(), 0, False
+            else:
+                # Same sample of the leading lines process_extension_file uses
+                delimiter = (
+                    detect_delimiter(data[:PARALLEL_MIN_CHUNK_BYTES]) if data is not None else ","
+                )
+                end = _complete_records_end(data, 0, size, delimiter)
+                records, errors, table = process_extension_file(
+                    path,
+                    columns=columns,
+                    jobs=jobs,
+                    max_error_lines=max_error_lines,
+                    end=end,
+                )
+                store.clear()
+                if table is None:
+                    store.connection.rollback()
+                    return IncrementalResult(
+                        records, errors, [], None, full_rebuild=True, has_header=False
+                    )
+                store.merge(records, errors, table.all_assignments)
+                store.set_meta(
+                    version=STATE_VERSION,
+                    input=Path(path).resolve(),
+                    settings=settings,
+                    offset=end,
+                    prefix_sha256=_hash_prefix(data, end),
+                    delimiter=table.delimiter,
+                    header_len=len(table.header),
+                    col_map=json.dumps(table.col_map),
+                    next_row=2 + table.row_count,
+                )
+                changed, new_rows, full_rebuild = None, len(table.rows), True
+
+        result = IncrementalResult(
+            records=store.records(),
+            errors=store.errors(),
+            all_assignments=store.assignments(),
+            changed_assignments=changed,
+            new_rows=new_rows,
+            full_rebuild=full_rebuild,
+        )
+        if dry_run:
+            store.connection.rollback()
+        else:
+            store.connection.commit()
+        return result
+    finally:
+        store.connection.close()
+
+
+# ---------------------------------------------------------------------------
+# Output Functions
+# ---------------------------------------------------------------------------
+
+
+def create_output_files(
+    records: Records,
+    output_dir: str = "./extensions_output",
+    all_assignments: Optional[List[str]] = None,
+    dry_run: bool = False,
+    only_assignments: Optional[Set[str]] = None,
+    skip_unchanged: bool = True,
+    write_workers: int = 1,
+    groups: Optional[Dict[str, List[ExtensionRecord]]] = None,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Create CSV files per assignment.
+
+    Files whose content is identical to what was last written (according to
+    the SHA-256 manifest kept in the output directory) are left untouched so
+    synced shares and downstream importers do not see spurious changes. A
+    file whose size or modification time no longer matches the manifest was
+    changed by something else and is rewritten.
+
+    Args:
+        records: Extension records (list or RecordBatch) to write.
+        output_dir: Directory to write output files.
+        all_assignments: Optional list of all assignment names to include.
+        dry_run: If True, do not write files, just return what would be written.
+        only_assignments: If given, only these assignments' files (plus any
+            that are missing on disk) are rewritten; file_info still covers
+            every assignment.
+        skip_unchanged: If False, rewrite every file regardless of the
+            manifest.
+        write_workers: Number of threads rendering and writing files
+            concurrently, which hides per-file latency on network shares.
+        groups: Records already grouped by assignment and sorted by email
+            (e.g. FusedResult.groups). When given, ``records`` is not
+            regrouped or re-sorted.
+
+    Returns:
+        A tuple of (file_info, io_errors) where:
+        - file_info: List of dicts with assignment, filename, num_students,
+          dates, and ``written`` (False when the file was left unchanged)
+        - io_errors: List of error messages for I/O failures
+    """
+    import concurrent.futures
+    from pathlib import Path
+
+    io_errors: List[str] = []
+
+    if not dry_run:
+        try:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            io_errors.append(f"Unable to create output directory '{output_dir}': {exc}")
+            return [], io_errors
+
+    # Group by assignment
+    if groups is not None:
+        by_assignment: Dict[str, List[ExtensionRecord]] = dict(groups)
+    else:
+        by_assignment = defaultdict(list)
+        for record in records:
+            by_assignment[record.assignment].append(record)
+
+    if all_assignments:
+        for assignment in all_assignments:
+            if assignment not in by_assignment:
+                by_assignment[assignment] = []
+
+    previous = _load_manifest(output_dir) if skip_unchanged and not dry_run else {}
+    manifest: Dict[str, Dict[str, Any]] = {}
+
+    planned: List[Tuple[str, List[ExtensionRecord], str, str, bool]] = []
+    for assignment, assignment_records in sorted(by_assignment.items()):
+        # Create filename
+        filename = sanitize_filename(assignment)
+        filename = f"{filename}_extensions.csv"
+        filepath = os.path.join(output_dir, filename)
+
+        # Sort by email
+        if groups is None:
+            assignment_records.sort(key=lambda x: x.email)
+
+        unchanged = (
+            only_assignments is not None
+            and assignment not in only_assignments
+            and os.path.exists(filepath)
+            # A file edited since it was written is restored
+            and (filename not in previous or _on_disk_matches(filepath, previous[filename]))
+        )
+        if unchanged and filename in previous:
+            manifest[filename] = previous[filename]
+
+        planned.append((assignment, assignment_records, filename, filepath, unchanged))
+
+    def write(
+        plan: Tuple[str, List[ExtensionRecord], str, str, bool],
+    ) -> Tuple[Optional[Dict[str, Any]], bool, Optional[str]]:
+        _, assignment_records, filename, filepath, unchanged = plan
+        if dry_run or unchanged:
+            return None, False, None
+        return _write_assignment_file(filepath, assignment_records, previous.get(filename))
+
+    # Assignments whose names sanitize to the same file are written one
+    # after another in planned order, so the last one wins as in a serial
+    # run; only distinct files are written concurrently.
+    by_path: Dict[str, List[int]] = {}
+    for index, plan in enumerate(planned):
+        by_path.setdefault(plan[3], []).append(index)
+    for indices in by_path.values():
+        if len(indices) > 1:
+            names = ", ".join(repr(planned[index][0]) for index in indices)
+            logger.warning(
+                f"Assignments {names} all map to '{planned[indices[0]][2]}'; "
+                f"only the last one is kept."
             )
 
+    def write_path(
+        indices: List[int],
+    ) -> List[Tuple[int, Tuple[Optional[Dict[str, Any]], bool, Optional[str]]]]:
+        return [(index, write(planned[index])) for index in indices]
+
+    # Results are put back in planned order, so file_info and io_errors stay
+    # deterministic whether or not a thread pool is used.
+    if write_workers > 1 and len(by_path) > 1:
+        results: List[Tuple[Optional[Dict[str, Any]], bool, Optional[str]]] = [
+            (None, False, None)
+        ] * len(planned)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=write_workers) as pool:
+            for batch in pool.map(write_path, by_path.values()):
+                for index, result in batch:
+                    results[index] = result
+    else:
+        results = [write(plan) for plan in planned]
+
+    file_info: List[Dict[str, Any]] = []
+
+    for (assignment, assignment_records, filename, _, _), (entry, written, error) in zip(
+        planned, results
+    ):
+        if error:
+            io_errors.append(error)
+            continue
+        if entry is not None:
+            manifest[filename] = entry
+
+        # Collect info for summary
+        info = _assignment_file_info(assignment, filename, assignment_records)
+        info["written"] = written
+        file_info.append(info)
+
+    if not dry_run and skip_unchanged:
+        error = _save_manifest(output_dir, manifest)
+        if error:
+            io_errors.append(error)
+
     return file_info, io_errors
 
 
+def _assignment_file_info(
+    assignment: str,
+    filename: str,
+    records: List[ExtensionRecord],
+) -> Dict[str, Any]:
+    """Return the file_info entry of an assignment file (without ``written``)."""
+    dates = [r.due_date for r in records if r.due_date]
+    return {
+        "assignment": assignment,
+        "filename": filename,
+        "num_students": len(records),
+        "earliest_date": format_date(min(dates)) if dates else "N/A",
+        "latest_date": format_date(max(dates)) if dates else "N/A",
+    }
+
+
+def _assignment_rows(records: Iterable[ExtensionRecord]) -> Iterator[List[str]]:
+    """Yield the CSV rows of an assignment file."""
+    for record in records:
+        due_date_str = format_date(record.due_date) if record.due_date else ""
+        record_str = f"{record.email} - {record.name} - {record.assignment} - {due_date_str}"
+        yield [
+            record.email,
+            record.name,
+            record.assignment,
+            due_date_str,
+            record_str,
+        ]
+
+
+def _write_assignment_file(
+    filepath: str,
+    records: List[ExtensionRecord],
+    previous: Optional[Dict[str, Any]] = None,
+) -> Tuple[Optional[Dict[str, Any]], bool, Optional[str]]:
+    """Render and write one assignment CSV unless it matches ``previous``.
+
+    Args:
+        filepath: Destination path.
+        records: Records for the assignment, already sorted by email.
+        previous: Manifest entry from the last write, if any.
+
+    Returns:
+        A tuple of (manifest_entry, written, error_message).
+    """
+    import codecs
+
+    try:
+        # Only a file that is still as we left it can be skipped; hash the
+        # rendered rows first so it is never opened for writing.
+        if previous is not None and _on_disk_matches(filepath, previous):
+            sink = _HashingSink(prefix=codecs.BOM_UTF8)
+            _write_csv_content(sink, ASSIGNMENT_HEADER, _assignment_rows(records))
+            if previous.get("sha256") == sink.digest.hexdigest():
+                return previous, False, None
+        # Write CSV with BOM (UTF-8-sig), hashing each row as it is written
+        with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            sink = _HashingSink(prefix=codecs.BOM_UTF8, target=f)
+            _write_csv_content(sink, ASSIGNMENT_HEADER, _assignment_rows(records))
+        entry = {
+            "sha256": sink.digest.hexdigest(),
+            "size": sink.size,
+            "mtime_ns": os.stat(filepath).st_mtime_ns,
+        }
+        return entry, True, None
+    except OSError as exc:
+        return None, False, f"Failed to write '{filepath}': {exc}"
+
+
+def _on_disk_matches(filepath: str, entry: Dict[str, Any]) -> bool:
+    """Return True if ``filepath`` still has the size and mtime in ``entry``.
+
+    Entries written before modification times were recorded never match,
+    so those files are rewritten once.
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return False
+    return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+
+def _load_manifest(output_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Read the output manifest, treating a missing or corrupt one as empty."""
+    import json
+
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILENAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_manifest(output_dir: str, manifest: Dict[str, Dict[str, Any]]) -> Optional[str]:
+    """Write the output manifest, returning an error message on failure."""
+    import json
+
+    path = os.path.join(output_dir, MANIFEST_FILENAME)
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    except OSError as exc:
+        return f"Failed to write '{path}': {exc}"
+    return None
+
+
 def write_processed_copy(
     input_path: Optional[str],
     table_data: Optional[TableData],
@@ -590,6 +2521,8 @@ def write_processed_copy(
     Returns:
         A tuple of (output_path, error_message).
     """
+    from pathlib import Path
+
     if not input_path or not table_data:
         return None, "No input file or parsed table data available"
 
@@ -608,22 +2541,23 @@ def write_processed_copy(
     delimiter = table_data.delimiter
     processed_set = set(processed_rows)
 
-    try:
-        buffer = io.StringIO()
-        writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
-        writer.writerow(table_data.header)
-
-        for row in table_data.rows:
-            fields = row["fields"][:]
-            if row["row_num"] in processed_set:
+    def marked_rows() -> Iterator[List[str]]:
+        for row_num, fields in table_data.rows.items():
+            if row_num in processed_set:
                 if done_col >= len(fields):
                     fields.extend([""] * (done_col - len(fields) + 1))
                 fields[done_col] = "*"
-            writer.writerow(fields)
+            yield fields
 
-        contents = buffer.getvalue().rstrip("\n")
-        with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
-            f.write(contents)
+    try:
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8-sig",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as f:
+            _write_csv_content(f, table_data.header, marked_rows(), delimiter=delimiter)
     except OSError as exc:
         return None, str(exc)
 
@@ -631,7 +2565,7 @@ def write_processed_copy(
 
 
 def generate_summary(
-    records: List[ExtensionRecord],
+    records: Records,
     file_info: List[Dict[str, Any]],
     errors: List[ParseError],
     output_dir: str,
@@ -642,7 +2576,7 @@ def generate_summary(
     """Generate summary report.
 
     Args:
-        records: List of processed extension records.
+        records: Processed extension records (list or RecordBatch).
         file_info: List of file info dictionaries.
         errors: List of parsing errors.
         output_dir: Output directory path.
@@ -659,6 +2593,12 @@ def generate_summary(
     summary_lines.append("=" * 70)
     summary_lines.append(f"\nTotal Assignments: {len(file_info)}")
     summary_lines.append(f"Total Students: {len(records)}")
+    # Only create_output_files reports "written"; other callers' file_info
+    # entries may not have it
+    if not dry_run and any("written" in info for info in file_info):
+        written = sum(1 for info in file_info if info.get("written"))
+        summary_lines.append(f"Files Written: {written}")
+        summary_lines.append(f"Files Unchanged (skipped): {len(file_info) - written}")
     summary_lines.append(f"\nOutput Directory: {os.path.abspath(output_dir)}")
     if file_info:
         summary_lines.append("\n" + "-" * 70)
@@ -744,41 +2684,254 @@ def write_failure_report(
         return failures_path
 
     try:
-        buffer = io.StringIO()
-        writer = csv.writer(buffer, lineterminator="\n")
-        writer.writerow(["Row", "Message", "Line"])
-        for error in errors:
-            writer.writerow(
-                [
-                    error.row or "",
-                    error.message,
-                    error.line or "",
-                ]
+        with open(
+            failures_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as f:
+            _write_csv_content(
+                f,
+                ["Row", "Message", "Line"],
+                ([error.row or "", error.message, error.line or ""] for error in errors),
             )
-
-        contents = buffer.getvalue().rstrip("\n")
-        with open(failures_path, "w", newline="", encoding="utf-8") as f:
-            f.write(contents)
         return failures_path
     except OSError as exc:
         logger.error(f"Unable to write failure report: {exc}")
         return None
 
 
+# ---------------------------------------------------------------------------
+# Async Pipeline
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of :func:`process_extensions_async`."""
+
+    records: List[ExtensionRecord]
+    errors: List[ParseError]
+    file_info: List[Dict[str, Any]]
+    io_errors: List[str]
+    failures_path: Optional[str] = None
+    summary: str = ""
+    # False when the input was empty or its header was invalid
+    has_header: bool = True
+
+
+async def _aiter_chunks(stream: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield byte chunks from a reader with ``async read(n)`` or an async iterable."""
+    if hasattr(stream, "read"):
+        while True:
+            chunk = await stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in stream:
+            if chunk:
+                yield chunk
+
+
+async def process_extensions_async(
+    stream: Any,
+    output_dir: str = "./extensions_output",
+    columns: Optional[ColumnConfig] = None,
+    adjust: bool = True,
+    engine: str = "auto",
+    dry_run: bool = False,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunk_size: int = ASYNC_CHUNK_SIZE,
+) -> PipelineResult:
+    """Run the pipeline on an async byte stream without blocking the event loop.
+
+    The stream is read in chunks and decoded as UTF-8 (a BOM is skipped) on
+    the event loop, while parsing runs concurrently in ``executor`` as lines
+    arrive. Reading pauses when the parser falls behind. Deduplication, date
+    adjustment and all file writes also run in the executor.
+
+    Args:
+        stream: An ``asyncio.StreamReader`` (or any object with an
+            ``async read(n)`` method) or an async iterable of bytes.
+        output_dir: Directory to write output files.
+        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
+        adjust: Snap requested dates to the following Sunday.
+        engine: Engine for deduplication and date adjustment.
+        dry_run: If True, do not write files.
+        executor: Executor for the blocking work; None uses the loop's
+            default executor.
+        chunk_size: Bytes requested per read.
+
+    Returns:
+        A PipelineResult. When the header is missing or invalid, only
+        ``errors`` and ``has_header`` are filled in and nothing is written.
+    """
+    import asyncio
+    import codecs
+
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue = asyncio.Queue(maxsize=ASYNC_QUEUE_CHUNKS)
+
+    def queued_lines() -> Iterator[str]:
+        while True:
+            batch = asyncio.run_coroutine_threadsafe(chunks.get(), loop).result()
+            if batch is None:
+                return
+            yield from batch
+
+    def parse() -> Tuple[List[ExtensionRecord], List[ParseError], Optional[TableData]]:
+        lines = queued_lines()
+        try:
+            return process_extension_data(
+                (line for line in lines if line.strip()), columns=columns
+            )
+        finally:
+            # The parser stops early on a bad header; keep draining so the
+            # reader is never left waiting on a full queue
+            for _ in lines:
+                pass
+
+    parsing = loop.run_in_executor(executor, parse)
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in _aiter_chunks(stream, chunk_size):
+            *complete, pending = (pending + decoder.decode(chunk)).split("\n")
+            if complete:
+                await chunks.put([line.rstrip("\r") for line in complete])
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            await chunks.put([pending.rstrip("\r")])
+        await chunks.put(None)
+    except BaseException:
+        # Unblock the parser before propagating errors or cancellation
+        while not chunks.empty():
+            chunks.get_nowait()
+        chunks.put_nowait(None)
+        raise
+    records, errors, table_data = await parsing
+
+    if table_data is None:
+        return PipelineResult([], errors, [], [], has_header=False)
+
+    def transform() -> List[ExtensionRecord]:
+        deduped = deduplicate_records(records, engine=engine)
+        if adjust:
+            return list(adjust_dates(deduped, engine=engine))
+        return _without_adjustment(deduped)
+
+    records = await loop.run_in_executor(executor, transform)
+    file_info, io_errors = await loop.run_in_executor(
+        executor,
+        functools.partial(
+            create_output_files,
+            records,
+            output_dir,
+            all_assignments=table_data.all_assignments,
+            dry_run=dry_run,
+        ),
+    )
+    failures_path = await loop.run_in_executor(
+        executor, functools.partial(write_failure_report, errors, output_dir, dry_run=dry_run)
+    )
+    summary = await loop.run_in_executor(
+        executor,
+        functools.partial(
+            generate_summary,
+            records,
+            file_info,
+            errors,
+            output_dir,
+            io_errors=io_errors,
+            failures_path=failures_path,
+            dry_run=dry_run,
+        ),
+    )
+    return PipelineResult(records, errors, file_info, io_errors, failures_path, summary)
+
+
 # ---------------------------------------------------------------------------
 # Input Functions
 # ---------------------------------------------------------------------------
 
 
-def read_from_file(filename: str) -> Optional[List[str]]:
-    """Read data from a file.
+class MappedLines:
+    """Lines of a file exposed lazily through a read-only memory map.
+
+    Nothing is read up front: each line is sliced out of the map and decoded
+    only when iterated, so very large exports never have to fit in memory.
+    A leading UTF-8 BOM is skipped and both ``\\n`` and ``\\r\\n`` endings
+    are removed. With ``end``, only the lines before that byte offset are
+    read. Use as a context manager (or call :meth:`close`) to release the
+    map and file handle.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        encoding: str = "utf-8",
+        end: Optional[int] = None,
+    ) -> None:
+        import mmap
+        from pathlib import Path
+
+        self.path = Path(path)
+        self.encoding = encoding
+        self.end = end
+        self._file = open(self.path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        try:
+            if os.fstat(self._file.fileno()).st_size > 0:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+
+    def __iter__(self) -> Iterator[str]:
+        import codecs
+
+        data = self._map
+        if data is None:
+            return
+        data.seek(len(codecs.BOM_UTF8) if data[:3] == codecs.BOM_UTF8 else 0)
+        encoding = self.encoding
+        end = len(data) if self.end is None else min(self.end, len(data))
+        while data.tell() < end:
+            raw = data.readline()
+            if data.tell() > end:
+                raw = raw[: end - data.tell()]
+            if raw.endswith(b"\n"):
+                raw = raw[:-2] if raw.endswith(b"\r\n") else raw[:-1]
+            yield raw.decode(encoding)
+
+    def close(self) -> None:
+        """Release the memory map and the underlying file handle."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> MappedLines:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _resolve_input_path(filename: str) -> Optional[Path]:
+    """Locate an input file, falling back to the script's directory.
 
     Args:
         filename: Path to the file to read.
 
     Returns:
-        List of lines from the file, or None if reading failed.
+        The resolved path, or None (after logging the searched paths) if the
+        file does not exist.
     """
+    from pathlib import Path
+
     candidates: List[Path] = []
 
     primary = Path(filename).expanduser()
@@ -799,12 +2952,7 @@ def read_from_file(filename: str) -> Optional[List[str]]:
         tried_paths.append(resolved)
 
         if resolved.exists():
-            try:
-                with open(resolved, "r", encoding="utf-8") as f:
-                    return [line.rstrip("\n") for line in f.readlines()]
-            except OSError as e:
-                logger.error(f"Error reading file '{resolved}': {e}")
-                return None
+            return resolved
 
     tried = ", ".join(str(path) for path in tried_paths)
     logger.error(
@@ -814,6 +2962,98 @@ def read_from_file(filename: str) -> Optional[List[str]]:
     return None
 
 
+def expand_input_paths(
+    patterns: Iterable[str],
+    list_file: Optional[str] = None,
+) -> List[str]:
+    """Expand input paths, globs and an optional list file.
+
+    Args:
+        patterns: Paths or glob patterns. Patterns that match nothing are
+            kept as-is so the missing file is reported when it is opened.
+            Files written by :func:`write_processed_copy` (``*_PROCESSED``)
+            are skipped when matched by a glob.
+        list_file: Optional text file with one path or glob per line. Blank
+            lines and lines starting with ``#`` are ignored, and relative
+            entries are resolved against the list file's directory.
+
+    Returns:
+        The input paths in order, without duplicates.
+
+    Raises:
+        OSError: If ``list_file`` cannot be read.
+    """
+    import glob
+
+    entries = list(patterns)
+    if list_file:
+        base = os.path.dirname(os.path.abspath(list_file))
+        with open(list_file, encoding="utf-8-sig") as f:
+            for line in f:
+                entry = line.strip()
+                if entry and not entry.startswith("#"):
+                    entries.append(os.path.join(base, os.path.expanduser(entry)))
+
+    paths: List[str] = []
+    seen: Set[str] = set()
+    for entry in entries:
+        expanded = os.path.expanduser(entry)
+        matches = []
+        if glob.has_magic(expanded):
+            matches = [
+                path
+                for path in sorted(glob.glob(expanded))
+                if not os.path.splitext(path)[0].endswith("_PROCESSED")
+            ]
+        for path in matches or [entry]:
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def read_from_file(filename: str) -> Optional[List[str]]:
+    """Read data from a file.
+
+    Args:
+        filename: Path to the file to read.
+
+    Returns:
+        List of lines from the file, or None if reading failed.
+    """
+    resolved = _resolve_input_path(filename)
+    if resolved is None:
+        return None
+
+    try:
+        with open(resolved, "r", encoding="utf-8") as f:
+            return [line.rstrip("\n") for line in f]
+    except OSError as e:
+        logger.error(f"Error reading file '{resolved}': {e}")
+        return None
+
+
+def open_mapped_file(filename: str) -> Optional[MappedLines]:
+    """Open a file as a lazily decoded, memory-mapped line source.
+
+    Args:
+        filename: Path to the file to read.
+
+    Returns:
+        A MappedLines instance (to be closed by the caller), or None if the
+        file could not be found or opened.
+    """
+    resolved = _resolve_input_path(filename)
+    if resolved is None:
+        return None
+
+    try:
+        return MappedLines(resolved)
+    except OSError as e:
+        logger.error(f"Error reading file '{resolved}': {e}")
+        return None
+
+
 def read_from_clipboard() -> Optional[List[str]]:
     """Try to read from clipboard (requires pyperclip).
 
@@ -846,7 +3086,144 @@ def read_from_stdin() -> List[str]:
     except EOFError:
         pass
 
-    return lines
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class StageStats:
+    """Timing, row counts and memory for one pipeline stage."""
+
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    # Peak traced allocation while the stage ran (None unless tracing)
+    peak_bytes: Optional[int] = None
+
+
+class PipelineStats:
+    """Collects per-stage statistics for a pipeline run.
+
+    Pass an instance to :func:`main` (or use ``--stats``) to record wall
+    time, CPU time, rows in/out and, when ``trace_memory`` is set, the peak
+    memory allocated during each stage via ``tracemalloc``. Memory used by
+    ``--jobs`` worker processes is not traced.
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        self.trace_memory = trace_memory
+        self.stages: List[StageStats] = []
+
+    @contextlib.contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[StageStats]:
+        """Time the enclosed block as stage ``name``; set rows on the result."""
+        import tracemalloc
+
+        stats = StageStats(name=name, rows_in=rows_in)
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield stats
+        finally:
+            stats.wall_seconds = time.perf_counter() - wall
+            stats.cpu_seconds = time.process_time() - cpu
+            if self.trace_memory:
+                stats.peak_bytes = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+            self.stages.append(stats)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the collected stages as JSON-serializable data."""
+        return {
+            "stages": [stats.__dict__.copy() for stats in self.stages],
+            "total_wall_seconds": sum(stats.wall_seconds for stats in self.stages),
+            "total_cpu_seconds": sum(stats.cpu_seconds for stats in self.stages),
+        }
+
+    def format_table(self) -> str:
+        """Render the collected stages as a text table."""
+
+        def count(value: Optional[int]) -> str:
+            return "-" if value is None else f"{value:,}"
+
+        def megabytes(value: Optional[int]) -> str:
+            return "-" if value is None else f"{value / (1 << 20):.1f}"
+
+        lines = [
+            f"{'Stage':<16}{'Wall (s)':>10}{'CPU (s)':>10}{'Rows in':>12}"
+            f"{'Rows out':>12}{'Peak MiB':>10}",
+            "-" * 70,
+        ]
+        for stats in self.stages:
+            lines.append(
+                f"{stats.name:<16}{stats.wall_seconds:>10.3f}{stats.cpu_seconds:>10.3f}"
+                f"{count(stats.rows_in):>12}{count(stats.rows_out):>12}"
+                f"{megabytes(stats.peak_bytes):>10}"
+            )
+        totals = self.to_dict()
+        lines.append("-" * 70)
+        lines.append(
+            f"{'total':<16}{totals['total_wall_seconds']:>10.3f}"
+            f"{totals['total_cpu_seconds']:>10.3f}"
+        )
+        return "\n".join(lines)
+
+
+class _UntimedStats(PipelineStats):
+    """Stand-in PipelineStats for runs that did not ask for statistics.
+
+    Stages are neither timed nor kept.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(trace_memory=False)
+
+    @contextlib.contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[StageStats]:
+        yield StageStats(name=name, rows_in=rows_in)
+
+
+def write_profile_report(
+    profiler: Any,
+    stats_path: str,
+    top: int = PROFILE_TOP_N,
+) -> str:
+    """Save cProfile results and a hot-function text report.
+
+    Args:
+        profiler: A disabled ``cProfile.Profile`` instance.
+        stats_path: Where to write the binary pstats file.
+        top: Number of functions to list, by cumulative and own time.
+
+    Returns:
+        Path of the text report (``stats_path`` with ``.txt`` appended).
+    """
+    import pstats
+    from pathlib import Path
+
+    Path(stats_path).parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(stats_path)
+    report_path = stats_path + ".txt"
+    with open(report_path, "w", encoding="utf-8") as f:
+        report = pstats.Stats(stats_path, stream=f).strip_dirs()
+        f.write(f"Top {top} functions by cumulative time\n\n")
+        report.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        f.write(f"\nTop {top} functions by own time\n\n")
+        report.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return report_path
 
 
 # ---------------------------------------------------------------------------
@@ -854,6 +3231,33 @@ def read_from_stdin() -> List[str]:
 # ---------------------------------------------------------------------------
 
 
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts that may be zero but not negative."""
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """argparse type for durations that must be more than zero."""
+    import argparse
+
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {value!r}") from None
+    # "not >" also rejects nan, which would make every wait return at once
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be more than 0, got {value}")
+    return number
+
+
 def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments.
 
@@ -863,10 +3267,28 @@ def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
     Returns:
         Parsed arguments namespace.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--input-file",
-        help="Path to a tab-delimited MS Forms export to process.",
+        nargs="+",
+        action="extend",
+        metavar="PATH",
+        help="Path(s) or glob(s) of tab-delimited MS Forms exports to process. "
+        "With more than one input, each gets its own output subdirectory.",
+    )
+    parser.add_argument(
+        "--input-list",
+        metavar="FILE",
+        help="Text file listing one export path or glob per line (batch mode).",
+    )
+    parser.add_argument(
+        "--batch-jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Process batch inputs in N worker processes (default: 1).",
     )
     parser.add_argument(
         "--clipboard",
@@ -888,6 +3310,87 @@ def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Preview what would be done without writing any files.",
     )
+    parser.add_argument(
+        "--engine",
+        choices=PIPELINE_ENGINES,
+        default="auto",
+        help="Engine for deduplication and date adjustment (default: auto, "
+        "currently the pure-Python engine). 'fused' "
+        "parses, deduplicates and adjusts in a single pass; it cannot be "
+        "combined with --jobs, --incremental or --watch.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only parse rows appended to --input-file since the last run, "
+        "merging them with the saved state and rewriting only affected CSVs.",
+    )
+    parser.add_argument(
+        "--state-file",
+        metavar="PATH",
+        help=f"State store for --incremental (default: OUTPUT_DIR/{STATE_FILENAME}).",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and process new rows whenever --input-file changes "
+        "(implies --incremental). Stop with Ctrl+C.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=_positive_float,
+        default=WATCH_INTERVAL,
+        metavar="SECONDS",
+        help=f"How often --watch checks the input file (default: {WATCH_INTERVAL:g}).",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parse --input-file using N worker processes (default: 1).",
+    )
+    parser.add_argument(
+        "--write-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Write assignment CSVs using N threads (default: 1).",
+    )
+    parser.add_argument(
+        "--max-error-lines",
+        type=_non_negative_int,
+        default=MAX_ERROR_LINES,
+        metavar="N",
+        help="Keep the input line of at most N rejected rows for failures.csv; "
+        "later failures are listed by row and message only (default: no limit). "
+        "With --incremental the cap covers every run on the same state.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print per-stage wall/CPU time, row counts and peak memory.",
+    )
+    parser.add_argument(
+        "--stats-json",
+        action="store_true",
+        help="Like --stats, and also write stats.json to the output directory.",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Run under cProfile and write pstats data to PATH (relative to "
+        "the output directory) plus a top functions report to PATH.txt. "
+        "Written even with --dry-run.",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=PROFILE_TOP_N,
+        metavar="N",
+        help=f"Functions listed in the --profile report (default: {PROFILE_TOP_N}).",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -900,7 +3403,13 @@ def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Suppress non-essential output.",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.engine == "fused":
+        if args.jobs > 1:
+            parser.error("--engine fused cannot be combined with --jobs")
+        if args.incremental or args.watch:
+            parser.error("--engine fused cannot be combined with --incremental or --watch")
+    return args
 
 
 def _setup_logging(verbose: bool = False, quiet: bool = False) -> None:
@@ -924,18 +3433,38 @@ def _setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     )
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+def main(
+    argv: Optional[List[str]] = None,
+    stats: Optional[PipelineStats] = None,
+) -> int:
     """Main entry point for the CLI.
 
     Args:
         argv: Command line arguments. Defaults to sys.argv[1:].
+        stats: Optional PipelineStats that receives per-stage statistics.
+            One is created automatically for ``--stats``/``--stats-json``
+            and ``--profile``; otherwise stages are not timed.
 
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
+    import json
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "serve":
+        return serve_main(argv[1:])
+
     args = parse_arguments(argv)
     _setup_logging(verbose=args.verbose, quiet=args.quiet)
 
+    report_stats = args.stats or args.stats_json
+    if stats is None:
+        if report_stats or args.profile:
+            stats = PipelineStats(trace_memory=report_stats)
+        else:
+            stats = _UntimedStats()
+
     logger.info("=" * 70)
     logger.info("MS Forms Extension Request Processor")
     logger.info("=" * 70)
@@ -943,108 +3472,323 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.dry_run:
         logger.info("[DRY RUN] No files will be written.")
 
-    lines: Optional[List[str]] = None
+    lines: Optional[Iterable[str]] = None
+    input_path: Optional[Path] = None
+    batch_paths: Optional[List[str]] = None
 
-    if args.input_file:
-        lines = read_from_file(args.input_file)
-    elif args.clipboard:
-        lines = read_from_clipboard()
-        if lines is None:
-            logger.error("Clipboard support is unavailable (pyperclip not installed).")
+    with stats.stage("read") as stage:
+        if args.input_file or args.input_list:
+            try:
+                paths = expand_input_paths(args.input_file or (), args.input_list)
+            except OSError as exc:
+                logger.error(f"Error reading input list '{args.input_list}': {exc}")
+                return 1
+            if not paths:
+                logger.error("No input files matched")
+                return 1
+            if len(paths) > 1 or args.input_list:
+                if args.watch:
+                    logger.error("--watch supports a single --input-file")
+                    return 1
+                if args.state_file:
+                    logger.error("--state-file cannot be used with multiple inputs")
+                    return 1
+                batch_paths = paths
+                stage.rows_out = len(paths)
+            else:
+                input_path = _resolve_input_path(paths[0])
+                if input_path is None:
+                    return 1
+        elif args.watch:
+            logger.error("--watch requires --input-file")
             return 1
-    else:
-        # Fallback to the interactive workflow when no arguments are supplied.
-        logger.info("\nHow would you like to provide data?")
-        logger.info("1. Paste directly (type/paste into terminal)")
-        logger.info("2. Read from file")
-
-        choice = input("\nSelect option (1 or 2): ").strip()
-
-        if choice == "1":
-            lines = read_from_stdin()
-        elif choice == "2":
-            filename = input(
-                "\nEnter filename (e.g., extension_requests.txt): "
-            ).strip()
-            lines = read_from_file(filename)
+        elif args.clipboard:
+            lines = read_from_clipboard()
+            if lines is None:
+                logger.error("Clipboard support is unavailable (pyperclip not installed).")
+                return 1
         else:
-            logger.error("Invalid option")
-            return 1
+            # Fallback to the interactive workflow when no arguments are supplied.
+            logger.info("\nHow would you like to provide data?")
+            logger.info("1. Paste directly (type/paste into terminal)")
+            logger.info("2. Read from file")
+
+            choice = input("\nSelect option (1 or 2): ").strip()
+
+            if choice == "1":
+                lines = read_from_stdin()
+            elif choice == "2":
+                filename = input(
+                    "\nEnter filename (e.g., extension_requests.txt): "
+                ).strip()
+                lines = read_from_file(filename)
+            else:
+                logger.error("Invalid option")
+                return 1
+        # File input is streamed from a memory map while parsing
+        if lines is not None:
+            stage.rows_out = len(lines)
+
+    if batch_paths is not None:
+        run = functools.partial(_run_batch, args, batch_paths, stats)
+    elif args.watch:
+        run = functools.partial(_run_watch, args, input_path, stats)
+    else:
 
-    if not lines or not any(line.strip() for line in lines):
-        logger.error("No data provided")
-        return 1
+        def run() -> int:
+            return _run_pipeline(args, input_path, lines, stats).exit_code
+
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            exit_code = profiler.runcall(run)
+        finally:
+            profile_path = os.path.join(args.output_dir, args.profile)
+            try:
+                report_path = write_profile_report(
+                    profiler, profile_path, top=args.profile_top
+                )
+                logger.info(f"[OK] Wrote profile to {profile_path} ({report_path})")
+            except OSError as exc:
+                logger.error(f"Failed to write profile: {exc}")
+    else:
+        exit_code = run()
+
+    if report_stats:
+        logger.info(stats.format_table())
+        if args.stats_json and not args.dry_run:
+            stats_path = os.path.join(args.output_dir, "stats.json")
+            try:
+                with open(stats_path, "w", encoding="utf-8") as f:
+                    json.dump(stats.to_dict(), f, indent=2)
+                logger.info(f"[OK] Wrote stage statistics to {stats_path}")
+            except OSError as exc:
+                logger.error(f"Failed to write stage statistics: {exc}")
+
+    return exit_code
 
-    # Remove empty lines from start/end
-    lines = [line for line in lines if line.strip()]
 
-    # Process
+@dataclass
+class RunTotals:
+    """Exit code and counts of one pipeline run, rolled up by batch mode."""
+
+    exit_code: int = 0
+    # Input rows parsed (new rows only with --incremental)
+    rows: int = 0
+    # Deduplicated records written to the per-assignment files
+    students: int = 0
+    rejected: int = 0
+    files_written: int = 0
+
+
+def _run_pipeline(
+    args: argparse.Namespace,
+    input_path: Optional[Path],
+    lines: Optional[Iterable[str]],
+    stats: PipelineStats,
+) -> RunTotals:
+    """Run parse → dedupe → adjust → outputs → summary for one input.
+
+    Args:
+        args: Parsed command line arguments.
+        input_path: Resolved input file, or None when ``lines`` is given.
+        lines: Input lines from the clipboard or stdin.
+        stats: Receives per-stage statistics.
+
+    Returns:
+        The run's RunTotals; ``exit_code`` is 0 for success, non-zero for
+        errors.
+    """
+    # Process, skipping empty lines. File input is streamed from a memory
+    # map rather than loaded up front.
     logger.info("\nProcessing...")
-    records, errors, table_data = process_extension_data(lines)
+    totals = RunTotals()
+    incremental: Optional[IncrementalResult] = None
+    fused = args.engine == "fused"
+    engine = "python" if args.engine == "fused" else args.engine
+    groups: Optional[Dict[str, List[ExtensionRecord]]] = None
+    index: Optional[AssignmentIndex] = None
+    with stats.stage("parse") as stage:
+        if fused:
+            if input_path is not None:
+                try:
+                    with MappedLines(input_path) as source:
+                        result = process_extensions_fused(
+                            (line for line in source if line.strip()),
+                            adjust=not args.no_adjust,
+                            max_error_lines=args.max_error_lines,
+                        )
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.error(f"Error reading file '{input_path}': {e}")
+                    totals.exit_code = 1
+                    return totals
+            else:
+                # Clipboard and stdin lines are already decoded
+                result = process_extensions_fused(
+                    (line for line in (lines or ()) if line.strip()),
+                    adjust=not args.no_adjust,
+                    max_error_lines=args.max_error_lines,
+                )
+            records, errors, table_data = result.records, result.errors, result.table_data
+            groups = result.groups
+            has_header = table_data is not None
+        elif args.incremental:
+            if input_path is None:
+                logger.error("--incremental requires --input-file")
+                totals.exit_code = 1
+                return totals
+            import sqlite3
+            from pathlib import Path
+
+            state_path = args.state_file or os.path.join(args.output_dir, STATE_FILENAME)
+            try:
+                if not args.dry_run:
+                    Path(state_path).parent.mkdir(parents=True, exist_ok=True)
+                incremental = process_incremental(
+                    input_path,
+                    state_path,
+                    jobs=args.jobs,
+                    dry_run=args.dry_run,
+                    fingerprint=f"no_adjust={args.no_adjust}",
+                    max_error_lines=args.max_error_lines,
+                )
+            except (OSError, UnicodeDecodeError, sqlite3.Error) as e:
+                logger.error(f"Error during incremental processing of '{input_path}': {e}")
+                totals.exit_code = 1
+                return totals
+            records, errors, table_data = incremental.records, incremental.errors, None
+            has_header = incremental.has_header
+            stage.rows_in = incremental.new_rows
+        elif input_path is not None:
+            try:
+                records, errors, table_data = process_extension_file(
+                    input_path, jobs=args.jobs, max_error_lines=args.max_error_lines
+                )
+            except (OSError, UnicodeDecodeError) as e:
+                logger.error(f"Error reading file '{input_path}': {e}")
+                totals.exit_code = 1
+                return totals
+            has_header = table_data is not None
+        else:
+            records, errors, table_data = process_extension_data(
+                (line for line in (lines or ()) if line.strip()),
+                max_error_lines=args.max_error_lines,
+            )
+            has_header = table_data is not None
+        if table_data is not None:
+            stage.rows_in = table_data.row_count
+        stage.rows_out = len(records)
+    totals.rows = stage.rows_in or 0
+    totals.rejected = len(errors)
+
+    if not has_header and not errors:
+        logger.error("No data provided")
+        totals.exit_code = 1
+        return totals
 
     if not records and errors:
         logger.error("\nFailed to parse data:")
         for error in errors:
             logger.error(f"  * {error.message}")
-        return 1
+        totals.exit_code = 1
+        return totals
 
     if not records and not errors:
         logger.info("\nNo new extension requests to process (all rows already marked DONE?).")
 
-    logger.info(f"[OK] Parsed {len(records)} records")
-
-    # Deduplicate
-    original_count = len(records)
-    records = deduplicate_records(records)
-    if len(records) < original_count:
+    if incremental is not None:
+        if incremental.full_rebuild:
+            logger.info(f"[OK] Rebuilt incremental state from {incremental.new_rows} rows")
+        else:
+            logger.info(f"[OK] Merged {incremental.new_rows} new rows into incremental state")
+        logger.info(f"[OK] {len(records)} deduplicated records")
+        index = AssignmentIndex(records)
+        records = index.records()
+    elif fused:
         logger.info(
-            f"[OK] After deduplication: {len(records)} records "
-            f"(removed {original_count - len(records)} duplicates)"
+            f"[OK] Parsed, deduplicated and adjusted {len(records)} records in one pass"
         )
     else:
-        logger.info("[OK] No duplicates found")
+        logger.info(f"[OK] Parsed {len(records)} records")
+
+        # Deduplicate
+        original_count = len(records)
+        with stats.stage("dedupe", rows_in=original_count) as stage:
+            index = AssignmentIndex()
+            records = deduplicate_records(records, engine=engine, index=index)
+            stage.rows_out = len(records)
+        if len(records) < original_count:
+            logger.info(
+                f"[OK] After deduplication: {len(records)} records "
+                f"(removed {original_count - len(records)} duplicates)"
+            )
+        else:
+            logger.info("[OK] No duplicates found")
 
     # Adjust dates
-    if not args.no_adjust:
-        records = adjust_dates(records)
-        adjusted_count = sum(
-            1 for r in records if r.original_date != r.due_date
-        )
-        logger.info(f"[OK] Adjusted {adjusted_count} dates to Sunday")
-    else:
-        # Set due_date equal to requested_date for records without adjustment
-        records = [
-            ExtensionRecord(
-                email=r.email,
-                name=r.name,
-                assignment=r.assignment,
-                requested_date=r.requested_date,
-                row_num=r.row_num,
-                original_date=r.requested_date,
-                due_date=r.requested_date,
-            )
-            for r in records
-        ]
-        logger.info("[OK] Skipped Sunday adjustment (--no-adjust)")
+    if not fused:
+        with stats.stage("adjust", rows_in=len(records)) as stage:
+            if not args.no_adjust:
+                records = adjust_dates(records, engine=engine)
+                adjusted_count = sum(
+                    1 for r in records if r.original_date != r.due_date
+                )
+                logger.info(f"[OK] Adjusted {adjusted_count} dates to Sunday")
+            else:
+                records = _without_adjustment(records)
+                logger.info("[OK] Skipped Sunday adjustment (--no-adjust)")
+            stage.rows_out = len(records)
+        if index is not None:
+            index = index.with_records(records)
+            groups = index.groups()
 
     # Create output files
     output_dir = args.output_dir
-    all_assignments = table_data.all_assignments if table_data else None
-    file_info, io_errors = create_output_files(
-        records, output_dir, all_assignments=all_assignments, dry_run=args.dry_run
-    )
-    logger.info(f"[OK] Created {len(file_info)} CSV files")
+    if incremental is not None:
+        all_assignments = incremental.all_assignments
+        only_assignments = incremental.changed_assignments
+    else:
+        all_assignments = table_data.all_assignments if table_data else None
+        only_assignments = None
+    with stats.stage("write-outputs", rows_in=len(records)) as stage:
+        file_info, io_errors = create_output_files(
+            records,
+            output_dir,
+            all_assignments=all_assignments,
+            dry_run=args.dry_run,
+            only_assignments=only_assignments,
+            write_workers=args.write_workers,
+            groups=groups,
+        )
+        written_count = sum(1 for info in file_info if info.get("written"))
+        stage.rows_out = written_count
+    totals.students = len(records)
+    totals.files_written = written_count
+    if args.dry_run:
+        logger.info(f"[OK] Created {len(file_info)} CSV files")
+    else:
+        logger.info(
+            f"[OK] Wrote {written_count} CSV files "
+            f"({len(file_info) - written_count} unchanged)"
+        )
 
     processed_copy_path: Optional[str] = None
     processed_copy_error: Optional[str] = None
-    if args.input_file and table_data:
-        processed_rows = {record.row_num for record in records}
-        processed_copy_path, processed_copy_error = write_processed_copy(
-            args.input_file,
-            table_data,
-            processed_rows,
-            dry_run=args.dry_run,
-        )
+    if incremental is not None:
+        logger.info("[OK] Skipped processed input copy (not available with --incremental)")
+    elif input_path is not None and table_data:
+        with stats.stage("processed-copy", rows_in=len(table_data.rows)) as stage:
+            processed_rows = {record.row_num for record in records}
+            processed_copy_path, processed_copy_error = write_processed_copy(
+                str(input_path),
+                table_data,
+                processed_rows,
+                dry_run=args.dry_run,
+            )
+            if processed_copy_path:
+                stage.rows_out = len(table_data.rows)
         if processed_copy_path:
             logger.info(f"[OK] Wrote processed input copy to {processed_copy_path}")
         elif processed_copy_error:
@@ -1052,26 +3796,489 @@ def main(argv: Optional[List[str]] = None) -> int:
                 f"[WARN] Unable to write processed input copy: {processed_copy_error}"
             )
 
-    failures_path = write_failure_report(errors, output_dir, dry_run=args.dry_run)
+    with stats.stage("failures", rows_in=len(errors)) as stage:
+        failures_path = write_failure_report(errors, output_dir, dry_run=args.dry_run)
+        stage.rows_out = len(errors) if failures_path else 0
     if failures_path:
         logger.info(f"[OK] Wrote rejected rows to {failures_path}")
 
     # Summary
-    generate_summary(
-        records,
-        file_info,
-        errors,
-        output_dir,
-        io_errors=io_errors,
-        failures_path=failures_path,
-        dry_run=args.dry_run,
-    )
+    with stats.stage("summary", rows_in=len(records)):
+        generate_summary(
+            records,
+            file_info,
+            errors,
+            output_dir,
+            io_errors=io_errors,
+            failures_path=failures_path,
+            dry_run=args.dry_run,
+        )
 
     # Return appropriate exit code
     if io_errors:
+        totals.exit_code = 1
+    return totals
+
+
+# ---------------------------------------------------------------------------
+# Watch Mode
+# ---------------------------------------------------------------------------
+
+
+def watch_input(
+    path: Union[str, Path],
+    on_change: Callable[[], Any],
+    interval: float = WATCH_INTERVAL,
+    stop: Optional[threading.Event] = None,
+) -> None:
+    """Call ``on_change`` now and again whenever ``path`` changes.
+
+    The file is polled with ``os.stat`` (modification time, size and inode),
+    which works on every platform and on network shares where change
+    notifications are unreliable. A change is only acted on once the file
+    looks the same for two consecutive polls, so a half-written export is not
+    picked up. A missing file (e.g. while it is being replaced) is ignored.
+
+    Args:
+        path: File to watch.
+        on_change: Called with no arguments for the initial run and for every
+            change. Exceptions are logged and watching continues.
+        interval: Seconds between polls.
+        stop: Event that ends the loop when set. Without one, the loop runs
+            until interrupted.
+
+    Raises:
+        ValueError: If ``interval`` is not positive (the loop would spin).
+    """
+    import threading
+
+    if not interval > 0:
+        raise ValueError(f"interval must be more than 0, got {interval}")
+    if stop is None:
+        stop = threading.Event()
+
+    def signature() -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def run() -> None:
+        try:
+            on_change()
+        except Exception as exc:  # keep watching after a failed run
+            logger.exception(f"Error processing '{path}': {exc}")
+
+    processed = pending = signature()
+    run()
+    while not stop.wait(interval):
+        current = signature()
+        if current is None or current == processed:
+            pending = current
+            continue
+        if current != pending:
+            # Changed since the last poll; wait for the writer to finish
+            pending = current
+            continue
+        processed = current
+        run()
+
+
+def _run_watch(
+    args: argparse.Namespace,
+    input_path: Path,
+    stats: PipelineStats,
+) -> int:
+    """Run the incremental pipeline each time ``input_path`` changes.
+
+    ``args`` is left unchanged. ``stats`` keeps the stages recorded before
+    watching started plus those of the latest run only.
+
+    Returns:
+        The exit code of the last run once interrupted with Ctrl+C.
+    """
+    import argparse
+
+    args = argparse.Namespace(**vars(args))
+    args.incremental = True
+    exit_codes: List[int] = []
+    first_run_stage = len(stats.stages)
+
+    def on_change() -> None:
+        del stats.stages[first_run_stage:]
+        exit_codes.append(_run_pipeline(args, input_path, None, stats).exit_code)
+        logger.info(f"\nWatching {input_path} for changes (Ctrl+C to stop)...")
+
+    try:
+        watch_input(input_path, on_change, interval=args.watch_interval)
+    except KeyboardInterrupt:
+        logger.info("\nStopped watching.")
+    return exit_codes[-1] if exit_codes else 1
+
+
+# ---------------------------------------------------------------------------
+# HTTP Service
+# ---------------------------------------------------------------------------
+
+
+def process_export(
+    text: str,
+    adjust: bool = True,
+    engine: str = "auto",
+    columns: Optional[ColumnConfig] = None,
+) -> Optional[Dict[str, Any]]:
+    """Run the whole pipeline on an export held in memory, writing nothing.
+
+    Args:
+        text: The pasted or uploaded export.
+        adjust: Snap requested dates to the following Sunday.
+        engine: Engine for deduplication and date adjustment.
+        columns: Column configuration. Defaults to DEFAULT_COLUMNS.
+
+    Returns:
+        JSON-serializable result with ``records`` (count after
+        deduplication), ``assignments`` (file info), ``files`` (CSV content
+        by filename) and ``errors``, or None if the export has no header
+        row.
+    """
+    import io
+
+    records, errors, table_data = process_extension_data(
+        (line for line in text.splitlines() if line.strip()), columns=columns
+    )
+    if table_data is None and not errors:
+        return None
+
+    index = AssignmentIndex()
+    records = deduplicate_records(records, engine=engine, index=index)
+    records = adjust_dates(records, engine=engine) if adjust else _without_adjustment(records)
+    groups = index.with_records(records).groups()
+    for assignment in table_data.all_assignments if table_data else ():
+        groups.setdefault(assignment, [])
+
+    file_info: List[Dict[str, Any]] = []
+    files: Dict[str, str] = {}
+    for assignment, group in sorted(groups.items()):
+        filename = f"{sanitize_filename(assignment)}_extensions.csv"
+        buffer = io.StringIO()
+        _write_csv_content(buffer, ASSIGNMENT_HEADER, _assignment_rows(group))
+        files[filename] = buffer.getvalue()
+        file_info.append(_assignment_file_info(assignment, filename, group))
+
+    return {
+        "records": len(records),
+        "assignments": file_info,
+        "files": files,
+        "errors": [error.to_dict() for error in errors],
+    }
+
+
+def make_server(host: str = SERVE_HOST, port: int = SERVE_PORT) -> Any:
+    """Create the HTTP server used by the ``serve`` subcommand.
+
+    Endpoints:
+        ``GET /health`` returns ``{"status": "ok"}``.
+        ``POST /process`` takes the export as the request body and returns
+        the result of :func:`process_export` as JSON. Query parameters
+        ``adjust=0`` and ``engine=...`` mirror ``--no-adjust`` and
+        ``--engine``.
+
+    Requests are handled on separate threads of one process, so the date and
+    filename caches stay warm between requests. An unexpected error while
+    processing a request is logged and answered with a JSON 500 response.
+
+    Args:
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free port.
+
+    Returns:
+        A ``ThreadingHTTPServer``; call ``serve_forever()`` to run it.
+    """
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    class ExtensionRequestHandler(BaseHTTPRequestHandler):
+        server_version = "process-extensions"
+
+        def send_json(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if urlsplit(self.path).path == "/health":
+                self.send_json(200, {"status": "ok"})
+            else:
+                self.send_json(404, {"error": "Not found"})
+
+        def do_POST(self) -> None:
+            url = urlsplit(self.path)
+            if url.path != "/process":
+                self.send_json(404, {"error": "Not found"})
+                return
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            engine = query.get("engine", "auto")
+            if engine not in ENGINES:
+                self.send_json(400, {"error": f"engine must be one of {', '.join(ENGINES)}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", ""))
+            except ValueError:
+                self.send_json(411, {"error": "Content-Length required"})
+                return
+            if length < 0:
+                self.send_json(400, {"error": "Content-Length must not be negative"})
+                return
+            if length > SERVE_MAX_BYTES:
+                self.send_json(413, {"error": f"Export larger than {SERVE_MAX_BYTES} bytes"})
+                return
+            try:
+                text = self.rfile.read(length).decode("utf-8-sig")
+            except UnicodeDecodeError:
+                self.send_json(400, {"error": "Export must be UTF-8 text"})
+                return
+
+            try:
+                result = process_export(
+                    text, adjust=query.get("adjust", "1") != "0", engine=engine
+                )
+            except Exception as exc:  # keep serving other requests
+                logger.exception(f"Unexpected error processing request: {exc}")
+                self.send_json(500, {"error": "Internal server error"})
+                return
+            if result is None:
+                self.send_json(400, {"error": "No data provided"})
+            else:
+                self.send_json(200, result)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return ThreadingHTTPServer((host, port), ExtensionRequestHandler)
+
+
+def serve_main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``serve`` subcommand.
+
+    Args:
+        argv: Arguments after ``serve``.
+
+    Returns:
+        Exit code once the server is stopped with Ctrl+C.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="process_extensions.py serve",
+        description="Serve the extension processor over local HTTP.",
+    )
+    parser.add_argument("--host", default=SERVE_HOST, help=f"Default: {SERVE_HOST}.")
+    parser.add_argument(
+        "--port", type=int, default=SERVE_PORT, help=f"Default: {SERVE_PORT}."
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log each request.")
+    parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Suppress non-essential output."
+    )
+    args = parser.parse_args(argv)
+    _setup_logging(verbose=args.verbose, quiet=args.quiet)
+
+    try:
+        server = make_server(args.host, args.port)
+    except OSError as exc:
+        logger.error(f"Unable to listen on {args.host}:{args.port}: {exc}")
         return 1
+    host, port = server.server_address[:2]
+    logger.info(f"Serving on http://{host}:{port}/ (POST /process, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("\nStopped serving.")
+    finally:
+        server.server_close()
     return 0
 
 
+# ---------------------------------------------------------------------------
+# Batch Processing
+# ---------------------------------------------------------------------------
+
+
+def _batch_output_dirs(paths: List[str], output_dir: str) -> List[str]:
+    """Pick a distinct output subdirectory for each batch input."""
+    from pathlib import Path
+
+    dirs: List[str] = []
+    used: Set[str] = set()
+    for path in paths:
+        base = sanitize_filename(Path(path).stem) or "input"
+        name = base
+        suffix = 2
+        while name in used:
+            name = f"{base}_{suffix}"
+            suffix += 1
+        used.add(name)
+        dirs.append(os.path.join(output_dir, name))
+    return dirs
+
+
+def _run_batch_item(
+    args: argparse.Namespace,
+    filename: str,
+    output_dir: str,
+) -> Dict[str, Any]:
+    """Run the pipeline for one batch input (in this or a worker process).
+
+    Returns:
+        A roll-up entry with the input, output directory, exit code, the
+        run's RunTotals under ``"totals"`` and its wall and CPU seconds.
+    """
+    import argparse
+
+    item_args = argparse.Namespace(**vars(args))
+    item_args.output_dir = output_dir
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    input_path = _resolve_input_path(filename)
+    if input_path is None:
+        totals = RunTotals(exit_code=1)
+    else:
+        logger.info(f"\n[{filename}] -> {output_dir}")
+        try:
+            totals = _run_pipeline(item_args, input_path, None, _UntimedStats())
+        except Exception as exc:  # keep the rest of the batch going
+            logger.exception(f"Unexpected error processing '{filename}': {exc}")
+            totals = RunTotals(exit_code=1)
+    return {
+        "input": filename,
+        "output_dir": output_dir,
+        "exit_code": totals.exit_code,
+        "totals": totals,
+        "wall_seconds": time.perf_counter() - wall_start,
+        "cpu_seconds": time.process_time() - cpu_start,
+    }
+
+
+def _run_batch(
+    args: argparse.Namespace,
+    paths: List[str],
+    stats: PipelineStats,
+) -> int:
+    """Process several exports, each into its own output subdirectory.
+
+    Args:
+        args: Parsed command line arguments.
+        paths: Input files to process.
+        stats: Receives one stage per input with its totals.
+
+    Returns:
+        0 if every input succeeded, otherwise 1.
+    """
+    output_dirs = _batch_output_dirs(paths, args.output_dir)
+    logger.info(f"\nProcessing {len(paths)} exports...")
+
+    if args.batch_jobs > 1 and len(paths) > 1:
+        import concurrent.futures
+
+        workers = min(args.batch_jobs, len(paths))
+        # Spawned workers do not inherit the parent's logging setup
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_setup_logging,
+            initargs=(args.verbose, args.quiet),
+        ) as pool:
+            results = list(
+                pool.map(_run_batch_item, itertools.repeat(args), paths, output_dirs)
+            )
+    else:
+        results = [
+            _run_batch_item(args, path, output_dir)
+            for path, output_dir in zip(paths, output_dirs)
+        ]
+
+    for result in results:
+        stats.stages.append(
+            StageStats(
+                name=os.path.basename(result["output_dir"]),
+                wall_seconds=result["wall_seconds"],
+                cpu_seconds=result["cpu_seconds"],
+                rows_in=result["totals"].rows,
+                rows_out=result["totals"].students,
+            )
+        )
+
+    write_batch_summary(results, args.output_dir, dry_run=args.dry_run)
+    return 0 if all(result["exit_code"] == 0 for result in results) else 1
+
+
+def write_batch_summary(
+    results: List[Dict[str, Any]],
+    output_dir: str,
+    dry_run: bool = False,
+) -> str:
+    """Generate the roll-up summary for a batch run.
+
+    Args:
+        results: One entry per input with ``input``, ``output_dir``,
+            ``exit_code`` and ``totals`` (a RunTotals).
+        output_dir: Directory for BATCH_SUMMARY.txt.
+        dry_run: If True, do not write files.
+
+    Returns:
+        The summary text.
+    """
+    failed = [result for result in results if result["exit_code"] != 0]
+
+    def total(key: str) -> int:
+        return sum(getattr(result["totals"], key) for result in results)
+
+    summary_lines: List[str] = []
+    summary_lines.append("\n" + "=" * 70)
+    summary_lines.append("BATCH PROCESSING SUMMARY")
+    summary_lines.append("=" * 70)
+    summary_lines.append(f"\nExports Processed: {len(results) - len(failed)}")
+    summary_lines.append(f"Exports Failed: {len(failed)}")
+    summary_lines.append(f"Total Rows: {total('rows')}")
+    summary_lines.append(f"Total Students: {total('students')}")
+    summary_lines.append(f"Total Rejected Rows: {total('rejected')}")
+    if not dry_run:
+        summary_lines.append(f"Files Written: {total('files_written')}")
+    summary_lines.append(f"\nOutput Directory: {os.path.abspath(output_dir)}")
+
+    summary_lines.append("\n" + "-" * 70)
+    summary_lines.append("PER-EXPORT BREAKDOWN")
+    summary_lines.append("-" * 70)
+    for result in results:
+        totals = result["totals"]
+        status = "OK" if result["exit_code"] == 0 else "FAILED"
+        summary_lines.append(f"\n{result['input']} [{status}]")
+        summary_lines.append(f"  Output: {result['output_dir']}")
+        summary_lines.append(f"  Rows: {totals.rows}")
+        summary_lines.append(f"  Students: {totals.students}")
+        summary_lines.append(f"  Rejected Rows: {totals.rejected}")
+
+    summary_lines.append("\n" + "=" * 70)
+
+    summary_text = "\n".join(summary_lines)
+    logger.info(summary_text)
+
+    if not dry_run:
+        summary_file = os.path.join(output_dir, "BATCH_SUMMARY.txt")
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            with open(summary_file, "w", encoding="utf-8") as f:
+                f.write(summary_text)
+            logger.info(f"\nBatch summary saved to: {summary_file}")
+        except OSError as exc:
+            logger.error(f"Failed to write batch summary: {exc}")
+
+    return summary_text
+
+
 if __name__ == "__main__":
     sys.exit(main())
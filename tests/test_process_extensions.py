@@ -1,8 +1,19 @@
 """Tests for the process_extensions module."""
 
+import asyncio
 import csv
+import dataclasses
 import io
+import itertools
+import json
+import logging
+import os
+import pickle
+import subprocess
+import sys
 import textwrap
+import threading
+import time
 from pathlib import Path
 from unittest import mock
 
@@ -10,21 +21,39 @@ import pytest
 
 import process_extensions
 from process_extensions import (
+    AssignmentIndex,
     ColumnConfig,
     ExtensionRecord,
+    MappedLines,
     ParseError,
+    PipelineStats,
+    RecordBatch,
     TableData,
+    TableRows,
     adjust_dates,
     create_output_files,
     deduplicate_records,
+    deduplicate_records_external,
+    detect_delimiter,
+    format_date,
+    expand_input_paths,
+    generate_summary,
     get_next_sunday,
+    iter_extension_records,
     main,
+    make_server,
+    open_mapped_file,
     parse_date,
     process_extension_data,
+    process_extension_file,
+    process_extensions_async,
+    process_incremental,
     read_from_clipboard,
     read_from_file,
     read_from_stdin,
     sanitize_filename,
+    sniff_delimiter,
+    watch_input,
     write_failure_report,
     write_processed_copy,
 )
@@ -43,6 +72,25 @@ def test_parse_date_valid_and_invalid():
     assert parse_date("") is None
 
 
+@pytest.mark.parametrize(
+    "raw",
+    ["01/15/2024", " 02/29/2024 ", "1/5/2024", "02/30/2024", "0a/15/2024", "01/15/0000"],
+)
+def test_parse_date_fast_path_matches_strptime(raw):
+    """Test that the sliced fast path agrees with datetime.strptime."""
+    assert parse_date(raw) == process_extensions._parse_date_strptime(raw)
+
+
+def test_parse_date_memoizes_repeated_strings():
+    """Test that repeated date strings are served from the cache."""
+    parse_date.cache_clear()
+    first = parse_date("03/04/2024")
+    second = parse_date("03/04/2024")
+
+    assert first is second
+    assert parse_date.cache_info().hits == 1
+
+
 def test_get_next_sunday_advances_and_preserves():
     """Test that get_next_sunday moves to next Sunday or preserves if already Sunday."""
     friday = parse_date("02/02/2024")
@@ -150,11 +198,275 @@ def test_adjust_dates_does_not_mutate_input():
     assert original.due_date is None
 
 
+def _sample_records():
+    return [
+        ExtensionRecord(
+            email="a@example.com",
+            name="Alice",
+            assignment="HW1",
+            requested_date=parse_date("02/01/2024"),
+            row_num=2,
+        ),
+        ExtensionRecord(
+            email="b@example.com",
+            name="Bob",
+            assignment="HW1",
+            requested_date=parse_date("02/03/2024"),
+            row_num=3,
+        ),
+        ExtensionRecord(
+            email="a@example.com",
+            name="Alice",
+            assignment="HW1",
+            requested_date=parse_date("02/05/2024"),
+            row_num=4,
+        ),
+        ExtensionRecord(
+            email="a@example.com",
+            name="Alice",
+            assignment="HW2",
+            requested_date=parse_date("02/04/2024"),
+            row_num=5,
+        ),
+    ]
+
+
+def test_extension_record_has_no_instance_dict():
+    """Test that ExtensionRecord is slotted."""
+    record = _sample_records()[0]
+
+    assert not hasattr(record, "__dict__")
+
+
+def test_slotted_classes_remain_dataclasses():
+    """Test that the slotted record and error types keep the dataclass API."""
+    record = _sample_records()[0]
+    error = ParseError(message="Missing fields", row=2, fields=["a", "", "HW1"])
+
+    assert dataclasses.replace(record, row_num=9).row_num == 9
+    assert dataclasses.asdict(record)["email"] == record.email
+    assert [f.name for f in dataclasses.fields(ParseError)] == ["message", "row", "line"]
+    assert dataclasses.asdict(error) == {"message": "Missing fields", "row": 2, "line": "a\t\tHW1"}
+    assert dataclasses.replace(error, row=3) == ParseError("Missing fields", 3, "a\t\tHW1")
+    assert not hasattr(error, "__dict__")
+
+
+def test_record_batch_round_trips_records():
+    """Test that a RecordBatch materializes the records it was built from."""
+    records = adjust_dates(_sample_records())
+    batch = RecordBatch.from_records(records)
+
+    assert len(batch) == len(records)
+    assert list(batch) == records
+    assert batch.assignments[0] is batch.assignments[1]
+
+
+def test_record_batch_pipeline_matches_record_lists():
+    """Test that deduplicate_records and adjust_dates accept a RecordBatch."""
+    records = _sample_records()
+    batch = RecordBatch.from_records(records)
+
+    batch_result = adjust_dates(deduplicate_records(batch))
+    list_result = adjust_dates(deduplicate_records(records))
+
+    assert isinstance(batch_result, RecordBatch)
+    assert list(batch_result) == list_result
+
+
+def _random_records(count, seed=0):
+    import random
+    from datetime import timedelta
+
+    rng = random.Random(seed)
+    start = parse_date("01/01/2024")
+    return [
+        ExtensionRecord(
+            email=f"s{rng.randrange(40)}@example.com",
+            name="Student",
+            assignment=f"HW{rng.randrange(5)}",
+            requested_date=start + timedelta(days=rng.randrange(30)),
+            row_num=row,
+        )
+        for row in range(2, count + 2)
+    ]
+
+
+@pytest.mark.parametrize("as_batch", [False, True])
+def test_numpy_engine_matches_python_engine(as_batch):
+    """Test that the NumPy engine reproduces the pure-Python results."""
+    pytest.importorskip("numpy")
+    records = _random_records(500)
+    if as_batch:
+        records = RecordBatch.from_records(records)
+
+    python_result = adjust_dates(
+        deduplicate_records(records, engine="python"), engine="python"
+    )
+    numpy_result = adjust_dates(
+        deduplicate_records(records, engine="numpy"), engine="numpy"
+    )
+
+    assert list(numpy_result) == list(python_result)
+
+
+def test_numpy_engine_falls_back_without_numpy(monkeypatch):
+    """Test that engine='numpy' uses the pure-Python path when NumPy is missing."""
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    records = _random_records(50)
+
+    assert deduplicate_records(records, engine="numpy") == deduplicate_records(
+        records, engine="python"
+    )
+    assert adjust_dates(records, engine="numpy") == adjust_dates(
+        records, engine="python"
+    )
+
+
+@pytest.mark.parametrize("as_batch", [False, True])
+def test_auto_engine_stays_on_python_for_large_inputs(monkeypatch, as_batch):
+    """Test engine='auto' (and index=) never takes the slower NumPy path."""
+    selected = []
+    real_numpy_for = process_extensions._numpy_for
+
+    def numpy_for(engine):
+        np = real_numpy_for(engine)
+        selected.append(np is not None)
+        return np
+
+    monkeypatch.setattr(process_extensions, "_numpy_for", numpy_for)
+    records = _random_records(20_000, seed=5)
+    if as_batch:
+        records = RecordBatch.from_records(records)
+
+    deduped = deduplicate_records(records, engine="auto")
+    adjust_dates(deduped, engine="auto")
+    deduplicate_records(records, engine="numpy", index=AssignmentIndex())
+
+    assert not any(selected)
+
+
+def test_deduplicate_records_external_spills_and_preserves_order(tmp_path):
+    """Test that the spill-to-disk dedupe matches the in-memory result."""
+    records = _random_records(300, seed=3)
+
+    deduped = list(
+        deduplicate_records_external(
+            records, memory_budget=50, partitions=4, temp_dir=str(tmp_path)
+        )
+    )
+
+    assert deduped == deduplicate_records(records)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_assignment_index_matches_sorted_dedupe():
+    """Test the index dedupes like deduplicate_records and keeps email order."""
+    records = _random_records(300, seed=4)
+    index = AssignmentIndex()
+
+    deduped = deduplicate_records(records, engine="python", index=index)
+
+    expected = sorted(
+        deduplicate_records(records), key=lambda r: (r.assignment, r.email)
+    )
+    assert deduped == expected
+    assert index.records() == expected
+    assert len(index) == len(expected)
+
+
+def test_assignment_index_merges_new_emails_without_resorting_existing():
+    """Test incremental adds merge into the existing email order."""
+    start = parse_date("01/01/2024")
+    index = AssignmentIndex(
+        ExtensionRecord(f"s{n:02d}@example.com", "S", "HW1", start, n) for n in (1, 3, 5)
+    )
+    assert [r.email for r in index.group("HW1")] == [
+        "s01@example.com", "s03@example.com", "s05@example.com"
+    ]
+
+    assert index.add(ExtensionRecord("s04@example.com", "S", "HW1", start, 10))
+    assert index.add(ExtensionRecord("s00@example.com", "S", "HW1", start, 11))
+    assert not index.add(ExtensionRecord("s03@example.com", "Late", "HW1", start, 12))
+    later = parse_date("01/02/2024")
+    assert index.add(ExtensionRecord("s05@example.com", "New", "HW1", later, 13))
+
+    group = index.group("HW1")
+    assert [r.email for r in group] == [
+        "s00@example.com", "s01@example.com", "s03@example.com",
+        "s04@example.com", "s05@example.com",
+    ]
+    assert group[2].name == "S"
+    assert group[4].name == "New"
+    assert index.group("HW2") == []
+
+
+def test_create_output_files_accepts_record_batch(tmp_path):
+    """Test that create_output_files writes the same files for a RecordBatch."""
+    records = adjust_dates(deduplicate_records(_sample_records()))
+
+    list_info, _ = create_output_files(records, output_dir=tmp_path / "list")
+    batch_info, _ = create_output_files(
+        RecordBatch.from_records(records), output_dir=tmp_path / "batch"
+    )
+
+    assert batch_info == list_info
+    for info in list_info:
+        assert (tmp_path / "batch" / info["filename"]).read_bytes() == (
+            tmp_path / "list" / info["filename"]
+        ).read_bytes()
+
+
 # ---------------------------------------------------------------------------
 # Data Processing Tests
 # ---------------------------------------------------------------------------
 
 
+def test_sniff_delimiter_ignores_quoted_free_text():
+    """Test that commas and newlines inside quoted answers are not counted."""
+    prefix = (
+        b"\xef\xbb\xbfEmail\tName\tAssignment\tDate\n"
+        b'a@example.com\t"Lee, Alex"\t"HW1, part 2\nsee notes"\t01/30/2024\n'
+        b'b@example.com\tBo\t"He said ""late, sorry"""\t01/31/2024\n'
+        b"c@example.com\tCy\tHW1\t01/3"
+    )
+
+    assert sniff_delimiter(prefix) == ("\t", 1.0)
+    assert sniff_delimiter(b"Email,Name,Assignment,Date") == (",", 1.0)
+
+
+def test_detect_delimiter_falls_back_to_sniffer_when_ambiguous():
+    """Test that csv.Sniffer only runs when the byte counts are ambiguous."""
+    clear = ["Email,Name,Assignment,Date", "a@example.com,Alice,HW1,01/30/2024"]
+    ambiguous = ["Email,Name\tAssignment", "a,b\tc", "d,e\tf"]
+
+    with mock.patch("csv.Sniffer") as sniffer:
+        # The first-line count alone would pick ","
+        sniffer.return_value.sniff.return_value.delimiter = "\t"
+        assert detect_delimiter(clear) == ","
+        sniffer.assert_not_called()
+
+        assert sniff_delimiter(b"\n".join(line.encode() for line in ambiguous))[1] == 0
+        assert detect_delimiter(ambiguous) == "\t"
+        sniffer.return_value.sniff.assert_called_once_with(
+            "\n".join(ambiguous), delimiters=",\t"
+        )
+
+
+def test_detect_delimiter_samples_bytes_and_lines_alike():
+    """Test that raw bytes with blank lines and the non-blank lines agree."""
+    ambiguous = ["Email,Name\tAssignment", "a,b\tc", "d,e\tf"]
+    raw = ("\r\n\r\n".join(ambiguous) + "\r\n").encode("utf-8")
+
+    with mock.patch("csv.Sniffer") as sniffer:
+        sniffer.return_value.sniff.return_value.delimiter = "\t"
+        from_bytes = detect_delimiter(raw)
+        from_lines = detect_delimiter(ambiguous)
+
+    assert from_bytes == from_lines == "\t"
+    first, second = sniffer.return_value.sniff.call_args_list
+    assert first == second
+
+
 def test_process_extension_data_collects_errors_for_missing_columns():
     """Test that missing required columns are reported as errors."""
     data = textwrap.dedent(
@@ -201,6 +513,35 @@ def test_process_extension_data_handles_csv_and_done_column(tmp_path):
     assert len(table.rows) == 2
 
 
+def test_table_rows_round_trips_ragged_rows():
+    """Test that TableRows stores rows column-wise and replays them unchanged."""
+    rows = TableRows()
+    rows.add(2, ["a", "b", "c"])
+    rows.add(3, ["d", "e", "f", "extra"])
+    rows.add(5, ["g"])
+
+    other = TableRows()
+    other.extend(rows, row_offset=10)
+
+    assert len(rows) == 3
+    assert list(rows.items()) == [(2, ["a", "b", "c"]), (3, ["d", "e", "f", "extra"]), (5, ["g"])]
+    assert [row_num for row_num, _ in other.items()] == [12, 13, 15]
+
+
+def test_table_data_rows_keep_list_of_dicts_interface():
+    """Test that TableData.rows still reads and appends like a list of dicts."""
+    table = TableData(header=["a", "b"], rows=[{"row_num": 2, "fields": ["x", "y"]}])
+    table.rows.append({"row_num": 3, "fields": ["z", "w"]})
+
+    assert isinstance(table.rows, TableRows)
+    assert table.rows == [
+        {"row_num": 2, "fields": ["x", "y"]},
+        {"row_num": 3, "fields": ["z", "w"]},
+    ]
+    assert table.rows[-1]["fields"] == ["z", "w"]
+    assert [row["row_num"] for row in table.rows] == [2, 3]
+
+
 def test_process_extension_data_handles_bom_and_spaced_filename(tmp_path):
     """Test that BOM (byte order mark) in headers is handled correctly."""
     target = tmp_path / "COMM 495 - Project Management F2025.csv"
@@ -264,6 +605,211 @@ def test_process_extension_data_returns_extension_records():
     assert records[0].name == "Alice"
 
 
+def test_iter_extension_records_streams_records_and_errors():
+    """Test that iter_extension_records yields records and errors in row order."""
+    data = textwrap.dedent(
+        """
+        Email,Name,Which assignment due date do you want to change?,What would you like to new date to be change too?
+        a@example.com,Alice,HW1,01/30/2024
+        b@example.com,Bob,HW1,not-a-date
+        """
+    ).strip().split("\n")
+
+    items = list(iter_extension_records(data))
+
+    assert isinstance(items[0], ExtensionRecord)
+    assert items[0].row_num == 2
+    assert isinstance(items[1], ParseError)
+    assert items[1].row == 3
+
+
+def test_iter_extension_records_consumes_input_lazily():
+    """Test that iter_extension_records does not read the whole input up front."""
+    header = (
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?"
+    )
+
+    def endless_export():
+        yield header
+        row = 0
+        while True:
+            row += 1
+            yield f"s{row}@example.com,Student {row},HW1,01/30/2024"
+
+    first = list(itertools.islice(iter_extension_records(endless_export()), 3))
+
+    assert [record.email for record in first] == [
+        "s1@example.com",
+        "s2@example.com",
+        "s3@example.com",
+    ]
+
+
+def test_iter_extension_records_streams_in_constant_memory():
+    """Test that streaming distinct rows does not keep a symbol table."""
+    import tracemalloc
+
+    header = (
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?"
+    )
+
+    def export(rows):
+        yield header
+        for row in range(rows):
+            yield f"s{row}@example.com,Student {row},HW{row},01/30/2024"
+
+    peaks = []
+    for rows in (2_000, 20_000):
+        tracemalloc.start()
+        for _ in iter_extension_records(export(rows)):
+            pass
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    # Interning every row would grow the peak roughly tenfold
+    assert peaks[1] < peaks[0] * 2
+
+
+def test_iter_extension_records_reports_missing_columns():
+    """Test that header problems are reported as a single ParseError."""
+    items = list(iter_extension_records(["Email,Name", "a@example.com,Alice"]))
+
+    assert len(items) == 1
+    assert isinstance(items[0], ParseError)
+    assert items[0].row is None
+    assert "Missing required columns" in items[0].message
+
+
+def test_process_extension_file_parallel_matches_serial(tmp_path):
+    """Test that --jobs parsing merges chunks back in the original order."""
+    lines = [
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?,DONE?"
+    ]
+    for i in range(60):
+        name = '"Multi\nLine, Name"' if i % 7 == 0 else f"Student {i}"
+        date = "13/45/2024" if i % 11 == 0 else "01/30/2024"
+        done = "*" if i % 13 == 0 else ""
+        lines.append(f"s{i % 20}@example.com,{name},HW{i % 3},{date},{done}")
+        if i % 17 == 0:
+            lines.append("")
+    source = tmp_path / "export.csv"
+    source.write_text("\r\n".join(lines), encoding="utf-8-sig")
+
+    serial = process_extension_file(source)
+    parallel = process_extension_file(source, jobs=2, chunk_size=200)
+
+    assert parallel[0] == serial[0]
+    assert parallel[1] == serial[1]
+    assert parallel[2] == serial[2]
+    assert any(record.name == "MultiLine, Name" for record in parallel[0])
+
+
+def test_process_extension_file_parallel_ignores_stray_quotes(tmp_path):
+    """Test that a literal quote in an unquoted field does not move chunk boundaries."""
+    lines = [
+        "Email\tName\tWhich assignment due date do you want to change?\t"
+        "What would you like to new date to be change too?"
+    ]
+    for i in range(80):
+        name = {5: 'Pat O"Brien', 40: '"Multi\nLine Name"'}.get(i, f"Student {i}")
+        lines.append(f"s{i}@example.com\t{name}\tHW1\t01/30/2024")
+    lines.append("z@example.com\tZed\tHW2\t01/30/2024")
+    source = tmp_path / "export.tsv"
+    source.write_text("\n".join(lines), encoding="utf-8")
+
+    serial = process_extension_file(source)
+    parallel = process_extension_file(source, jobs=2, chunk_size=64)
+
+    assert len(serial[0]) == 81 and serial[1] == []
+    assert parallel[0] == serial[0]
+    assert parallel[1] == serial[1]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_extension_file_interns_repeated_values(tmp_path, jobs):
+    """Test that repeated assignments and emails share one string object."""
+    lines = [
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?,DONE?"
+    ]
+    for i in range(40):
+        assignment = " Week 7 Lab Report " if i % 2 else "Week 7 Lab Report"
+        lines.append(f"s{i % 4}@example.com,Student {i % 4},{assignment},01/30/2024,")
+    source = tmp_path / "export.csv"
+    source.write_text("\n".join(lines), encoding="utf-8")
+
+    records, _, table = process_extension_file(source, jobs=jobs, chunk_size=200)
+
+    assert len({id(record.assignment) for record in records}) == 1
+    assert len({id(record.email) for record in records}) == 4
+    assert len({id(record.name) for record in records}) == 4
+    emails = {id(fields[0]) for _, fields in table.rows.items()}
+    assert emails == {id(record.email) for record in records}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_extension_file_caps_error_lines(tmp_path, jobs):
+    """Test that only the first max_error_lines errors keep their line."""
+    lines = [
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?"
+    ]
+    for i in range(30):
+        lines.append(f"s{i}@example.com,Student {i},HW1,not a date")
+    source = tmp_path / "export.csv"
+    source.write_text("\n".join(lines), encoding="utf-8")
+
+    _, errors, _ = process_extension_file(
+        source, jobs=jobs, chunk_size=200, max_error_lines=5
+    )
+
+    assert len(errors) == 30
+    assert [error.row for error in errors] == list(range(2, 32))
+    assert [error.line for error in errors[:5]] == [
+        f"s{i}@example.com\tStudent {i}\tHW1\tnot a date" for i in range(5)
+    ]
+    assert all(error.line is None for error in errors[5:])
+
+
+def test_parse_error_rebase_shifts_row_and_drops_line():
+    """Test ParseError.rebase and has_line."""
+    error = ParseError(message="bad", row=3, fields=["a", "b"])
+    error.rebase(10)
+    assert (error.row, error.line, error.has_line) == (13, "a\tb", True)
+
+    error.rebase(-1, keep_line=False)
+    assert (error.row, error.line, error.has_line) == (12, None, False)
+
+    header_error = ParseError(message="No header row found")
+    header_error.rebase(5)
+    assert header_error.row is None
+
+
+@pytest.mark.parametrize("value", ["-1", "x"])
+def test_parse_arguments_rejects_invalid_max_error_lines(value, capsys):
+    """Test --max-error-lines only takes non-negative integers."""
+    with pytest.raises(SystemExit):
+        process_extensions.parse_arguments(["--max-error-lines", value])
+
+    assert "--max-error-lines" in capsys.readouterr().err
+    assert process_extensions.parse_arguments(["--max-error-lines", "0"]).max_error_lines == 0
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "nan", "x"])
+def test_parse_arguments_rejects_invalid_watch_interval(value, capsys):
+    """Test --watch-interval only takes positive numbers, so watch cannot spin."""
+    with pytest.raises(SystemExit):
+        process_extensions.parse_arguments(["--watch-interval", value])
+
+    assert "--watch-interval" in capsys.readouterr().err
+    assert process_extensions.parse_arguments(["--watch-interval", "0.5"]).watch_interval == 0.5
+    with pytest.raises(ValueError, match="interval"):
+        process_extensions.watch_input("missing.csv", lambda: None, interval=0)
+
+
 # ---------------------------------------------------------------------------
 # Output File Tests
 # ---------------------------------------------------------------------------
@@ -398,6 +944,174 @@ def test_create_output_files_dry_run(tmp_path):
     assert not (tmp_path / "output").exists()
 
 
+def test_create_output_files_skips_unchanged_files(tmp_path):
+    """Test that rerunning with identical records leaves files untouched."""
+    records = adjust_dates(deduplicate_records(_sample_records()))
+
+    first, _ = create_output_files(records, output_dir=tmp_path)
+    assert all(info["written"] for info in first)
+    hw2 = tmp_path / "hw2_extensions.csv"
+    written_at = hw2.stat().st_mtime_ns
+
+    changed = [
+        record.with_adjusted_date(parse_date("03/03/2024"))
+        if record.assignment == "HW1"
+        else record
+        for record in records
+    ]
+    second, io_errors = create_output_files(changed, output_dir=tmp_path)
+
+    assert not io_errors
+    assert {info["assignment"]: info["written"] for info in second} == {
+        "HW1": True,
+        "HW2": False,
+    }
+    assert hw2.stat().st_mtime_ns == written_at
+
+    hw2.unlink()
+    third, _ = create_output_files(changed, output_dir=tmp_path)
+    assert {info["assignment"]: info["written"] for info in third} == {
+        "HW1": False,
+        "HW2": True,
+    }
+
+
+def test_create_output_files_restores_edited_files(tmp_path):
+    """Test that a same-size edit to an output file is not mistaken for unchanged."""
+    records = adjust_dates(deduplicate_records(_sample_records()))
+    create_output_files(records, output_dir=tmp_path)
+    hw2 = tmp_path / "hw2_extensions.csv"
+    original = hw2.read_bytes()
+    hw2.write_bytes(original.replace(b"@", b"#"))
+    os.utime(hw2, ns=(0, 0))
+
+    second, _ = create_output_files(records, output_dir=tmp_path)
+
+    assert {info["assignment"]: info["written"] for info in second} == {
+        "HW1": False,
+        "HW2": True,
+    }
+    assert hw2.read_bytes() == original
+
+
+def test_create_output_files_renders_new_files_once(tmp_path):
+    """Test new or edited files are hashed while written, not rendered twice."""
+    import hashlib
+
+    records = adjust_dates(deduplicate_records(_sample_records()))
+    rendered = []
+    assignment_rows = process_extensions._assignment_rows
+
+    def counting_rows(rows):
+        rendered.append(1)
+        return assignment_rows(rows)
+
+    with mock.patch.object(process_extensions, "_assignment_rows", counting_rows):
+        first, _ = create_output_files(records, output_dir=tmp_path)
+        assert len(rendered) == len(first) == 2
+
+        hw2 = tmp_path / "hw2_extensions.csv"
+        os.utime(hw2, ns=(0, 0))
+        rendered.clear()
+        second, _ = create_output_files(records, output_dir=tmp_path)
+
+    # HW1 is hashed to confirm it is unchanged; HW2 is only written
+    assert len(rendered) == 2
+    assert [info["written"] for info in second] == [False, True]
+    manifest = json.loads((tmp_path / process_extensions.MANIFEST_FILENAME).read_text())
+    for name, entry in manifest.items():
+        data = (tmp_path / name).read_bytes()
+        assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+        assert entry["size"] == len(data)
+
+
+def test_generate_summary_omits_write_counts_without_written_key(tmp_path):
+    """Test that file_info without "written" does not report 0 files written."""
+    file_info = [
+        {
+            "assignment": "HW1",
+            "filename": "hw1_extensions.csv",
+            "num_students": 1,
+            "earliest_date": "02/04/2024",
+            "latest_date": "02/04/2024",
+        }
+    ]
+
+    summary = generate_summary([], file_info, [], str(tmp_path))
+
+    assert "Files Written" not in summary
+    assert "Files Unchanged" not in summary
+
+
+def test_create_output_files_colliding_filenames_keep_last(tmp_path, caplog):
+    """Test that assignments sharing a filename are written in order, even pooled."""
+    records = [
+        ExtensionRecord(f"s{i}@example.com", f"S{i}", assignment, parse_date("01/30/2024"), i)
+        for i, assignment in enumerate(["HW 1", "HW-1", "HW 2", "HW 3"] * 5)
+    ]
+    records = adjust_dates(records)
+
+    serial, _ = create_output_files(list(records), output_dir=tmp_path / "serial")
+    pooled, _ = create_output_files(
+        list(records), output_dir=tmp_path / "pooled", write_workers=4
+    )
+
+    assert pooled == serial
+    collided = (tmp_path / "pooled" / "hw_1_extensions.csv").read_text(encoding="utf-8-sig")
+    assert "HW-1" in collided and "HW 1" not in collided
+    assert collided == (tmp_path / "serial" / "hw_1_extensions.csv").read_text(
+        encoding="utf-8-sig"
+    )
+    assert "'HW 1', 'HW-1' all map to 'hw_1_extensions.csv'" in caplog.text
+
+
+def test_create_output_files_thread_pool_is_deterministic(tmp_path):
+    """Test that --write-workers keeps file_info and io_errors ordering."""
+    records = [
+        record.with_adjusted_date(record.requested_date)
+        for record in _random_records(200, seed=5)
+    ]
+    (tmp_path / "pooled").mkdir()
+    # Directories in place of files make those writes fail
+    for blocked in ("hw1_extensions.csv", "hw3_extensions.csv"):
+        (tmp_path / "serial" / blocked).mkdir(parents=True)
+        (tmp_path / "pooled" / blocked).mkdir()
+
+    serial = create_output_files(records, output_dir=tmp_path / "serial")
+    pooled = create_output_files(
+        records, output_dir=tmp_path / "pooled", write_workers=4
+    )
+
+    assert [info["assignment"] for info in pooled[0]] == ["HW0", "HW2", "HW4"]
+    assert pooled[0] == serial[0]
+    assert [error.replace("pooled", "serial") for error in pooled[1]] == serial[1]
+    assert len(pooled[1]) == 2
+    for info in serial[0]:
+        assert (tmp_path / "pooled" / info["filename"]).read_bytes() == (
+            tmp_path / "serial" / info["filename"]
+        ).read_bytes()
+
+
+def test_generate_summary_reports_written_and_skipped_counts(tmp_path):
+    """Test that the summary reports how many files were written or skipped."""
+    file_info = [
+        {
+            "assignment": assignment,
+            "filename": f"{assignment.lower()}_extensions.csv",
+            "num_students": 0,
+            "earliest_date": "N/A",
+            "latest_date": "N/A",
+            "written": written,
+        }
+        for assignment, written in (("HW1", True), ("HW2", False))
+    ]
+
+    summary = generate_summary([], file_info, [], str(tmp_path))
+
+    assert "Files Written: 1" in summary
+    assert "Files Unchanged (skipped): 1" in summary
+
+
 def test_write_failure_report_trims_trailing_newline(tmp_path):
     """Test that failure report does not have trailing newline."""
     errors = [
@@ -411,6 +1125,19 @@ def test_write_failure_report_trims_trailing_newline(tmp_path):
     assert not text.endswith("\n")
 
 
+def test_write_failure_report_streams_multiline_fields(tmp_path):
+    """Test that streamed rows keep embedded newlines but no trailing one."""
+    errors = [
+        ParseError(row=2, message="Missing fields", line="a\nb"),
+        ParseError(row=3, message="Invalid date format", line="c\n"),
+    ]
+
+    failures_path = write_failure_report(errors, str(tmp_path))
+
+    text = Path(failures_path).read_text(encoding="utf-8")
+    assert text == 'Row,Message,Line\n2,Missing fields,"a\nb"\n3,Invalid date format,"c\n"'
+
+
 def test_write_failure_report_dry_run(tmp_path):
     """Test that dry_run mode does not write failure report."""
     errors = [
@@ -463,6 +1190,46 @@ def test_read_from_file_reports_all_attempts(capsys, tmp_path, monkeypatch):
     assert result is None
 
 
+def test_mapped_lines_strips_bom_and_line_endings(tmp_path):
+    """Test that MappedLines decodes lazily, skipping the BOM and CRLF endings."""
+    data_file = tmp_path / "export.csv"
+    data_file.write_bytes("\ufeffEmail,Name\r\nb@example.com,Zoë\r\n\nlast".encode("utf-8"))
+
+    with MappedLines(data_file) as source:
+        lines = list(source)
+
+    assert lines == ["Email,Name", "b@example.com,Zoë", "", "last"]
+
+
+def test_open_mapped_file_handles_empty_file(tmp_path):
+    """Test that an empty file yields no lines instead of failing to map."""
+    data_file = tmp_path / "empty.csv"
+    data_file.write_bytes(b"")
+
+    source = open_mapped_file(str(data_file))
+    assert source is not None
+    with source:
+        assert list(source) == []
+
+
+def test_open_mapped_file_feeds_parser(tmp_path):
+    """Test that the mapped source plugs straight into process_extension_data."""
+    data_file = tmp_path / "export.csv"
+    data_file.write_text(
+        "\ufeffEmail,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?\n"
+        "a@example.com,Alice,HW1,01/30/2024\n",
+        encoding="utf-8",
+    )
+
+    with open_mapped_file(str(data_file)) as source:
+        records, errors, table = process_extension_data(source)
+
+    assert not errors
+    assert [record.email for record in records] == ["a@example.com"]
+    assert table.col_map["Email"] == 0
+
+
 def test_read_from_clipboard_returns_none_without_pyperclip(monkeypatch):
     """Test that read_from_clipboard returns None when pyperclip is not available."""
     # Temporarily make pyperclip unavailable
@@ -536,6 +1303,189 @@ def test_main_with_input_file(tmp_path):
     assert (output_dir / "SUMMARY.txt").exists()
 
 
+def test_main_with_stats_json(tmp_path, caplog):
+    """Test --stats-json logs the stage table and writes stats.json."""
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?\n"
+        "a@example.com,Alice,HW1,01/30/2024\n"
+        "a@example.com,Alice,HW1,02/01/2024\n"
+        "bad row\n"
+    )
+    output_dir = tmp_path / "output"
+
+    caplog.set_level(logging.INFO)
+
+    exit_code = main(
+        ["--input-file", str(input_file), "--output-dir", str(output_dir),
+         "--stats-json"]
+    )
+
+    assert exit_code == 0
+    assert "write-outputs" in caplog.text
+    data = json.loads((output_dir / "stats.json").read_text())
+    stages = {stage["name"]: stage for stage in data["stages"]}
+    assert list(stages) == [
+        "read", "parse", "dedupe", "adjust", "write-outputs",
+        "processed-copy", "failures", "summary",
+    ]
+    assert stages["parse"]["rows_in"] == 3
+    assert stages["dedupe"]["rows_in"] == 2
+    assert stages["dedupe"]["rows_out"] == 1
+    assert stages["failures"]["rows_out"] == 1
+    assert stages["parse"]["peak_bytes"] > 0
+
+
+def test_main_populates_programmatic_stats(tmp_path, capsys):
+    """Test main() fills a caller-supplied PipelineStats without printing."""
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?\n"
+        "a@example.com,Alice,HW1,01/30/2024\n"
+    )
+    stats = PipelineStats(trace_memory=False)
+
+    exit_code = main(
+        ["--input-file", str(input_file), "--output-dir", str(tmp_path / "out"),
+         "--quiet"],
+        stats=stats,
+    )
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == ""
+    assert [stage.name for stage in stats.stages][:2] == ["read", "parse"]
+    assert all(stage.peak_bytes is None for stage in stats.stages)
+    assert "total" in stats.format_table()
+
+
+def test_main_without_stats_keeps_no_stages(tmp_path, caplog):
+    """Test that stages are not timed unless statistics are requested."""
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?\n"
+        "a@example.com,Alice,HW1,01/30/2024\n"
+    )
+
+    with mock.patch.object(process_extensions, "PipelineStats") as stats_class:
+        exit_code = main(
+            ["--input-file", str(input_file), "--output-dir", str(tmp_path / "out"),
+             "--quiet"]
+        )
+
+    assert exit_code == 0
+    stats_class.assert_not_called()
+    assert "Wall (s)" not in caplog.text
+
+
+def test_main_with_profile(tmp_path):
+    """Test --profile writes pstats data and a hot-function report."""
+    import pstats
+
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?\n"
+        "a@example.com,Alice,HW1,01/30/2024\n"
+    )
+    output_dir = tmp_path / "output"
+
+    exit_code = main(
+        ["--input-file", str(input_file), "--output-dir", str(output_dir),
+         "--profile", "run.prof", "--profile-top", "5", "--quiet"]
+    )
+
+    assert exit_code == 0
+    stats = pstats.Stats(str(output_dir / "run.prof"))
+    assert any(func[2] == "_run_pipeline" for func in stats.stats)
+    report = (output_dir / "run.prof.txt").read_text()
+    assert "Top 5 functions by cumulative time" in report
+    assert "_run_pipeline" in report
+
+
+def test_main_with_jobs(tmp_path):
+    """Test main() with --jobs produces the same output files."""
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        textwrap.dedent(
+            """
+            Email,Name,Which assignment due date do you want to change?,What would you like to new date to be change too?
+            a@example.com,Alice,HW1,01/30/2024
+            b@example.com,Bob,HW2,01/31/2024
+            """
+        ).lstrip()
+    )
+
+    outputs = []
+    for jobs in ("1", "2"):
+        output_dir = tmp_path / f"output_{jobs}"
+        exit_code = main(
+            [
+                "--input-file",
+                str(input_file),
+                "--output-dir",
+                str(output_dir),
+                "--jobs",
+                jobs,
+                "--quiet",
+            ]
+        )
+        assert exit_code == 0
+        outputs.append((output_dir / "hw2_extensions.csv").read_bytes())
+
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize("no_adjust", [False, True])
+def test_main_fused_engine_matches_python_engine(tmp_path, no_adjust):
+    """Test --engine fused writes the same files as the multi-pass pipeline."""
+    input_file = tmp_path / "input.csv"
+    rows = [
+        f"{record.email},{record.name},{record.assignment},"
+        f"{format_date(record.requested_date)},"
+        for record in _random_records(400)
+    ]
+    rows[10] = "x@example.com,X,HW9,13/45/2024,"
+    rows[20] = "y@example.com,Y,HW8,01/05/2024,*"
+    rows[30] = ""
+    input_file.write_text(
+        "Email,Name,Which assignment due date do you want to change?,"
+        "What would you like to new date to be change too?,DONE?\n"
+        + "\n".join(rows)
+        + "\n"
+    )
+
+    outputs = []
+    for engine in ("python", "numpy", "fused"):
+        output_dir = tmp_path / engine
+        args = ["--input-file", str(input_file), "--output-dir", str(output_dir),
+                "--engine", engine, "--quiet"]
+        assert main(args + (["--no-adjust"] if no_adjust else [])) == 0
+        files = {
+            path.name: path.read_bytes().replace(bytes(output_dir), b"OUTPUT")
+            for path in output_dir.iterdir()
+            if path.name != process_extensions.MANIFEST_FILENAME
+        }
+        files["processed"] = (tmp_path / "input_PROCESSED.csv").read_bytes()
+        outputs.append(files)
+
+    assert "hw8_extensions.csv" in outputs[0]
+    assert "failures.csv" in outputs[0]
+    assert outputs[0] == outputs[1] == outputs[2]
+
+
+@pytest.mark.parametrize("flags", [["--jobs", "2"], ["--incremental"], ["--watch"]])
+def test_parse_arguments_rejects_fused_engine_with_incompatible_flags(flags, capsys):
+    """Test --engine fused is refused instead of silently ignoring flags."""
+    with pytest.raises(SystemExit) as excinfo:
+        process_extensions.parse_arguments(["--engine", "fused", *flags])
+
+    assert excinfo.value.code == 2
+    assert "--engine fused cannot be combined" in capsys.readouterr().err
+
+
 def test_main_with_dry_run(tmp_path):
     """Test main() with --dry-run flag."""
     input_file = tmp_path / "input.csv"
@@ -602,6 +1552,30 @@ def test_main_with_no_adjust(tmp_path):
     assert rows[1][3] == "01/30/2024"
 
 
+def test_import_defers_heavy_modules():
+    """Test that importing the module does not load CLI-only dependencies."""
+    root = Path(process_extensions.__file__).parent
+    deferred = (
+        "argparse", "csv", "json", "sqlite3", "mmap", "pickle", "hashlib",
+        "tempfile", "zlib", "heapq", "glob", "tracemalloc", "concurrent.futures",
+        "pathlib", "typing", "asyncio", "http.server", "multiprocessing", "numpy",
+    )
+    check = (
+        "import sys, process_extensions; "
+        f"print(sorted(set({deferred!r}) & set(sys.modules)))"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
 def test_main_with_missing_file(tmp_path, capsys):
     """Test main() with a missing input file."""
     exit_code = main(
@@ -647,6 +1621,509 @@ def test_main_with_invalid_data(tmp_path):
     assert exit_code == 1
 
 
+# ---------------------------------------------------------------------------
+# Incremental Processing Tests
+# ---------------------------------------------------------------------------
+
+INCREMENTAL_HEADER = (
+    "Email,Name,Which assignment due date do you want to change?,"
+    "What would you like to new date to be change too?\n"
+)
+
+
+def _run_main(*args):
+    return main([*args, "--quiet"])
+
+
+def test_process_incremental_parses_only_appended_rows(tmp_path):
+    """Test that a second run only merges the rows appended since the first."""
+    export = tmp_path / "export.csv"
+    state = str(tmp_path / "state.sqlite")
+    export.write_text(
+        INCREMENTAL_HEADER
+        + "a@example.com,Alice,HW1,01/30/2024\n"
+        + "b@example.com,Bob,HW2,01/31/2024\n",
+        encoding="utf-8",
+    )
+
+    first = process_incremental(export, state)
+    assert first.full_rebuild
+    assert first.changed_assignments is None
+
+    with open(export, "a", encoding="utf-8") as f:
+        f.write("a@example.com,Alice,HW1,02/06/2024\nc@example.com,Cy,HW3,bad\n")
+
+    second = process_incremental(export, state)
+    full, full_errors, _ = process_extension_file(export)
+
+    assert not second.full_rebuild
+    assert second.new_rows == 2
+    assert second.changed_assignments == {"HW1", "HW3"}
+    assert second.records == deduplicate_records(full)
+    assert second.errors == full_errors
+    assert second.all_assignments == ["HW1", "HW2", "HW3"]
+
+
+@pytest.mark.parametrize("resume", [False, True])
+def test_process_incremental_leaves_unfinished_rows_for_the_next_run(tmp_path, resume):
+    """Test that a row caught mid-write is parsed once it is complete."""
+    export = tmp_path / "export.csv"
+    state = str(tmp_path / "state.sqlite")
+    export.write_text(
+        INCREMENTAL_HEADER + "a@example.com,Alice,HW1,01/30/2024\n", encoding="utf-8"
+    )
+    if resume:
+        process_incremental(export, state)
+
+    with open(export, "a", encoding="utf-8") as f:
+        f.write('b@example.com,Bob,HW1,03/0')
+    partial = process_incremental(export, state)
+    with open(export, "a", encoding="utf-8") as f:
+        f.write('6/2024\nc@example.com,"Cy\n')
+    quoted = process_incremental(export, state)
+    with open(export, "a", encoding="utf-8") as f:
+        f.write('Smith",HW1,03/07/2024\n')
+    done = process_incremental(export, state)
+
+    full, full_errors, _ = process_extension_file(export)
+    assert partial.full_rebuild is not resume
+    assert partial.new_rows == (0 if resume else 1)
+    assert partial.errors == []
+    assert [record.email for record in quoted.records][-1] == "b@example.com"
+    assert done.records == deduplicate_records(full)
+    assert done.errors == full_errors == []
+
+
+def test_process_incremental_caps_error_lines_across_runs(tmp_path):
+    """Test max_error_lines applies to the errors of every run together."""
+    export = tmp_path / "export.csv"
+    state = str(tmp_path / "state.sqlite")
+    export.write_text(
+        INCREMENTAL_HEADER + "a@example.com,Alice,HW1,bad\nb@example.com,Bob,HW1,bad\n",
+        encoding="utf-8",
+    )
+    first = process_incremental(export, state, max_error_lines=1)
+    with open(export, "a", encoding="utf-8") as f:
+        f.write("c@example.com,Cy,HW1,bad\n")
+    second = process_incremental(export, state, max_error_lines=1)
+    uncapped = process_incremental(export, state)
+
+    expected = process_extension_file(export, max_error_lines=1)[1]
+    assert [error.has_line for error in first.errors] == [True, False]
+    assert not second.full_rebuild
+    assert second.errors == expected
+    assert [error.has_line for error in second.errors] == [True, False, False]
+    assert uncapped.full_rebuild
+    assert all(error.has_line for error in uncapped.errors)
+
+
+def test_process_incremental_rebuilds_when_prefix_changes(tmp_path):
+    """Test that edits to already-processed rows force a full rebuild."""
+    export = tmp_path / "export.csv"
+    state = str(tmp_path / "state.sqlite")
+    export.write_text(INCREMENTAL_HEADER + "a@example.com,Alice,HW1,01/30/2024\n")
+    process_incremental(export, state)
+
+    export.write_text(INCREMENTAL_HEADER + "a@example.com,Alicia,HW1,01/30/2024\n")
+    result = process_incremental(export, state)
+
+    assert result.full_rebuild
+    assert [record.name for record in result.records] == ["Alicia"]
+
+
+def test_main_incremental_rewrites_only_affected_files(tmp_path):
+    """Test that --incremental leaves unaffected assignment CSVs untouched."""
+    export = tmp_path / "export.csv"
+    output_dir = tmp_path / "output"
+    export.write_text(
+        INCREMENTAL_HEADER
+        + "a@example.com,Alice,HW1,01/30/2024\n"
+        + "b@example.com,Bob,HW2,01/31/2024\n"
+    )
+    args = ["--input-file", str(export), "--output-dir", str(output_dir)]
+
+    assert _run_main(*args, "--incremental") == 0
+    hw2 = output_dir / "hw2_extensions.csv"
+    written_at = hw2.stat().st_mtime_ns
+
+    with open(export, "a") as f:
+        f.write("c@example.com,Cy,HW1,02/01/2024\n")
+    assert _run_main(*args, "--incremental") == 0
+
+    assert hw2.stat().st_mtime_ns == written_at
+    incremental_hw1 = (output_dir / "hw1_extensions.csv").read_bytes()
+    assert b"c@example.com" in incremental_hw1
+
+    full_dir = tmp_path / "full"
+    assert _run_main("--input-file", str(export), "--output-dir", str(full_dir)) == 0
+    assert (full_dir / "hw1_extensions.csv").read_bytes() == incremental_hw1
+
+
+def test_main_incremental_honours_max_error_lines(tmp_path):
+    """Test --incremental writes the same capped failures.csv as a full run."""
+    export = tmp_path / "export.csv"
+    export.write_text(
+        INCREMENTAL_HEADER
+        + "a@example.com,Alice,HW1,01/30/2024\n"
+        + "b@example.com,Bob,HW1,bad\n"
+        + "c@example.com,Cy,HW1,worse\n"
+    )
+    outputs = {}
+    for mode in ("full", "incremental"):
+        output_dir = tmp_path / mode
+        flags = ["--incremental"] if mode == "incremental" else []
+        _run_main("--input-file", str(export), "--output-dir", str(output_dir),
+                  "--max-error-lines", "1", *flags)
+        outputs[mode] = (output_dir / "failures.csv").read_bytes()
+
+    assert outputs["incremental"] == outputs["full"]
+    assert outputs["full"].count(b"@example.com") == 1
+
+
+def test_main_incremental_with_empty_file(tmp_path):
+    """Test that --incremental reports empty input like a normal run."""
+    export = tmp_path / "export.csv"
+    export.write_text("")
+
+    assert (
+        _run_main(
+            "--input-file",
+            str(export),
+            "--output-dir",
+            str(tmp_path / "output"),
+            "--incremental",
+        )
+        == 1
+    )
+
+
+def test_watch_input_runs_once_per_settled_change(tmp_path):
+    """Test that the watcher reruns after a change and then stays idle."""
+    export = tmp_path / "export.csv"
+    export.write_text(INCREMENTAL_HEADER)
+    calls = []
+    stop = threading.Event()
+    watcher = threading.Thread(
+        target=watch_input,
+        args=(export, lambda: calls.append(export.read_text())),
+        kwargs={"interval": 0.01, "stop": stop},
+    )
+    watcher.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with open(export, "a") as f:
+            f.write("a@example.com,Alice,HW1,01/30/2024\n")
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+    finally:
+        stop.set()
+        watcher.join()
+
+    assert len(calls) == 2
+    assert "a@example.com" in calls[1]
+
+
+def test_main_watch_processes_appended_rows(tmp_path):
+    """Test that --watch runs the incremental pipeline for each change."""
+    export = tmp_path / "export.csv"
+    export.write_text(INCREMENTAL_HEADER + "a@example.com,Alice,HW1,01/30/2024\n")
+    output_dir = tmp_path / "output"
+
+    def fake_watch(path, on_change, interval):
+        on_change()
+        with open(path, "a") as f:
+            f.write("b@example.com,Bob,HW2,01/31/2024\n")
+        on_change()
+        raise KeyboardInterrupt
+
+    with mock.patch.object(process_extensions, "watch_input", fake_watch):
+        exit_code = _run_main(
+            "--input-file", str(export), "--output-dir", str(output_dir), "--watch"
+        )
+
+    assert exit_code == 0
+    assert (output_dir / process_extensions.STATE_FILENAME).exists()
+    assert b"b@example.com" in (output_dir / "hw2_extensions.csv").read_bytes()
+
+
+def test_run_watch_keeps_args_and_only_the_latest_stages(tmp_path):
+    """Test that watch runs do not mutate args or accumulate stage stats."""
+    export = tmp_path / "export.csv"
+    export.write_text(INCREMENTAL_HEADER + "a@example.com,Alice,HW1,01/30/2024\n")
+    args = process_extensions.parse_arguments(
+        ["--input-file", str(export), "--output-dir", str(tmp_path / "output"), "--quiet"]
+    )
+    stats = process_extensions.PipelineStats(trace_memory=False)
+    with stats.stage("read"):
+        pass
+
+    def fake_watch(path, on_change, interval):
+        for _ in range(3):
+            on_change()
+        raise KeyboardInterrupt
+
+    with mock.patch.object(process_extensions, "watch_input", fake_watch):
+        exit_code = process_extensions._run_watch(args, export, stats)
+
+    names = [stage.name for stage in stats.stages]
+    assert exit_code == 0
+    assert args.incremental is False
+    assert names[0] == "read"
+    assert names.count("parse") == 1
+
+
+# ---------------------------------------------------------------------------
+# Async Pipeline Tests
+# ---------------------------------------------------------------------------
+
+
+async def _byte_chunks(data, size):
+    for start in range(0, len(data), size):
+        await asyncio.sleep(0)
+        yield data[start:start + size]
+
+
+def test_process_extensions_async_matches_cli_output(tmp_path):
+    """Test the async pipeline writes the same files as the CLI."""
+    export = tmp_path / "export.csv"
+    export.write_bytes(
+        (
+            "\ufeff" + INCREMENTAL_HEADER.replace("\n", "\r\n")
+            + "a@example.com,Zoë,HW1,01/30/2024\r\n"
+            + "a@example.com,Zoë,HW1,02/01/2024\r\n"
+            + "b@example.com,Bob,HW2,01/31/2024\r\n"
+            + "bad row"
+        ).encode("utf-8")
+    )
+    assert _run_main("--input-file", str(export), "--output-dir", str(tmp_path / "cli")) == 0
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(export.read_bytes())
+        reader.feed_eof()
+        return await process_extensions_async(
+            reader, str(tmp_path / "async"), chunk_size=5
+        )
+
+    result = asyncio.run(run())
+
+    assert len(result.records) == 2
+    assert len(result.errors) == 1
+    assert result.failures_path is not None
+    for name in ("hw1_extensions.csv", "hw2_extensions.csv", "failures.csv"):
+        assert (tmp_path / "async" / name).read_bytes() == (tmp_path / "cli" / name).read_bytes()
+
+
+def test_process_extensions_async_reports_missing_header(tmp_path):
+    """Test an invalid header returns errors without stalling the reader."""
+    data = b"Foo,Bar\n" + b"x,y\n" * 1000
+
+    result = asyncio.run(
+        process_extensions_async(_byte_chunks(data, 16), str(tmp_path / "out"))
+    )
+
+    assert result.has_header is False
+    assert result.errors
+    assert not (tmp_path / "out").exists()
+
+
+# ---------------------------------------------------------------------------
+# HTTP Service Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def server_url():
+    server = make_server("127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def _request(url, data=None):
+    import urllib.error
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(url, data=data) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_serve_processes_posted_export(server_url):
+    """Test POST /process returns file info, CSV content and errors."""
+    export = (
+        INCREMENTAL_HEADER
+        + "b@example.com,Bob,HW1,01/30/2024\n"
+        + "a@example.com,Alice,HW1,01/31/2024\n"
+        + "a@example.com,Alice,HW1,02/01/2024\n"
+        + "bad row\n"
+    )
+
+    status, result = _request(f"{server_url}/process", export.encode("utf-8"))
+
+    assert status == 200
+    assert result["records"] == 2
+    assert result["assignments"][0]["filename"] == "hw1_extensions.csv"
+    assert result["files"]["hw1_extensions.csv"].splitlines()[1:] == [
+        "a@example.com,Alice,HW1,02/04/2024,a@example.com - Alice - HW1 - 02/04/2024",
+        "b@example.com,Bob,HW1,02/04/2024,b@example.com - Bob - HW1 - 02/04/2024",
+    ]
+    assert result["assignments"][0]["num_students"] == 2
+    assert len(result["errors"]) == 1
+    assert "summary" not in result
+
+    status, result = _request(f"{server_url}/process?adjust=0", export.encode("utf-8"))
+    assert "02/01/2024" in result["files"]["hw1_extensions.csv"]
+
+
+def test_serve_rejects_bad_requests(server_url):
+    """Test the service's health check and error responses."""
+    assert _request(f"{server_url}/health") == (200, {"status": "ok"})
+    assert _request(f"{server_url}/process", b"")[0] == 400
+    assert _request(f"{server_url}/process?engine=gpu", b"x")[0] == 400
+    assert _request(f"{server_url}/other", b"x")[0] == 404
+
+
+def test_serve_rejects_negative_content_length(server_url):
+    """Test that a negative Content-Length is refused instead of read."""
+    import http.client
+
+    host, port = server_url.rsplit("/", 1)[-1].split(":")
+    connection = http.client.HTTPConnection(host, int(port), timeout=5)
+    connection.putrequest("POST", "/process")
+    connection.putheader("Content-Length", "-1")
+    connection.endheaders()
+    response = connection.getresponse()
+
+    assert response.status == 400
+    assert "error" in json.loads(response.read())
+    connection.close()
+
+
+def test_serve_returns_json_500_on_unexpected_error(server_url):
+    """Test that a failure inside process_export becomes a JSON 500."""
+    with mock.patch.object(
+        process_extensions, "process_export", side_effect=RuntimeError("boom")
+    ):
+        status, result = _request(f"{server_url}/process", b"x")
+
+    assert status == 500
+    assert result == {"error": "Internal server error"}
+
+
+# ---------------------------------------------------------------------------
+# Batch Processing Tests
+# ---------------------------------------------------------------------------
+
+
+def _write_section_exports(directory):
+    directory.mkdir()
+    (directory / "Section A.csv").write_text(
+        INCREMENTAL_HEADER + "a@example.com,Alice,HW1,01/30/2024\nbad row\n"
+    )
+    (directory / "section-b.csv").write_text(
+        INCREMENTAL_HEADER
+        + "b@example.com,Bob,HW1,01/31/2024\n"
+        + "c@example.com,Cy,HW2,02/01/2024\n"
+    )
+
+
+def test_expand_input_paths_globs_and_list_file(tmp_path):
+    """Test globs, list files and unmatched patterns."""
+    _write_section_exports(tmp_path / "exports")
+    (tmp_path / "exports" / "section-b_PROCESSED.csv").write_text(INCREMENTAL_HEADER)
+    list_file = tmp_path / "inputs.txt"
+    list_file.write_text("# sections\n\nexports/section-b.csv\nexports/missing.csv\n")
+
+    paths = expand_input_paths([str(tmp_path / "exports" / "*.csv")], str(list_file))
+
+    assert paths == [
+        str(tmp_path / "exports" / "Section A.csv"),
+        str(tmp_path / "exports" / "section-b.csv"),
+        str(tmp_path / "exports" / "missing.csv"),
+    ]
+
+
+@pytest.mark.parametrize("batch_jobs", ["1", "2"])
+def test_main_batch_writes_per_input_outputs_and_rollup(tmp_path, batch_jobs):
+    """Test that each export gets a subdirectory plus a combined summary."""
+    _write_section_exports(tmp_path / "exports")
+    output_dir = tmp_path / "output"
+
+    exit_code = _run_main(
+        "--input-file", str(tmp_path / "exports" / "*.csv"),
+        "--output-dir", str(output_dir),
+        "--batch-jobs", batch_jobs,
+    )
+
+    assert exit_code == 0
+    assert (output_dir / "section_a" / "hw1_extensions.csv").exists()
+    assert (output_dir / "section_a" / "failures.csv").exists()
+    assert (output_dir / "section_b" / "hw2_extensions.csv").exists()
+    rollup = (output_dir / "BATCH_SUMMARY.txt").read_text()
+    assert "Exports Processed: 2" in rollup
+    assert "Total Students: 3" in rollup
+    assert "Total Rejected Rows: 1" in rollup
+
+
+def test_main_batch_reports_failed_inputs(tmp_path):
+    """Test that a missing export fails the batch but not the other inputs."""
+    _write_section_exports(tmp_path / "exports")
+    output_dir = tmp_path / "output"
+
+    exit_code = _run_main(
+        "--input-file",
+        str(tmp_path / "exports" / "section-b.csv"),
+        str(tmp_path / "exports" / "missing.csv"),
+        "--output-dir", str(output_dir),
+    )
+
+    assert exit_code == 1
+    assert (output_dir / "section_b" / "SUMMARY.txt").exists()
+    rollup = (output_dir / "BATCH_SUMMARY.txt").read_text()
+    assert "Exports Failed: 1" in rollup
+    assert "missing.csv [FAILED]" in rollup
+
+
+def test_write_batch_summary_rolls_up_run_totals(tmp_path):
+    """Test that the batch summary adds up each input's RunTotals."""
+    results = [
+        {
+            "input": "a.csv",
+            "output_dir": str(tmp_path / "a"),
+            "exit_code": 0,
+            "totals": process_extensions.RunTotals(
+                rows=5, students=3, rejected=1, files_written=2
+            ),
+        },
+        {
+            "input": "b.csv",
+            "output_dir": str(tmp_path / "b"),
+            "exit_code": 1,
+            "totals": process_extensions.RunTotals(exit_code=1),
+        },
+    ]
+
+    summary = process_extensions.write_batch_summary(results, str(tmp_path))
+
+    assert "Exports Processed: 1" in summary
+    assert "Total Rows: 5" in summary
+    assert "Total Students: 3" in summary
+    assert "Total Rejected Rows: 1" in summary
+    assert "Files Written: 2" in summary
+    assert "b.csv [FAILED]" in summary
+
+
 # ---------------------------------------------------------------------------
 # Dataclass Tests
 # ---------------------------------------------------------------------------
@@ -690,6 +2167,22 @@ def test_parse_error_to_dict():
     assert d["line"] == "a,b,c"
 
 
+def test_parse_error_renders_line_from_fields():
+    """Test that a ParseError built from fields joins them only when read."""
+    fields = ["a@example.com", "Alice", "", "01/30/2024"]
+    error = ParseError(message="Missing fields (Assignment)", row=3, fields=fields)
+
+    assert error.line == "a@example.com\tAlice\t\t01/30/2024"
+    assert error == ParseError(
+        message="Missing fields (Assignment)", row=3, line=error.line
+    )
+    assert pickle.loads(pickle.dumps(error)) == error
+    assert error.to_dict()["line"] == error.line
+
+    error.line = None
+    assert error.to_dict() == {"message": "Missing fields (Assignment)", "row": 3, "line": None}
+
+
 def test_column_config_required():
     """Test ColumnConfig.required property."""
     config = ColumnConfig()